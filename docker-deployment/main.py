@@ -6,6 +6,19 @@ import logging
 import os
 import traceback
 from tabroom_summary import tabroom_summary
+from tabroom_summary.generation_lease import GenerationLease
+from tabroom_summary.pack_results import DEFAULT_PROMPT_TOKEN_BUDGET
+from tabroom_summary.school_prompt_uploader import (
+    PROMPT_FILE_NAMES,
+    SchoolPromptUploader,
+)
+from tabroom_summary.tournament_manifest import (
+    COMPLETE,
+    FAILED,
+    GENERATING,
+    TournamentManifest,
+)
+from tabroom_summary.status_reporter import StatusReporter
 import json
 import string
 
@@ -41,13 +54,82 @@ def handler(event, context):
         percentile_minimum = event.get(
             "percentile_minimum", 0
         )  # experimenting with removing the percentile minimum
-        response, tourn_metadata = tabroom_summary.main(
-            tournament_id=tournament_id,
-            data_bucket=os.getenv("DATA_BUCKET_NAME", DATA_BUCKET),
-            context=event_context,
-            percentile_minimum=percentile_minimum,
-            max_results_to_pass_to_gpt=event.get("max_results_to_pass_to_gpt", 15),
-        )
+        # The manifest tells the website which schools have results and whether generation is still running
+        manifest = TournamentManifest(tournament_id)
+        # In Lambda, each school's prompts are uploaded to S3 as soon as they're generated
+        if running_outside_of_lambda:
+            school_prompt_uploader = None
+            status_reporter = StatusReporter(tournament_id)
+        else:
+            s3_client = boto3.client("s3")
+            bucket_name = os.environ["DATA_BUCKET_NAME"]
+            # Only one run per tournament -- the website and batch processor take the lease before invoking us and pass
+            # their owner ID along, so we adopt their lease rather than competing with it
+            generation_lease = GenerationLease(
+                s3_client=s3_client,
+                bucket_name=bucket_name,
+                tournament_id=tournament_id,
+                owner=event.get("generation_lease_owner"),
+            )
+            if not generation_lease.acquire():
+                logging.warning(
+                    f"Tournament {tournament_id} is already being generated by another run; exiting"
+                )
+                return
+            manifest.save(GENERATING, s3_client=s3_client, bucket_name=bucket_name)
+            school_prompt_uploader = SchoolPromptUploader(
+                s3_client=s3_client,
+                bucket_name=bucket_name,
+                tournament_id=tournament_id,
+                max_workers=event.get("upload_workers", 8),
+                manifest=manifest,
+            )
+            # Progress for the website's progress bar
+            status_reporter = StatusReporter(
+                tournament_id, s3_client=s3_client, bucket_name=bucket_name
+            )
+            generation_lease.start_heartbeat()
+        try:
+            response, tourn_metadata = tabroom_summary.main(
+                tournament_id=tournament_id,
+                data_bucket=os.getenv("DATA_BUCKET_NAME", DATA_BUCKET),
+                context=event_context,
+                percentile_minimum=percentile_minimum,
+                max_results_to_pass_to_gpt=event.get("max_results_to_pass_to_gpt", 15),
+                prompt_token_budget=event.get(
+                    "prompt_token_budget", DEFAULT_PROMPT_TOKEN_BUDGET
+                ),
+                # Set to "grouped_by_event" to A/B test the compact prompt encoding
+                prompt_encoding=event.get("prompt_encoding", "rows"),
+                scrape_backend=event.get("scrape_backend", "chrome"),
+                # Parallel scraping is opt-in: set force_single_process to False to scrape events through a browser pool
+                force_single_process=event.get("force_single_process", True),
+                browser_pool_size=event.get("browser_pool_size", 3),
+                school_prompt_uploader=school_prompt_uploader,
+                status_reporter=status_reporter,
+            )
+            if school_prompt_uploader is not None:
+                # Raises if any upload failed, so the tournament isn't marked as generated
+                school_prompt_uploader.wait()
+        except Exception as ex:
+            status_reporter.stage("failed")
+            if not running_outside_of_lambda:
+                # Let in-flight uploads land first so the failed manifest lists everything that was saved
+                school_prompt_uploader.close()
+                try:
+                    manifest.save(
+                        FAILED,
+                        s3_client=s3_client,
+                        bucket_name=bucket_name,
+                        error=repr(ex),
+                    )
+                except Exception as manifest_ex:
+                    logging.error(f"Error saving failed manifest: {repr(manifest_ex)}")
+                generation_lease.release()
+            raise
+        finally:
+            if school_prompt_uploader is not None:
+                school_prompt_uploader.close()
 
         # Save the result outputs
         # If we're not in Lambda, assume we're in Windows
@@ -75,30 +157,24 @@ def handler(event, context):
                                 )
                             )
                             # f.write(response[school_name]["gpt_prompt"].encode("utf-8"))
+                for prompt_name, file_name in PROMPT_FILE_NAMES.items():
+                    if prompt_name in response[school_name]:
+                        manifest.add_artifact(
+                            short_school_name=school_name,
+                            prompt_name=prompt_name,
+                            key=f"{tournament_id}/{school_name}/{file_name}",
+                            prompt=response[school_name][prompt_name],
+                        )
+            manifest.save(COMPLETE)
+            status_reporter.stage("complete")
         else:
-            # Save the tournament results to S3
-            s3_client = boto3.client("s3")
-            bucket_name = os.environ["DATA_BUCKET_NAME"]
-            for school_name in response.keys():
-                if "gpt_prompt" in response[school_name]:
-                    s3_client.put_object(
-                        Body=response[school_name]["gpt_prompt"],
-                        Bucket=bucket_name,
-                        Key=f"{tournament_id}/{school_name}/gpt_prompt.txt",
-                    )
-                if "numbered_list_prompt" in response[school_name]:
-                    s3_client.put_object(
-                        Body=response[school_name]["numbered_list_prompt"],
-                        Bucket=bucket_name,
-                        Key=f"{tournament_id}/{school_name}/numbered_list_prompt.txt",
-                    )
+            # The tournament results were uploaded to S3 as they were generated
             try:
-                # Delete the placeholder to signal to the Lambda that execution is complete
-                s3_client.delete_object(
-                    Bucket=bucket_name, Key=f"{tournament_id}/placeholder.txt"
-                )
-            except Exception:
-                pass
+                manifest.save(COMPLETE, s3_client=s3_client, bucket_name=bucket_name)
+                status_reporter.stage("complete")
+            finally:
+                # Releasing the lease signals to the website that execution is complete
+                generation_lease.release()
         # Find or update the DDB table with the values
         end_date = datetime.datetime.strptime(
             tourn_metadata.get("end"), "%Y-%m-%d %H:%M:%S"
@@ -189,6 +265,32 @@ if __name__ == "__main__":
         required=False,
         default="39344",  # testing a tournament that gave me trouble  # "35467",  # NSDA 2025,
     )
+    parser.add_argument(
+        "-b",
+        "--scrape-backend",
+        help="How to read Tabroom.com pages: 'chrome' (headless Chrome via Selenium), 'http' (pooled HTTP session, no browser), or 'replay' (only pages already in the page cache, no network).",
+        choices=["chrome", "http", "replay"],
+        default="chrome",
+    )
+    parser.add_argument(
+        "-p",
+        "--browser-pool-size",
+        help="How many logged-in browser sessions to scrape events with at once. 1 (the default) scrapes events one at a time.",
+        type=int,
+        default=1,
+    )
+    parser.add_argument(
+        "--prompt-token-budget",
+        help="Approximate number of input tokens allowed in each LLM prompt.",
+        type=int,
+        default=DEFAULT_PROMPT_TOKEN_BUDGET,
+    )
+    parser.add_argument(
+        "--prompt-encoding",
+        help="How results are written into LLM prompts: one row per result, or grouped by event.",
+        choices=["rows", "grouped_by_event"],
+        default="rows",
+    )
     args = parser.parse_args()
     tournament_id = args.tournament_id
     event = {
@@ -196,5 +298,10 @@ if __name__ == "__main__":
         # "context": "This tournament is the California State Championship, which requires students to qualify to the tournament from their local region. Round 4 of Congress and speech events is the semifinal round. Round 5 of Congress and speech events is the final round. In debate events, there are 4 preliminary rounds, followed by elimination rounds. All rounds were judged by panels of judges who each evaluated competitors and submitted an independent ballot.",  # CHSSA-specific
         "percentile_minimum": 0,  # 0 # NSDA championship -- should include all results
         "max_results_to_pass_to_gpt": 25,  # Account for larger entries at NSDA
+        "scrape_backend": args.scrape_backend,
+        "force_single_process": args.browser_pool_size <= 1,
+        "browser_pool_size": args.browser_pool_size,
+        "prompt_token_budget": args.prompt_token_budget,
+        "prompt_encoding": args.prompt_encoding,
     }
     handler(event, {})
@@ -1,20 +1,31 @@
-def create_data_strings(data_objects, data_labels):
+def format_data_value(data_object, data_label, omitted_labels=()):
+    """
+    Returns one column of a data string: the data object's value for the label, or N/A if it's missing or omitted.
+    """
+    if data_label in data_object and data_label not in omitted_labels:
+        try:
+            if isinstance(data_object[data_label], list):
+                return "!".join(data_object[data_label])
+            elif isinstance(data_object[data_label], (int, float)):
+                return str(data_object[data_label])
+            else:
+                return data_object[data_label]
+        except:
+            return "N/A"
+    return "N/A"
+
+
+def create_data_strings(data_objects, data_labels, omitted_labels=()):
+    """
+    Returns one pipe-delimited string per data object (a result dict or ResultRecord), with a column for each data label.
+    Missing values -- and any column in omitted_labels -- are written as N/A.
+    """
     data_strings_all = []
     for data_object in data_objects:
-        data_object_filtered = []
-        for data_label in data_labels:
-            if data_label in data_object.keys():
-                try:
-                    if isinstance(data_object[data_label], list):
-                        data_object_filtered.append("!".join(data_object[data_label]))
-                    elif isinstance(data_object[data_label], (int, float)):
-                        data_object_filtered.append(str(data_object[data_label]))
-                    else:
-                        data_object_filtered.append(data_object[data_label])
-                except:
-                    data_object_filtered.append("N/A")
-            else:
-                data_object_filtered.append("N/A")
+        data_object_filtered = [
+            format_data_value(data_object, data_label, omitted_labels)
+            for data_label in data_labels
+        ]
         data_strings_all.append("|".join(data_object_filtered))
     return data_strings_all
 
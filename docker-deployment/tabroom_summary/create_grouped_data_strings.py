@@ -0,0 +1,52 @@
+from .create_data_strings import format_data_value
+
+# Goes where the column header would for ungrouped data strings, to explain the layout to the LLM
+GROUPED_DATA_HEADER = """Results are grouped by event. Lines like "column: value" give a value shared by every result.
+The next line names the columns of each result, and each "[Event Name]" line starts the results for that event."""
+
+
+def create_grouped_data_strings(data_objects, data_labels, omitted_labels=()):
+    """
+    A more compact alternative to create_data_strings. Returns prompt lines with the data objects grouped under an
+    "[Event Name]" line per event, in order of each event's first appearance.
+
+    Columns with the same value for every data object are written once up front as "label: value" lines, or left out
+    entirely if they're always N/A. They're followed by one pipe-delimited header naming the remaining columns, which
+    are all that each row holds -- so the school name, event name and the like aren't repeated on every row.
+    """
+    if not data_objects:
+        return []
+    rows = [
+        [
+            format_data_value(data_object, data_label, omitted_labels)
+            for data_label in data_labels
+        ]
+        for data_object in data_objects
+    ]
+    preamble = []
+    column_indexes = []
+    for index, data_label in enumerate(data_labels):
+        if data_label == "event_name":
+            continue
+        column_values = {row[index] for row in rows}
+        if column_values == {"N/A"}:
+            continue
+        # A single result has nothing to share a value with, so keep it as a normal row
+        if len(column_values) == 1 and len(rows) > 1:
+            preamble.append(f"{data_label}: {rows[0][index]}")
+        else:
+            column_indexes.append(index)
+
+    rows_by_event = {}
+    for data_object, row in zip(data_objects, rows):
+        event_name = format_data_value(data_object, "event_name", omitted_labels)
+        rows_by_event.setdefault(event_name, []).append(
+            "|".join(row[index] for index in column_indexes)
+        )
+    grouped_data_strings = preamble + [
+        "|".join(data_labels[index] for index in column_indexes)
+    ]
+    for event_name, event_rows in rows_by_event.items():
+        grouped_data_strings.append(f"[{event_name}]")
+        grouped_data_strings += event_rows
+    return grouped_data_strings
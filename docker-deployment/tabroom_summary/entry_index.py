@@ -0,0 +1,60 @@
+class EntryIndex:
+    """
+    Tournament-wide index of entries from the API data, keyed by entry ID.
+
+    names: {<entry id>: <entry name>}
+    codes: {<entry id>: <entry code>}
+    events: {<entry id>: <event id>}
+
+    Each event is indexed with a single pass over all of its rounds (elims included, so late adds aren't missed),
+    and every lookup afterwards is a dict access.
+    """
+
+    def __init__(self, name_to_school_dict: dict = None):
+        self.names = {}
+        self.codes = {}
+        self.events = {}
+        self.entry_count_by_event = {}
+        self.name_to_school_dict = name_to_school_dict or {}
+
+    def add_event(self, event: dict):
+        event_id = event.get("id")
+        entry_count = 0
+        for round in event.get("rounds", []):
+            for section in round.get("sections", []):
+                for ballot in section.get("ballots", []):
+                    entry_id = ballot.get("entry")
+                    # Each entry shows up on many ballots -- only the first one needs indexing
+                    if entry_id is None or entry_id in self.names:
+                        continue
+                    if "entry_name" not in ballot or "entry_code" not in ballot:
+                        continue
+                    self.names[entry_id] = ballot["entry_name"]
+                    self.codes[entry_id] = ballot["entry_code"]
+                    self.events[entry_id] = event_id
+                    entry_count += 1
+        self.entry_count_by_event[event_id] = (
+            self.entry_count_by_event.get(event_id, 0) + entry_count
+        )
+
+    def has_entries_for_event(self, event: dict):
+        """
+        Whether the API data broke codes (gave entry names) for this particular event.
+        """
+        return self.entry_count_by_event.get(event.get("id"), 0) > 0
+
+    def school(self, entry_id):
+        return self.name_to_school_dict.get(self.names.get(entry_id))
+
+    def lookup(self, entry_id):
+        """
+        Returns {"name", "code", "school", "event"} for an entry ID, or None if it isn't indexed.
+        """
+        if entry_id not in self.names:
+            return None
+        return {
+            "name": self.names[entry_id],
+            "code": self.codes[entry_id],
+            "school": self.school(entry_id),
+            "event": self.events[entry_id],
+        }
@@ -0,0 +1,11 @@
+import math
+
+# Claude averages roughly 4 characters per token for English text like our prompts
+CHARACTERS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str):
+    """
+    Returns a rough estimate of how many LLM tokens a piece of text will use, without calling a tokenizer.
+    """
+    return math.ceil(len(text) / CHARACTERS_PER_TOKEN)
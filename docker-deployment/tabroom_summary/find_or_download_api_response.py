@@ -1,73 +1,114 @@
 import boto3
+import botocore
+import gzip
 import json
 import logging
 import os
 import ssl
 import urllib.request
+from .load_api_metadata import load_api_metadata
+from .storage_codec import CONTENT_ENCODING, open_for_reading, open_for_writing
 
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
 
-def find_or_download_api_response(tournament_id, file_size_limit_mb: int = 5):
-    # Check if the API response is already cached in S3. If it is, use that instead of re-scraping
-    if os.environ.get("AWS_LAMBDA_FUNCTION_NAME") is None:
-        file_location = f"{tournament_id}/api_response.json"
-        if os.path.exists(file_location):
-            with open(file_location, "r", encoding="utf-8") as f:
-                try:
-                    return json.load(f)
-                except json.JSONDecodeError:
-                    logging.warning(
-                        f"Failed to load {file_location}. Will attempt to download from tabroom.com"
-                    )
-    else:
-        s3_client = boto3.client("s3")
-        try:
-            api_response_response = s3_client.get_object(
-                Bucket=os.environ["DATA_BUCKET_NAME"],
-                Key=f"{tournament_id}/api_response.json",
-            )
-            response_contents = json.loads(api_response_response["Body"].read())
-            # If the size is larger than the 5MB threshold, raise an exception
-            if (
-                api_response_response["ContentLength"]
-                > file_size_limit_mb * 1024 * 1024
-            ):
-                logging.warning(
-                    f"BIG TOURNAMENT ALERT - Response size was {api_response_response["ContentLength"]}"
+
+def download_api_response(
+    tournament_id,
+    file_size_limit_mb: int = 5,
+    force_download: bool = False,
+):
+    """
+    Make sure a copy of the tournament's API response is on local disk and return its path.
+
+    Uses the cached copy (local folder, or S3 when running in Lambda) when there is one; otherwise streams the
+    response from the Tabroom API straight to disk (gzipped) and caches it. Nothing here holds the whole response in
+    memory, and the size check uses the byte count rather than re-serializing the JSON.
+    The file may be gzipped or plain JSON (older caches), so read it with storage_codec.open_for_reading.
+    """
+    running_in_lambda = os.environ.get("AWS_LAMBDA_FUNCTION_NAME") is not None
+    # Lambda can only write to /tmp
+    local_directory = f"/tmp/{tournament_id}" if running_in_lambda else tournament_id
+    file_location = f"{local_directory}/api_response.json"
+    os.makedirs(local_directory, exist_ok=True)
+
+    # Check if the API response is already cached. If it is, use that instead of re-downloading
+    if not force_download:
+        if running_in_lambda:
+            s3_client = boto3.client("s3")
+            try:
+                s3_client.download_file(
+                    Bucket=os.environ["DATA_BUCKET_NAME"],
+                    Key=f"{tournament_id}/api_response.json",
+                    Filename=file_location,
                 )
-            return response_contents
+                log_api_response_size(file_location, file_size_limit_mb)
+                return file_location
+            except botocore.exceptions.ClientError:
+                logging.info(
+                    "No API response found in S3. Will attempt to download from tabroom.com"
+                )
+        elif os.path.exists(file_location) and os.path.getsize(file_location) > 0:
+            return file_location
 
-        except s3_client.exceptions.NoSuchKey:
-            logging.info(
-                "No API response found in S3. Will attempt to download from tabroom.com"
-            )
     # If we're still in this function, caching failed. Download the data from the Tabroom API
     # DOWNLOAD DATA FROM THE TABROOM API - We'll use a combination of this and scraping
-    response = json.loads(
-        urllib.request.urlopen(  # nosec - uses http
-            url=f"http://www.tabroom.com/api/download_data.mhtml?tourn_id={tournament_id}",
-            context=ssl._create_unverified_context(),  # nosec - data is all public
-        ).read()
-    )
-    if "error" in response:
+    temp_location = f"{file_location}.download"
+    byte_count = 0
+    with urllib.request.urlopen(  # nosec - uses http
+        url=f"http://www.tabroom.com/api/download_data.mhtml?tourn_id={tournament_id}",
+        context=ssl._create_unverified_context(),  # nosec - data is all public
+    ) as response, open_for_writing(temp_location) as f:
+        while chunk := response.read(DOWNLOAD_CHUNK_SIZE):
+            f.write(chunk)
+            byte_count += len(chunk)
+    # Don't cache an error response
+    if "error" in load_api_metadata(temp_location):
+        os.remove(temp_location)
         raise ValueError(
             f"Error downloading data from Tabroom -- please check your tournament ID: {tournament_id}"
         )
+    os.replace(temp_location, file_location)
+    log_api_response_size(file_location, file_size_limit_mb, byte_count)
 
     # Store the response for next time
-    if os.environ.get("AWS_LAMBDA_FUNCTION_NAME") is None:
-        os.makedirs(tournament_id, exist_ok=True)
-        with open(file_location, "w") as f:
-            f.write(json.dumps(response))
-    else:
-        s3_client.put_object(
-            Body=json.dumps(response),
+    if running_in_lambda:
+        boto3.client("s3").upload_file(
+            Filename=file_location,
             Bucket=os.environ["DATA_BUCKET_NAME"],
             Key=f"{tournament_id}/api_response.json",
+            ExtraArgs={
+                "ContentEncoding": CONTENT_ENCODING,
+                "ContentType": "application/json",
+            },
         )
+    return file_location
+
+
+def log_api_response_size(file_location, file_size_limit_mb: int, byte_count=None):
+    if byte_count is None:
+        byte_count = os.path.getsize(file_location)
     # If the response is longer than the 5MB threshold, print a warning
-    if len(json.dumps(response)) > file_size_limit_mb * 1024 * 1024:
-        logging.warning(
-            f"BIG TOURNAMENT ALERT - Response size was {len(json.dumps(response))}"
-        )
+    if byte_count > file_size_limit_mb * 1024 * 1024:
+        logging.warning(f"BIG TOURNAMENT ALERT - Response size was {byte_count}")
+
 
+def find_or_download_api_response(tournament_id, file_size_limit_mb: int = 5):
+    """
+    Returns the whole API response as a dict. Prefer stream_api_response for large tournaments.
+    """
+    file_location = download_api_response(tournament_id, file_size_limit_mb)
+    with open_for_reading(file_location) as f:
+        try:
+            response = json.load(f)
+        except (json.JSONDecodeError, EOFError, gzip.BadGzipFile):
+            logging.warning(
+                f"Failed to load {file_location}. Will attempt to download from tabroom.com"
+            )
+            response = None
+    if response is None:
+        file_location = download_api_response(
+            tournament_id, file_size_limit_mb, force_download=True
+        )
+        with open_for_reading(file_location) as f:
+            response = json.load(f)
     return response
@@ -1,4 +1,4 @@
-def generate_list_generation_prompt(headers: list[str]):
+def generate_list_generation_prompt(headers: list[str], header_string: str = None):
     return f"""Create a numbered list of the following speech and debate tournament event results, so that each event is a new number in the list, and each event contains results from all students in that event.
 Do not include the school name in the individual results entry.
 Team entries might be indicated with just last names, and will typically not contain first names. Those teams should be referred to as "the team of", followed by the last names.
@@ -28,7 +28,7 @@ ONLY INCLUDE RESULTS FROM THE RESULTS DATA. DO NOT INCLUDE ANY RESULTS THAT DO N
 </example>
 
 <result_data>
-{"|".join(headers)}
+{header_string or "|".join(headers)}
 """
 
 
@@ -3,10 +3,21 @@ import json
 import logging
 import os
 import string
-from .generate_llm_prompt_header import generate_llm_prompt_header
+from .prompt_header_template import PromptHeaderTemplate
 from .create_data_strings import create_data_strings
+from .create_grouped_data_strings import (
+    GROUPED_DATA_HEADER,
+    create_grouped_data_strings,
+)
+from .estimate_tokens import estimate_tokens
+from .pack_results import DEFAULT_PROMPT_TOKEN_BUDGET, pack_results
+from .result_table import sort_by_percentile
 from .generate_list_generation_prompt import generate_list_generation_prompt
 
+# "rows" writes one pipe-delimited row per result (create_data_strings); "grouped_by_event" groups them under event
+# headers with shared values listed once (create_grouped_data_strings)
+PROMPT_ENCODINGS = ["rows", "grouped_by_event"]
+
 
 def generate_llm_prompts(
     tournament_data: dict,
@@ -25,10 +36,44 @@ def generate_llm_prompts(
     judge_map: dict,
     school_short_name_dict: dict,
     default_qualifier_count: int,
-    remove_duplicate_prelim_final_places_rows: bool = True,
+    prompt_token_budget: int = DEFAULT_PROMPT_TOKEN_BUDGET,
+    prompt_encoding: str = "rows",
 ):
-    all_schools_dict = {}
+    """
+    Yields a tuple of (short school name, prompt dict) for each school as soon as its prompts are ready, so callers can
+    save or upload one school's prompts while the next school's are being rendered.
+    The prompt dict has "gpt_prompt" and (if the school has any results to list) "numbered_list_prompt"; it is
+    empty for schools with no results.
+    Each prompt holds as many of the school's best results as fit in prompt_token_budget (see pack_results);
+    max_results_to_pass_to_gpt additionally caps the number of results in "gpt_prompt".
+    prompt_encoding picks how results are written into the prompts (see PROMPT_ENCODINGS).
+    """
+    if prompt_encoding not in PROMPT_ENCODINGS:
+        raise ValueError(
+            f"Unknown prompt encoding {prompt_encoding}, expected one of {PROMPT_ENCODINGS}"
+        )
+    if prompt_encoding == "grouped_by_event":
+        header_string = GROUPED_DATA_HEADER
+        encode_results = create_grouped_data_strings
+        # Grouped lines only make sense together, so the numbered list doesn't space them out
+        numbered_list_separator = "\n"
+    else:
+        header_string = "|".join(data_labels)  # _without_percentile)
+        encode_results = create_data_strings
+        numbered_list_separator = "\n\n"
     tournament_id = tournament_data["id"]
+    # Everything in the header that doesn't depend on the school is built once for the whole tournament
+    prompt_header_template = PromptHeaderTemplate(
+        tournament_data=tournament_data,
+        school_count=school_count,
+        entry_dictionary=entry_dictionary,
+        header_string=header_string,
+        default_qualifier_count=default_qualifier_count,
+        state_count=state_count,
+        has_speech=has_speech,
+        has_debate=has_debate,
+        context=context,
+    )
     for school_long_name in schools_to_write_up:
         short_school_name = school_short_name_dict[school_long_name]
         # If there is already a results.txt file for the school, continue early
@@ -36,33 +81,13 @@ def generate_llm_prompts(
             logging.debug(f"Skipping {short_school_name} due to existing results")
             continue
         school_filtered_tournament_results = grouped_data.get(short_school_name, [])
-        all_schools_dict[short_school_name] = {}
+        school_prompts = {}
         logging.info(f"Starting results generation for {short_school_name}...")
         if not school_filtered_tournament_results:
             logging.warning(f"No results found for {short_school_name}")
+            yield short_school_name, school_prompts
             continue
-        sorted_school_results = sorted(
-            school_filtered_tournament_results,
-            key=lambda x: float(x["percentile"]),
-            reverse=True,
-        )
-        # Remove Prelim Seeds if there is a Final Places entry with the same data
-        # This is O(N^2) but shouldn't be a huge issue except for MASSIVE school entries (100+)
-        if remove_duplicate_prelim_final_places_rows:
-            for outer_result in sorted_school_results:
-                if outer_result["result_set"] == "Final Places":
-                    target_result_set = "Prelim Seeds"
-                    current_entry = outer_result["entry_name"]
-                    current_rank = outer_result["rank"]
-                    for inner_result in sorted_school_results:
-                        if (
-                            inner_result["result_set"] == target_result_set
-                            and inner_result["entry_name"] == current_entry
-                            and inner_result["rank"] == current_rank
-                        ):
-                            sorted_school_results.remove(inner_result)
-                            break
-
+        sorted_school_results = sort_by_percentile(school_filtered_tournament_results)
         # If there is at least one result above the percentile minimum, filter out any results below the percentile minimum
         if int(float(sorted_school_results[0]["percentile"])) > percentile_minimum:
             logging.info(
@@ -76,85 +101,107 @@ def generate_llm_prompts(
         else:
             sorted_filtered_school_results = sorted_school_results
 
-        # Filter down to just the top 15 results (based on percentile) to get better results for large schools
+        # Filter down to just the top results (based on percentile) to get better results for large schools
         if len(sorted_filtered_school_results) > max_results_to_pass_to_gpt:
             top_sorted_filtered_school_results = sorted_filtered_school_results[
-                0 : max_results_to_pass_to_gpt - 1
+                0:max_results_to_pass_to_gpt
             ]
         else:
             top_sorted_filtered_school_results = sorted_filtered_school_results
-        logging.debug(
-            f"School specific results without any filtering:\r\n{json.dumps(sorted_school_results, indent=4)}"
-        )
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug(
+                f"School specific results without any filtering:\r\n{json.dumps([dict(result.items()) for result in sorted_school_results], indent=4)}"
+            )
         # data_labels_without_percentile = [
         #     label for label in data_labels if label != "percentile"
         # ]
-        data_strings = create_data_strings(
-            data_objects=top_sorted_filtered_school_results,
+        # The header's glossary depends on the data, so size it against the unpacked data -- packing can only shrink it
+        header_tokens = estimate_tokens(
+            "\n".join(
+                prompt_header_template.render(
+                    school_name=school_long_name,
+                    short_school_name=short_school_name,
+                    data_strings=encode_results(
+                        data_objects=top_sorted_filtered_school_results,
+                        data_labels=data_labels,
+                    ),
+                    judge_map=judge_map,
+                )
+                + ["</result_data>"]
+            )
+        )
+        packed_school_results = pack_results(
+            results=top_sorted_filtered_school_results,
             data_labels=data_labels,  # _without_percentile,
+            token_budget=prompt_token_budget - header_tokens,
         )
-        llm_payload = generate_llm_prompt_header(
-            tournament_data=tournament_data,
+        if len(packed_school_results) < len(top_sorted_filtered_school_results):
+            logging.info(
+                f"Only {len(packed_school_results)} of {len(top_sorted_filtered_school_results)} results for {short_school_name} fit in the prompt token budget"
+            )
+        data_strings = encode_results(
+            data_objects=packed_school_results,
+            data_labels=data_labels,  # _without_percentile,
+        )
+        llm_payload = prompt_header_template.render(
             school_name=school_long_name,
             short_school_name=short_school_name,
-            school_count=school_count,
-            state_count=state_count,
-            has_speech=has_speech,
-            has_debate=has_debate,
-            entry_dictionary=entry_dictionary,
-            header_string="|".join(data_labels),  # _without_percentile),
-            context=context,
             data_strings=data_strings,
             judge_map=judge_map,
-            default_qualifier_count=default_qualifier_count,
         )
         llm_payload += data_strings
         llm_payload.append("</result_data>")
         final_llm_payload = "\n".join(llm_payload)
-        all_schools_dict[short_school_name]["gpt_prompt"] = final_llm_payload
+        school_prompts["gpt_prompt"] = final_llm_payload
 
+        logging.info(
+            f"LLM prompt for {short_school_name} is about {estimate_tokens(final_llm_payload)} tokens"
+        )
         logging.debug(f"LLM Prompt: {final_llm_payload}")
 
         ###  Generate numbered list prompt
-        sorted_by_event = sorted(
-            sorted_school_results,
-            key=lambda x: x["event_name"],
-            reverse=False,
-        )
-        sorted_by_event_without_round_by_round = []
-
         # Reduce to just the essentials
-        for result_for_numbered_list in sorted_by_event:
-            # Remove round-by-round results from the numbered list -- not required
-            try:
-                result_for_numbered_list.pop("results_by_round")
-            except KeyError:
-                pass  # already not present
-            if float(result_for_numbered_list["percentile"]) < percentile_minimum:
-                continue
-            sorted_by_event_without_round_by_round.append(result_for_numbered_list)
-        if len(sorted_by_event_without_round_by_round) == 0:
+        numbered_list_results = [
+            result_for_numbered_list
+            for result_for_numbered_list in sorted_school_results
+            if float(result_for_numbered_list["percentile"]) >= percentile_minimum
+        ]
+        if len(numbered_list_results) == 0:
             numbered_list_prompt = ""
         else:
             logging.info(f"Generating list of results for {short_school_name}")
             list_generation_prompt = generate_list_generation_prompt(
-                headers=data_labels
+                headers=data_labels, header_string=header_string
+            )
+            # Pack the best results into the budget, then list the ones that fit by event
+            packed_numbered_list_results = pack_results(
+                results=numbered_list_results,
+                data_labels=data_labels,  # _without_percentile,
+                token_budget=prompt_token_budget
+                - estimate_tokens(list_generation_prompt + "\n</result_data>"),
+                # Round-by-round results aren't required for the numbered list
+                omitted_labels=["results_by_round"],
+            )
+            sorted_by_event = sorted(
+                packed_numbered_list_results,
+                key=lambda x: x["event_name"],
+                reverse=False,
             )
             numbered_list_prompt = (
                 list_generation_prompt
                 + "\n"
-                + "\n\n".join(
-                    create_data_strings(
-                        data_objects=sorted_by_event_without_round_by_round,
+                + numbered_list_separator.join(
+                    encode_results(
+                        data_objects=sorted_by_event,
                         data_labels=data_labels,  # _without_percentile,
+                        # Round-by-round results aren't required for the numbered list
+                        omitted_labels=["results_by_round"],
                     )
                 )
                 + "\n"
                 + "</result_data>"
             )
-            all_schools_dict[short_school_name][
-                "numbered_list_prompt"
-            ] = numbered_list_prompt
+            school_prompts["numbered_list_prompt"] = numbered_list_prompt
 
         # If running outside of Lambda, save off results at the end
         if os.environ.get("AWS_LAMBDA_FUNCTION_NAME") is None:
@@ -184,4 +231,4 @@ def generate_llm_prompts(
                             )
                         )
                     )
-    return all_schools_dict
+        yield short_school_name, school_prompts
@@ -0,0 +1,153 @@
+import json
+import logging
+import threading
+import time
+import uuid
+from botocore.exceptions import ClientError
+
+GENERATION_LEASE_FILE_NAME = "generation.lease"
+# Long enough for an async invoke to start the run; the run's heartbeat keeps extending it after that
+GENERATION_LEASE_TTL_SECONDS = 10 * 60
+GENERATION_LEASE_HEARTBEAT_SECONDS = 2 * 60
+# S3 error codes meaning a conditional write lost to someone else's write
+LOST_RACE_ERROR_CODES = [
+    "PreconditionFailed",
+    "ConditionalRequestConflict",
+    "NoSuchKey",
+]
+
+
+class GenerationLease:
+    """
+    An S3 lease ensuring only one generation run per tournament, stored at <tournament_id>/generation.lease as
+    {"owner": <owner ID>, "expires_at": <epoch seconds>, "heartbeat_at": <epoch seconds>}.
+
+    The website and batch processor take the lease before invoking the generator and pass their owner ID along, so
+    the run they start adopts it; anyone else finds it held and backs off. The lease is created with a conditional
+    put (If-None-Match: *), and renewed or taken over (once expired) with If-Match on its ETag, so two callers can
+    never both hold it. While a run is going, a heartbeat thread pushes the expiry out; if the run dies, the lease
+    expires on its own.
+    """
+
+    def __init__(
+        self,
+        s3_client,
+        bucket_name: str,
+        tournament_id: str,
+        owner: str = None,
+        ttl_seconds: int = GENERATION_LEASE_TTL_SECONDS,
+        heartbeat_seconds: int = GENERATION_LEASE_HEARTBEAT_SECONDS,
+    ):
+        self.s3_client = s3_client
+        self.bucket_name = bucket_name
+        self.key = f"{tournament_id}/{GENERATION_LEASE_FILE_NAME}"
+        self.owner = owner or str(uuid.uuid4())
+        self.ttl_seconds = ttl_seconds
+        self.heartbeat_seconds = heartbeat_seconds
+        # ETag of our latest write to the lease, for conditional renewals
+        self.etag = None
+        self.stop_heartbeat = threading.Event()
+        self.heartbeat_thread = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+    def _lease_body(self):
+        now = time.time()
+        return json.dumps(
+            {
+                "owner": self.owner,
+                "expires_at": now + self.ttl_seconds,
+                "heartbeat_at": now,
+            }
+        )
+
+    def _put(self, **condition):
+        """
+        Write our lease with the given S3 condition. Returns True if the write went through, False if it lost a race.
+        """
+        try:
+            response = self.s3_client.put_object(
+                Body=self._lease_body(),
+                Bucket=self.bucket_name,
+                Key=self.key,
+                ContentType="application/json",
+                **condition,
+            )
+        except ClientError as ex:
+            if ex.response["Error"]["Code"] in LOST_RACE_ERROR_CODES:
+                return False
+            raise
+        self.etag = response["ETag"]
+        return True
+
+    def acquire(self):
+        """
+        Take the lease if it's free, expired, or already ours. Returns True if we now hold it.
+        """
+        if self._put(IfNoneMatch="*"):
+            return True
+        try:
+            existing_lease = self.s3_client.get_object(
+                Bucket=self.bucket_name, Key=self.key
+            )
+        except ClientError:
+            # Released in the meantime -- try once more to create it
+            return self._put(IfNoneMatch="*")
+        existing_lease_data = json.loads(existing_lease["Body"].read())
+        if (
+            existing_lease_data["owner"] != self.owner
+            and existing_lease_data["expires_at"] > time.time()
+        ):
+            logging.info(
+                f"Generation lease {self.key} is held by {existing_lease_data['owner']}"
+            )
+            return False
+        return self._put(IfMatch=existing_lease["ETag"])
+
+    def heartbeat(self):
+        """
+        Push the lease's expiry out. Returns False if the lease was lost (eg. it expired and was taken over).
+        """
+        if self._put(IfMatch=self.etag):
+            return True
+        logging.error(f"Lost generation lease {self.key}")
+        return False
+
+    def _heartbeat_loop(self):
+        while not self.stop_heartbeat.wait(self.heartbeat_seconds):
+            try:
+                if not self.heartbeat():
+                    return
+            except Exception as ex:
+                # Keep trying -- the lease only lapses if heartbeats fail for a whole TTL
+                logging.warning(f"Error renewing generation lease: {repr(ex)}")
+
+    def start_heartbeat(self):
+        self.heartbeat_thread = threading.Thread(
+            target=self._heartbeat_loop,
+            name="generation-lease-heartbeat",
+            daemon=True,
+        )
+        self.heartbeat_thread.start()
+
+    def release(self):
+        """
+        Stop the heartbeat and delete the lease, unless someone else has taken it over since.
+        """
+        self.stop_heartbeat.set()
+        if self.heartbeat_thread is not None:
+            self.heartbeat_thread.join()
+            self.heartbeat_thread = None
+        try:
+            existing_lease = self.s3_client.get_object(
+                Bucket=self.bucket_name, Key=self.key
+            )
+            if json.loads(existing_lease["Body"].read())["owner"] == self.owner:
+                self.s3_client.delete_object(Bucket=self.bucket_name, Key=self.key)
+        except Exception as ex:
+            # An unreleased lease just expires on its own
+            logging.warning(f"Error releasing generation lease: {repr(ex)}")
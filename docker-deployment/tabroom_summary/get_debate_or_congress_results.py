@@ -4,6 +4,8 @@ import re
 from .get_debate_speaker_awards_from_scraped_data import (
     get_debate_speaker_awards_from_scraped_data,
 )
+from .rank_engine import percentiles_for_places, rank_result_set
+from .scraped_results_index import ScrapedResultsIndex
 
 
 def get_ranked_ret_val(ret_val):
@@ -20,24 +22,26 @@ def get_ranked_ret_val(ret_val):
     for result_set, results in shards.items():
         if results[0].get("place", "N/A") != "TBD":
             continue  # If all places are known, no need to rank
-        results.sort(
-            key=lambda x: (
-                (
-                    int(x.get("round_reached", 0))
-                    if str(x.get("round_reached")).isdigit()
-                    else 0
-                ),
-                x.get("results_by_round", "").count("W"),
-            ),
-            reverse=True,  # Sort by round_reached descending, then by Ws descending
+        # Rank by round_reached descending, then by Ws descending
+        ranks, percentiles = rank_result_set(
+            sort_keys=[
+                [
+                    (
+                        int(x.get("round_reached", 0))
+                        if str(x.get("round_reached")).isdigit()
+                        else 0
+                    )
+                    for x in results
+                ],
+                [x.get("results_by_round", "").count("W") for x in results],
+            ],
+            descending=[True, True],
         )
-        # Assign ranks based on the sorted order
-        for index, single_result in enumerate(results):
-            single_result["rank"] = f"{index + 1}/{len(results)}"
-            single_result["place"] = index + 1
-            single_result["percentile"] = int(
-                100 - ((100 * (index + 1)) / len(results))
-            )
+        for single_result, rank, percentile in zip(results, ranks, percentiles):
+            single_result["rank"] = f"{rank}/{len(results)}"
+            single_result["place"] = rank
+            single_result["percentile"] = percentile
+        results.sort(key=lambda x: x["place"])
 
     # Put the shards back together
     ret_val = []
@@ -52,7 +56,7 @@ def get_debate_or_congress_results(
     entry_to_school_dict: dict,
     code_dictionary,
     entry_dictionary,
-    scraped_data: list[dict],
+    scraped_results_index: ScrapedResultsIndex,
     event_type: str = "debate",  # debate or congress
 ):
     """
@@ -88,21 +92,16 @@ def get_debate_or_congress_results(
         label = r_set["label"]
         # Separate function to handle speaker awards.
         if label == "Speaker Awards":
-            for scraped_event in scraped_data:
-                if scraped_event["event_name"] == event_name:
-                    for scraped_result_set in scraped_event["result_list"]:
-                        if not scraped_result_set:
-                            continue
-                        if scraped_result_set["result_set_type"] == "Speaker Awards":
-                            speaker_award_results = (
-                                get_debate_speaker_awards_from_scraped_data(
-                                    speaker_results=scraped_result_set["results"],
-                                    event_name=event_name,
-                                    event_entries=total_entries,
-                                )
-                            )
-                            for spk_result in speaker_award_results:
-                                ret_val.append(spk_result)
+            for scraped_result_set in scraped_results_index.result_sets(
+                event_name, "Speaker Awards"
+            ):
+                speaker_award_results = get_debate_speaker_awards_from_scraped_data(
+                    speaker_results=scraped_result_set["results"],
+                    event_name=event_name,
+                    event_entries=total_entries,
+                )
+                for spk_result in speaker_award_results:
+                    ret_val.append(spk_result)
             # Skip the rest of the logic -- all speaker point data is handled in function
             continue
         elif (
@@ -117,6 +116,7 @@ def get_debate_or_congress_results(
                 total_entries -= (
                     1  # Adjust blank entry values here as they mess up the numbers
                 )
+        first_row_of_result_set = len(ret_val)
         for result in r_set["results"]:
             if "entry" not in result:
                 continue  # Handling a strange case for blank results
@@ -163,14 +163,8 @@ def get_debate_or_congress_results(
             result_school = result.get(
                 "school", entry_to_school_dict.get(entry_name, "UNKNOWN")
             )
-            # Try to get the percentile, but if it's not there, calculate it
-            try:
-                percentile = result["percentile"]
-            except KeyError:
-                try:
-                    percentile = 100 - ((100 * float(rank)) / float(total_entries))
-                except:
-                    percentile = 0  # If we can't calculate it, just set it to 0
+            # Use the published percentile if there is one; otherwise it's calculated for the whole set below
+            percentile = result.get("percentile")
 
             # Treat TOC bids as 100th percentile! It's a big achievement.
             rank_string = f"{rank}/{total_entries}"
@@ -193,6 +187,19 @@ def get_debate_or_congress_results(
                     "results_by_round": results_by_round,
                 }
             )
+        # Calculate any missing percentiles from the places, for the whole result set at once
+        rows_missing_percentile = [
+            row
+            for row in ret_val[first_row_of_result_set:]
+            if row["percentile"] is None
+        ]
+        for row, percentile in zip(
+            rows_missing_percentile,
+            percentiles_for_places(
+                [row["place"] for row in rows_missing_percentile], total_entries
+            ),
+        ):
+            row["percentile"] = percentile
     # If any placement is TBD, we need to rank the results
     for instance in ret_val:
         if instance.get("place", "N/A") == "TBD":
@@ -268,7 +275,7 @@ if __name__ == "__main__":
                 entry_to_school_dict=example_entry_to_school_dict,
                 code_dictionary=example_code_dictionary,
                 entry_dictionary=example_entry_dictionary,
-                scraped_data=example_scraped_data,
+                scraped_results_index=ScrapedResultsIndex(example_scraped_data),
             ),
             indent=4,
         )
@@ -1,5 +1,6 @@
 import logging
 import re
+from .rank_engine import rank_result_set
 
 
 def get_debate_results_from_rounds_only(
@@ -123,19 +124,21 @@ def get_debate_results_from_rounds_only(
         )
         return ret_val
 
-    # This is a bit of a hack to get the rank of each entry, assuming that all entries with the same win total are tied
+    # Entries with the same win total are tied
     # eg. if 3 entries have 4 wins (in a 4 round tournament), they are all tied for 1st place
-    current_entry_rank = 1
-    current_win_loss = -1
-    for iterator, entry_name in enumerate(overall_scoring.keys(), start=1):
+    ranks, percentiles = rank_result_set(
+        sort_keys=[
+            [scoring["win_total"] for scoring in overall_scoring_sorted.values()]
+        ],
+        descending=[True],
+    )
+    for entry_name, current_entry_rank, percentile in zip(
+        overall_scoring_sorted.keys(), ranks, percentiles
+    ):
         entry_school = overall_scoring[entry_name]["school"]
         entry_code = overall_scoring[entry_name]["code"]
         loss_count = round_count - overall_scoring[entry_name]["win_total"]
         win_loss = f"{overall_scoring[entry_name]['win_total']}W{loss_count}L"
-        # If the win/loss count has changed, update the rank
-        if win_loss != current_win_loss:
-            current_entry_rank = iterator
-            current_win_loss = win_loss
         results_by_round = overall_scoring[entry_name]["score_list"]
         ret_val.append(
             {
@@ -148,8 +151,7 @@ def get_debate_results_from_rounds_only(
                 "rank": f"{current_entry_rank}/{len(overall_scoring_sorted)}",
                 "total_entries": len(overall_scoring_sorted),
                 "round_reached": "N/A",
-                "percentile": 100
-                - ((current_entry_rank - 1) * 100 / len(overall_scoring_sorted)),
+                "percentile": percentile,
                 "place": win_loss,
                 "results_by_round": results_by_round,
             }
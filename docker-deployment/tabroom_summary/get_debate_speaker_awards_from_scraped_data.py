@@ -1,5 +1,6 @@
 import unicodedata
 import re
+from .rank_engine import percentiles_from_ranks
 
 
 def get_parsed_speaker_points(round_by_round: str) -> str:
@@ -77,9 +78,14 @@ def get_debate_speaker_awards_from_scraped_data(
                 "school_name": speaker_result["school"],
                 "rank": f"{place_no_tiebreak}/{total_entries}",
                 "round_reached": "N/A",
-                "percentile": int(100 - (100 * int(place_no_tiebreak) / total_entries)),
+                "percentile": None,  # Calculated for the whole result set below
                 "place": place_no_tiebreak,
                 "results_by_round": parsed_speaker_points,
             }
         )
+    percentiles = percentiles_from_ranks(
+        [int(result["place"]) for result in ret_val], total_entries
+    ).tolist()
+    for result, percentile in zip(ret_val, percentiles):
+        result["percentile"] = percentile
     return ret_val
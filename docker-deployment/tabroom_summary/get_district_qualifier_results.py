@@ -1,5 +1,6 @@
 import re
 import logging
+from .rank_engine import percentiles_from_ranks
 
 """
 This little guy takes a combination of API and scraped data to return a list of district qualifier results
@@ -17,6 +18,7 @@ def get_district_qualifier_results(
     except IndexError:
         logging.warning(f"No results for {event_name}")
         return results_list
+    numeric_places = []
     for result in scraped_data["result_list"][0]["results"]:
         if result["place"] == "QUAL" or result["place"] == "Qual":
             result_set = "National Qualifier"
@@ -38,9 +40,14 @@ def get_district_qualifier_results(
             "rank": f"{numeric_place}/{total_entries}",
             "total_entries": total_entries,
             "round_reached": "N/A",
-            "percentile": 100 - ((numeric_place - 1) * 100 / total_entries),
+            "percentile": None,  # Calculated for the whole event below
             "place": "N/A",
             "results_by_round": "",
         }
         results_list.append(result_object)
+        numeric_places.append(numeric_place)
+    # The places are published (and qualifiers count as 1st), so they're already the ranks
+    percentiles = percentiles_from_ranks(numeric_places, total_entries).tolist()
+    for result_object, percentile in zip(results_list, percentiles):
+        result_object["percentile"] = percentile
     return results_list
@@ -1,4 +1,5 @@
 import json
+from .rank_engine import percentiles_from_ranks
 
 
 def parse_this_round_ranks(values):
@@ -24,7 +25,7 @@ def get_nsda_congress_results(
     code_dictionary,
     entry_dictionary,
     entry_to_school_dict,
-    scraped_data,
+    scraped_results_index,
 ):
     """
     Function for parsing NSDA Congress results.
@@ -90,9 +91,7 @@ def get_nsda_congress_results(
                 "rank": rank_string,
                 "total_entries": total_entries,
                 "round_reached": round_name,
-                "percentile": int(
-                    float(100 - ((100 * place) / total_entries))
-                ),  # Percentile is calculated based on the place
+                "percentile": None,  # Calculated from the place once every round is in
                 "place": place,
                 "results_by_round": json.dumps(results_by_round_all_rounds),
             }
@@ -100,5 +99,12 @@ def get_nsda_congress_results(
     ret_list = []
     for entry_code, result in ret_val.items():
         ret_list.append(result)
+    # Percentile is calculated based on the place
+    percentiles = percentiles_from_ranks(
+        [result["place"] for result in ret_list],
+        [result["total_entries"] for result in ret_list],
+    ).tolist()
+    for result, percentile in zip(ret_list, percentiles):
+        result["percentile"] = percentile
 
     return ret_list
@@ -1,5 +1,6 @@
 import logging
 import re
+from .rank_engine import percentiles_for_places
 
 
 def get_speech_results_from_final_places(
@@ -56,10 +57,8 @@ def get_speech_results_from_final_places(
             place = int(result["place"])
         except (ValueError, TypeError, KeyError):
             place = current_implicit_place_value
-        try:
-            percentile = result["percentile"]
-        except KeyError:
-            percentile = int(100.0 * (1 - (place - 1) / unique_entry_count))
+        # Use the published percentile if there is one; otherwise it's calculated for the whole set below
+        percentile = result.get("percentile")
         # Palmer likes to hide round-by-round results in this very low-priority column.
         # Might as well include it to give a summary of how each round went.
         ranks_by_round = ""
@@ -85,5 +84,15 @@ def get_speech_results_from_final_places(
                 "results_by_round": ranks_by_round,
             }
         )
+    # Calculate any missing percentiles from the places (stored in round_reached), all at once
+    rows_missing_percentile = [row for row in ret_val if row["percentile"] is None]
+    for row, percentile in zip(
+        rows_missing_percentile,
+        percentiles_for_places(
+            [row["round_reached"] for row in rows_missing_percentile],
+            unique_entry_count,
+        ),
+    ):
+        row["percentile"] = percentile
     # Return the results sorted with best-percentile results at the top, so the LLM focuses on those
     return ret_val
@@ -1,5 +1,6 @@
 import logging
 import re
+from .rank_engine import rank_result_set
 
 
 def get_speech_results_from_rounds_only(
@@ -91,21 +92,14 @@ def get_speech_results_from_rounds_only(
                             {"rank": rank, "points": points}
                         )
                         section_scoring[entry_name]["rank_total"] += rank
-                # Sort the section_scoring dictionary by rank total
-                    section_scoring = dict(
-                        sorted(
-                            section_scoring.items(),
-                            key=lambda item: item[1]["rank_total"],
-                            reverse=False,
-                        )
-                    )
-                for index, (entry_name, scoring) in enumerate(
-                    section_scoring.items(), start=1
+                # Rank the section by rank total (lower is better); tied totals share a rank
+                ranks, percentiles = rank_result_set(
+                    [[scoring["rank_total"] for scoring in section_scoring.values()]]
+                )  # TODO - make this give a competition-wide percentile, based on the field size
+                for index, percentile, entry_name in sorted(
+                    zip(ranks, percentiles, section_scoring.keys()),
+                    key=lambda ranked: ranked[0],
                 ):
-                    percentile = (
-                        100 * (len(section_scoring) - index + 1) / len(section_scoring)
-                    )  # TODO - make this give a competition-wide percentile, based on the field size
-
                     entry_school = section_scoring[entry_name]["school"]
                     ret_val.append(
                         {
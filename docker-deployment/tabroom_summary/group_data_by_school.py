@@ -1,4 +1,5 @@
 import json
+from .result_table import ResultTable
 
 
 def group_data_by_school(
@@ -10,6 +11,8 @@ def group_data_by_school(
     Group the results by the school's short name.
     Returns a dict keyed by short school name, containing a list of results for that school
     """
+    if isinstance(results, ResultTable):
+        return results.group_by_school(school_short_name_dict)
     grouped_data = {}
     for result in results:
         if not result:
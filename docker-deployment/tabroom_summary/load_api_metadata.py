@@ -0,0 +1,32 @@
+import ijson
+from .storage_codec import open_for_reading
+
+
+def load_api_metadata(file_location):
+    """
+    Stream through an API response file and return its top-level fields (name, dates, location, etc.),
+    skipping the "categories" tree so memory use stays small no matter how big the tournament is.
+    """
+    metadata = {}
+    key = None
+    builder = None
+    depth = 0
+    with open_for_reading(file_location) as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if prefix == "":
+                if event == "map_key":
+                    key = value
+                    builder = None if key == "categories" else ijson.ObjectBuilder()
+                continue
+            if builder is None:
+                continue
+            builder.event(event, value)
+            if event in ["start_map", "start_array"]:
+                depth += 1
+            elif event in ["end_map", "end_array"]:
+                depth -= 1
+            # The value is complete once every container it opened has closed again
+            if depth == 0:
+                metadata[key] = builder.value
+                builder = None
+    return metadata
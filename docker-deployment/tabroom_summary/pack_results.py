@@ -0,0 +1,75 @@
+from .create_data_strings import create_data_strings
+from .estimate_tokens import estimate_tokens
+
+# Input tokens allowed for each prompt, header included -- keeps Bedrock latency and cost per summary predictable
+DEFAULT_PROMPT_TOKEN_BUDGET = 6000
+# Columns that can run long (eg. NSDA Congress round-by-round JSON) and are the first thing to trim
+VERBOSE_LABELS = ("results_by_round",)
+SHORTENED_VALUE_CHARACTERS = 80
+
+
+def _shorten_value(value):
+    if isinstance(value, list):
+        value = "!".join(value)
+    elif not isinstance(value, str):
+        return value
+    if len(value) <= SHORTENED_VALUE_CHARACTERS:
+        return value
+    return value[:SHORTENED_VALUE_CHARACTERS].rstrip() + "..."
+
+
+def pack_results(
+    results,
+    data_labels,
+    token_budget: int,
+    omitted_labels=(),
+    verbose_labels=VERBOSE_LABELS,
+):
+    """
+    Returns as many of the results as fit in token_budget, ready to be turned into data strings.
+
+    Results should be sorted best-first. If everything doesn't fit, verbose columns are shortened, then left out,
+    starting from the last result; only then are whole results dropped from the end. The first result is always kept.
+    Trimmed results are returned as copies, so the originals are never modified.
+    Sizes are estimated from create_data_strings rows; the grouped encoding of the same results is almost always smaller.
+    """
+    verbose_labels = [
+        label
+        for label in verbose_labels
+        if label in data_labels and label not in omitted_labels
+    ]
+
+    def trim(result, detail):
+        trimmed_result = dict(result.items())
+        for label in verbose_labels:
+            if label not in trimmed_result:
+                continue
+            if detail == "dropped":
+                del trimmed_result[label]
+            else:
+                trimmed_result[label] = _shorten_value(trimmed_result[label])
+        return trimmed_result
+
+    def row_tokens(result):
+        # Each row is followed by a newline in the prompt
+        return estimate_tokens(
+            create_data_strings([result], data_labels, omitted_labels)[0] + "\n"
+        )
+
+    packed_results = list(results)
+    token_counts = [row_tokens(result) for result in packed_results]
+    total_tokens = sum(token_counts)
+    if verbose_labels:
+        for detail in ("shortened", "dropped"):
+            for index in reversed(range(len(packed_results))):
+                if total_tokens <= token_budget:
+                    break
+                trimmed_result = trim(results[index], detail)
+                trimmed_tokens = row_tokens(trimmed_result)
+                total_tokens += trimmed_tokens - token_counts[index]
+                packed_results[index] = trimmed_result
+                token_counts[index] = trimmed_tokens
+    while total_tokens > token_budget and len(packed_results) > 1:
+        packed_results.pop()
+        total_tokens -= token_counts.pop()
+    return packed_results
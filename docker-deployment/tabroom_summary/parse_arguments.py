@@ -52,6 +52,18 @@ def parse_arguments():
         type=int,
         default=15,
     )
+    parser.add_argument(
+        "--prompt-token-budget",
+        help="Approximate number of input tokens allowed in each LLM prompt. Results that don't fit are shortened or left out, lowest percentile first.",
+        type=int,
+        default=6000,
+    )
+    parser.add_argument(
+        "--prompt-encoding",
+        help="How results are written into LLM prompts: one row per result, or grouped by event with shared values listed once.",
+        choices=["rows", "grouped_by_event"],
+        default="rows",
+    )
     parser.add_argument(
         "-c",
         "--context",
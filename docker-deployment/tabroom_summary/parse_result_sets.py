@@ -11,36 +11,34 @@ from .get_speech_prelims_from_nsda_result_sets import (
     get_speech_prelims_from_nsda_result_sets,
 )
 from .get_nsda_congress_results import get_nsda_congress_results
+from .entry_index import EntryIndex
+from .rank_engine import rank_result_set
+from .scraped_results_index import ScrapedResultsIndex
 import logging
 import os
 
 
 def parse_result_sets(
     event: dict,
-    entry_id_to_entry_code_dictionary: dict,
-    entry_id_to_entry_entry_name_dictionary: dict,
+    entry_index: EntryIndex,
     name_to_school_dict: dict,
-    scraped_results: dict,
+    scraped_results_index: ScrapedResultsIndex,
 ):
     has_debate = False
     has_speech = False
     tournament_results = []
+    entry_id_to_entry_code_dictionary = entry_index.codes
+    entry_id_to_entry_entry_name_dictionary = entry_index.names
+    # Only trust the API's entry names if they were published for THIS event
+    event_has_entries = entry_index.has_entries_for_event(event)
     # Parse results sets
     # Start with District Qualifiers since that's special and processed the same regardless of event type
     for result_set in event.get("result_sets", []):
         # It's way easier to just grab the data from scraped results.
         if result_set["label"] == "District Qualifiers":
-            event_name = event["name"]
-            scraped_single_event_results_list = [
-                result_list
-                for result_list in scraped_results
-                if result_list.get("event_name", "") == event_name
-            ]
-            if len(scraped_single_event_results_list) != 1:
-                raise ValueError(
-                    f"Expected 1 scraped result for event {event_name}, got {len(scraped_single_event_results_list)}"
-                )
-            scraped_single_event_results = scraped_single_event_results_list[0]
+            scraped_single_event_results = scraped_results_index.event(event["name"])
+            if scraped_single_event_results is None:
+                continue
             district_results = get_district_qualifier_results(
                 scraped_data=scraped_single_event_results,
                 event_name=event.get("name"),
@@ -60,16 +58,19 @@ def parse_result_sets(
             )
             for debate_round_result in debate_round_results:
                 tournament_results.append(debate_round_result)
-            # Look up the entry in the scraped_data whose name key matches the event name key
-            # This is probably horrible, but I don't know where else to make it work.
-            scraped_result_for_event = [
-                result
-                for result in scraped_results
-                if result["event_name"] == event["name"]
-            ][0]
+            # Look up the scraped results whose event name matches this event
+            scraped_result_for_event = scraped_results_index.event(event["name"])
             if scraped_result_for_event:
                 for overall_event_result in scraped_result_for_event["result_list"]:
-                    for index, result in enumerate(overall_event_result["results"]):
+                    if not overall_event_result:
+                        continue  # Result sets that failed to parse are saved empty
+                    # Rows are published in place order
+                    ranks, percentiles = rank_result_set(
+                        [range(len(overall_event_result["results"]))]
+                    )
+                    for result, rank, percentile in zip(
+                        overall_event_result["results"], ranks, percentiles
+                    ):
                         tournament_results.append(
                             {
                                 "event_name": event["name"],
@@ -80,16 +81,11 @@ def parse_result_sets(
                                 "entry_name": result.get("name", ""),
                                 "entry_code": result.get("code", ""),
                                 "school_name": result.get("school", ""),
-                                "rank": f"{index+1}/{len(overall_event_result["results"])}",
+                                "rank": f"{rank}/{len(overall_event_result["results"])}",
                                 "total_entries": len(overall_event_result["results"]),
                                 "round_reached": "N/A",
-                                "percentile": 100
-                                - (
-                                    100
-                                    * (index + 1)
-                                    / (len(overall_event_result["results"]))
-                                ),
-                                "place": str(index + 1),
+                                "percentile": percentile,
+                                "place": str(rank),
                                 "results_by_round": f"{result.get("wins", "N/A")} prelim wins",
                             }
                         )
@@ -103,16 +99,16 @@ def parse_result_sets(
                     code_dictionary=entry_id_to_entry_code_dictionary,
                     entry_dictionary=entry_id_to_entry_entry_name_dictionary,
                     entry_to_school_dict=name_to_school_dict,
-                    scraped_data=scraped_results,
+                    scraped_results_index=scraped_results_index,
                 )
             else:
-                if not entry_id_to_entry_entry_name_dictionary and not entry_id_to_entry_code_dictionary:
+                if not event_has_entries:
                     logging.warning(
                         f"No codebreaker for this event, must use scraped data."
                     )
                     debate_final_results = get_debate_or_congress_scraped_results(
                         event=event,
-                        scraped_data=scraped_results,
+                        scraped_results_index=scraped_results_index,
                     )
                 else:
                     debate_final_results = get_debate_or_congress_results(
@@ -120,7 +116,7 @@ def parse_result_sets(
                         code_dictionary=entry_id_to_entry_code_dictionary,
                         entry_dictionary=entry_id_to_entry_entry_name_dictionary,
                         entry_to_school_dict=name_to_school_dict,
-                        scraped_data=scraped_results,
+                        scraped_results_index=scraped_results_index,
                         event_type=event["type"],
                     )
             for debate_final_result in debate_final_results:
@@ -151,10 +147,7 @@ def parse_result_sets(
                 tournament_results.append(speech_final_place_result)
 
         # If Final Places is published as a result set in the official API data AND codes are broken...
-        if (
-            "Final Places" in all_result_set_labels
-            and len(entry_id_to_entry_entry_name_dictionary) > 0
-        ):
+        if "Final Places" in all_result_set_labels and event_has_entries:
             # Then grab that result set and pass it to the designated parsing function
             logging.debug(f"Parsing Final Places in {event['name']}")
             final_results_result_set = [
@@ -175,17 +168,14 @@ def parse_result_sets(
             )
             for speech_final_place_result in speech_final_place_results:
                 tournament_results.append(speech_final_place_result)
-        elif (
-            "Final Places" in all_result_set_labels
-            and len(entry_id_to_entry_entry_name_dictionary) == 0
-        ):
+        elif "Final Places" in all_result_set_labels and not event_has_entries:
             # Use scraped data to generate the speech_final_place_results since the API data is missing entry names
             logging.debug(
                 f"Parsing Final Places from scraped data in {event['name']} due to missing entry names in API data"
             )
             speech_final_place_results = get_speech_results_from_scraped_final_places(
                 event_name=event["name"],
-                scraped_results=scraped_results,
+                scraped_results_index=scraped_results_index,
             )
             for speech_final_place_result in speech_final_place_results:
                 tournament_results.append(speech_final_place_result)
@@ -0,0 +1,154 @@
+from datetime import datetime
+import re
+import logging
+from .get_sweepstakes_string import get_sweepstakes_string
+
+ELIMS_DESCRIPTION = """'Doubles' refers to the Round of 32 (also known as double-octofinals), 'Octos' refers to the Round of 16 (octofinals), and 'Quarters' refers to the Round of 8 (quarterfinals), respectively. Use these terms to describe the elimination round a debater reached.
+            """
+ABBREVIATION_DESCRIPTIONS = {
+    "PF": "PF is an abbreviation for Public Forum, a 2-on-2 style of debate.",
+    "LD": "LD is an abbreviation for Lincoln-Douglas, a 1-on-1 style of debate.",
+    "CX": "CX is an abbreviation for Cross-examination (aka Policy), a 2-on-2 style of debate.",
+}
+# Glossary entries in the order they're added when several first show up in the same data string
+GLOSSARY = [("elims", ELIMS_DESCRIPTION)] + list(ABBREVIATION_DESCRIPTIONS.items())
+GLOSSARY_TOKEN_PATTERN = re.compile(r"Doubles|Octos|Quarters|Semis|PF|LD|CX")
+ELIMS_TOKENS = {"Doubles", "Octos", "Quarters", "Semis"}
+
+DEBATE_CONTEXT = """Results may include round-by-round results, delimited by a "|" character to demarcate each ballot.
+These results will include a W or L or B to indicate a win or a loss or bye.
+They may also include a speaker point score, out of a maximum of 30 speaker points (anything above 29 is excellent), or 60 for partnered events (58+ is excellent). Avoid referencing speaker point scores from individual rounds unless necessary. If referencing speaker points, mention that the score is out of 30. Ignore any value above 30.
+
+Congress and speech events do not have speaker points. Only debate has speaker points.
+    """
+SPEECH_CONTEXT = """Speech events involve acting, prepared speeches, and improvisational speeches.
+
+Results may include round-by-round results, which represent how a student was ranked in a given room of competition (lower is better; 1 is best). You can reference these when summarizing an individual's performance.
+
+Some round-by-round results will have multiple scores: these represent scores from a panel of several judges, as opposed to a single judge. The total rank is in parentheses; again, lower is better.
+If a student receives all 1s from a panel of judges, that can be called out as a "picket fence", which is a positive achievement in speech.
+    """
+
+
+class PromptHeaderTemplate:
+    """
+    The tournament-level part of the LLM prompt header, compiled once per tournament.
+
+    Everything that is the same for every school (dates, NSDA qualifier context, state detail, debate/speech
+    instructions, the data header) is built in the constructor; render() only adds the school name, sweepstakes line,
+    judge thanks, and the glossary for terms that appear in that school's data.
+    """
+
+    def __init__(
+        self,
+        tournament_data,
+        school_count,
+        entry_dictionary,
+        header_string,
+        default_qualifier_count: int,
+        state_count=1,
+        has_speech=False,
+        has_debate=False,
+        context="",
+    ):
+        self.tournament_data = tournament_data
+        self.school_count = school_count
+        start_date = datetime.strptime(
+            tournament_data["start"].split(" ")[0], "%Y-%m-%d"
+        ).strftime(
+            "%B %d, %Y",
+        )  # The start time is useless and inaccurate, just use the date
+        if state_count > 1:
+            state_detail = f" from {state_count} states."
+        else:
+            state_detail = "."
+        if re.search("District Tournament", tournament_data["name"]):
+            if default_qualifier_count == 1:
+                qualifier_count_string = "the top entry in each event qualifies"
+            else:
+                qualifier_count_string = f"the top {default_qualifier_count} placing entries in each event qualify"
+            # TODO - Be more precise here about how many qualify.
+            nsda_context = f"This tournament is an NSDA national qualifier; {qualifier_count_string} to this year's National Speech and Debate Tournament. The remaining competitors are alternate qualifiers in case qualifiers cannot attend Nationals."
+        else:
+            nsda_context = ""
+        # The basic prompt mentions the school twice, so it's kept as the text around those two spots
+        self.intro_parts = [
+            f"""The following data represents results of a team's performance at a speech and debate tournament called {tournament_data["name"]} held in {tournament_data["city"]} ({tournament_data["state"]}) on {start_date}. {nsda_context} {context}
+    
+The tournament was attended by {len(entry_dictionary)} student entries and {school_count} schools{state_detail} Include this context in the article.
+
+Write a 4 paragraph summary for the """,
+            """ speech and debate team social media feed. Use as many student names of """,
+            """ students as reasonable. Keep the tone factual, professional, concise, and positive. Avoid commenting on negative results. Selectively include individuals' rankings, wins, and placement out of the total number of entries, but prioritize names and final places. Do not prepend paragraphs with labels like 'Paragraph 1'.
+
+The presence of a "Final Places" result does not mean a student made the final round; it just indicates their overall placement in the tournament. 
+
+ONLY INCLUDE RESULTS FROM THE RESULTS DATA. DO NOT INCLUDE ANY RESULTS THAT DO NOT APPEAR IN RESULT_DATA.
+    """,
+        ]
+        self.has_sweepstakes = "sweepstakes" in tournament_data and bool(
+            tournament_data["sweepstakes"]
+        )
+        self.suffix = []
+        if has_debate:
+            self.suffix.append(DEBATE_CONTEXT)
+        if has_speech:
+            self.suffix.append(SPEECH_CONTEXT)
+        # Add the data header string to tell LLM what data is in each column
+        self.suffix.append("<result_data>")
+        self.suffix.append(header_string)
+
+    @staticmethod
+    def glossary(data_strings):
+        """
+        Returns the glossary descriptions for debate terms found in the data strings, in order of first appearance.
+        """
+        first_seen = {}
+        for index, data_string in enumerate(data_strings):
+            for token in GLOSSARY_TOKEN_PATTERN.findall(data_string):
+                term = "elims" if token in ELIMS_TOKENS else token
+                first_seen.setdefault(term, index)
+            if len(first_seen) == len(GLOSSARY):
+                break
+        return [
+            description
+            for _, _, description in sorted(
+                (first_seen[term], order, description)
+                for order, (term, description) in enumerate(GLOSSARY)
+                if term in first_seen
+            )
+        ]
+
+    def render(
+        self,
+        school_name,
+        short_school_name,
+        data_strings,
+        judge_map={},
+    ):
+        """
+        Returns a list of strings with LLM prompt pieces for one school, ending with the data header.
+        """
+        chat_gpt_payload_list = [school_name.join(self.intro_parts)]
+
+        # Add sweepstakes results
+        if self.has_sweepstakes:
+            logging.info("Found sweepstakes data!")
+            sweepstakes_string = get_sweepstakes_string(
+                sweepstakes_data=self.tournament_data["sweepstakes"],
+                school_name=short_school_name,
+                school_count=self.school_count,
+            )
+            chat_gpt_payload_list.append(sweepstakes_string)
+
+        # Thank judges, if published judge list exists
+        if judge_map:
+            judge_list = ", ".join(judge_map.get(short_school_name, []))
+            chat_gpt_payload_list.append(
+                f"At the end of the article, thank these individuals for volunteering to judge for the tournament (there wouldn't be a tournament without them!): {judge_list}"
+            )
+
+        # Add context if Claude needs to know about debate or speech terms
+        chat_gpt_payload_list += self.glossary(data_strings)
+        chat_gpt_payload_list += self.suffix
+        return chat_gpt_payload_list
@@ -0,0 +1,82 @@
+import numpy as np
+
+
+def competition_ranks(sort_keys, descending=None):
+    """
+    Tie-aware ranks for every entry in a result set, computed in one vectorized pass.
+
+    sort_keys is a list of key columns, most important first (eg. [round_reached, wins]); each column has one
+    number per entry. descending has one bool per column -- True when a higher value is better. Defaults to all
+    ascending, like places.
+
+    Returns a numpy array of ranks in the input order. Entries tied on every key share the best rank, and the
+    next entry skips ahead ("1224" ranking): [3 wins, 3 wins, 1 win] -> [1, 1, 3].
+    """
+    columns = [np.asarray(column, dtype=float) for column in sort_keys]
+    entry_count = len(columns[0]) if columns else 0
+    if entry_count == 0:
+        return np.zeros(0, dtype=int)
+    if descending is None:
+        descending = [False] * len(columns)
+    columns = [
+        -column if is_descending else column
+        for column, is_descending in zip(columns, descending)
+    ]
+    # lexsort treats the LAST key as the primary one, and is stable so ties keep their input order
+    order = np.lexsort(columns[::-1])
+    sorted_columns = np.stack([column[order] for column in columns])
+    starts_new_tie_group = np.ones(entry_count, dtype=bool)
+    starts_new_tie_group[1:] = np.any(
+        sorted_columns[:, 1:] != sorted_columns[:, :-1], axis=0
+    )
+    positions = np.arange(1, entry_count + 1)
+    sorted_ranks = np.maximum.accumulate(np.where(starts_new_tie_group, positions, 0))
+    ranks = np.empty(entry_count, dtype=int)
+    ranks[order] = sorted_ranks
+    return ranks
+
+
+def percentiles_from_ranks(ranks, total_entries):
+    """
+    Percentile for each rank out of total_entries: 1st place is 100, and each place below costs 100/total_entries.
+    total_entries may be a single count or one count per entry. Returns a numpy array of ints.
+    """
+    ranks = np.asarray(ranks, dtype=float)
+    total_entries = np.maximum(np.asarray(total_entries, dtype=float), 1)
+    return np.trunc(100 - (100 * (ranks - 1)) / total_entries).astype(int)
+
+
+def rank_result_set(sort_keys, descending=None, total_entries: int = None):
+    """
+    Rank a whole result set at once.
+
+    Returns 2 lists in a tuple, both in the input order and made of plain ints (so they serialize to JSON):
+    1. Each entry's tie-aware rank (see competition_ranks)
+    2. Each entry's percentile, out of total_entries (defaults to the number of entries ranked)
+    """
+    ranks = competition_ranks(sort_keys, descending)
+    if total_entries is None:
+        total_entries = len(ranks)
+    return ranks.tolist(), percentiles_from_ranks(ranks, total_entries).tolist()
+
+
+def percentiles_for_places(places, total_entries):
+    """
+    Like percentiles_from_ranks, but for places as published (ints or numeric strings). Returns a list of ints;
+    places that aren't numbers (eg. "TBD"), or any place when total_entries is 0, get a percentile of 0.
+    """
+    numeric_places = []
+    for place in places:
+        try:
+            numeric_places.append(float(place))
+        except (TypeError, ValueError):
+            numeric_places.append(np.nan)
+    if not numeric_places or not total_entries:
+        return [0] * len(numeric_places)
+    numeric_places = np.asarray(numeric_places)
+    is_numeric = ~np.isnan(numeric_places)
+    percentiles = np.zeros(len(numeric_places), dtype=int)
+    percentiles[is_numeric] = percentiles_from_ranks(
+        numeric_places[is_numeric], total_entries
+    )
+    return percentiles.tolist()
@@ -0,0 +1,35 @@
+from collections import Counter
+
+
+def remove_duplicate_prelim_seeds(results: list[dict]):
+    """
+    Remove Prelim Seeds rows that duplicate a Final Places row (same school, entry name, and rank).
+    Final Places always wins, and each Final Places row cancels out at most one Prelim Seeds row.
+
+    Runs in a single pass over the whole tournament's results, so it can happen once before grouping by school.
+    Returns a new list in the original order; the input list is not modified.
+    """
+    final_places_counts = Counter(
+        (result["school_name"], result["entry_name"], result["rank"])
+        for result in results
+        if result and result["result_set"] == "Final Places"
+    )
+    if not final_places_counts:
+        return list(results)
+    # When several Prelim Seeds rows match, drop the highest-percentile ones first (the order they'd be seen in a school's sorted results)
+    rows_to_remove = set()
+    prelim_seed_rows = sorted(
+        (
+            result
+            for result in results
+            if result and result["result_set"] == "Prelim Seeds"
+        ),
+        key=lambda x: float(x["percentile"]),
+        reverse=True,
+    )
+    for result in prelim_seed_rows:
+        key = (result["school_name"], result["entry_name"], result["rank"])
+        if final_places_counts[key] > 0:
+            final_places_counts[key] -= 1
+            rows_to_remove.add(id(result))
+    return [result for result in results if id(result) not in rows_to_remove]
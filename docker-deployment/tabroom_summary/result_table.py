@@ -0,0 +1,144 @@
+import sys
+
+RESULT_FIELDS = (
+    "event_name",
+    "event_type",
+    "result_set",
+    "entry_name",
+    "entry_code",
+    "school_name",
+    "rank",
+    "total_entries",
+    "round_reached",
+    "percentile",
+    "place",
+    "results_by_round",
+)
+RESULT_FIELD_SET = frozenset(RESULT_FIELDS)
+# Columns with only a handful of distinct values per tournament share one string object each
+INTERNED_FIELDS = frozenset(["event_name", "event_type", "result_set", "school_name"])
+_MISSING = object()
+
+
+class ResultRecord:
+    """
+    A single result row with a fixed schema (RESULT_FIELDS).
+
+    Behaves like the result dicts it replaces -- record["percentile"], record.get(...), "rank" in record, keys() and
+    item assignment all work -- but without a per-row dict. Fields the row never had stay unset and read as missing,
+    same as an absent dict key. Keys outside the schema are kept in a small overflow dict.
+    """
+
+    __slots__ = RESULT_FIELDS + ("extra",)
+
+    def __init__(self, fields: dict = None):
+        self.extra = None
+        for key, value in (fields or {}).items():
+            self[key] = value
+
+    def __getitem__(self, key):
+        if key in RESULT_FIELD_SET:
+            value = getattr(self, key, _MISSING)
+            if value is _MISSING:
+                raise KeyError(key)
+            return value
+        if self.extra is None:
+            raise KeyError(key)
+        return self.extra[key]
+
+    def __setitem__(self, key, value):
+        if key in RESULT_FIELD_SET:
+            if key in INTERNED_FIELDS and type(value) is str:
+                value = sys.intern(value)
+            setattr(self, key, value)
+            return
+        if self.extra is None:
+            self.extra = {}
+        self.extra[key] = value
+
+    def __contains__(self, key):
+        if key in RESULT_FIELD_SET:
+            return hasattr(self, key)
+        return self.extra is not None and key in self.extra
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        keys = [field for field in RESULT_FIELDS if hasattr(self, field)]
+        if self.extra:
+            keys.extend(self.extra.keys())
+        return keys
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def to_dict(self):
+        return dict(self.items())
+
+    def __repr__(self):
+        return f"ResultRecord({self.to_dict()!r})"
+
+
+def sort_by_percentile(records, reverse: bool = True):
+    """
+    Returns a new list of records sorted by percentile (highest first by default).
+    """
+    return sorted(records, key=lambda x: float(x["percentile"]), reverse=reverse)
+
+
+class ResultTable:
+    """
+    All of a tournament's results as compact ResultRecords.
+
+    Result dicts are converted as they're added, so the full tournament is never held as a list of dicts.
+    """
+
+    def __init__(self, results=None):
+        self.records = []
+        if results:
+            self.extend(results)
+
+    def append(self, result):
+        # Some parsers emit empty placeholders -- they were always skipped downstream
+        if not isinstance(result, ResultRecord):
+            if not result:
+                return
+            result = ResultRecord(result)
+        self.records.append(result)
+
+    def extend(self, results):
+        for result in results:
+            self.append(result)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __len__(self):
+        return len(self.records)
+
+    def __getitem__(self, index):
+        return self.records[index]
+
+    def group_by_school(self, school_short_name_dict: dict):
+        """
+        Returns a dict keyed by short school name, containing a list of records for that school.
+        Each distinct school name is resolved once, not once per row.
+        """
+        grouped_data = {}
+        group_by_long_name = {}
+        for record in self.records:
+            school_long_name = record["school_name"]
+            group = group_by_long_name.get(school_long_name)
+            if group is None:
+                # Assume the long name is the short name if it's not in the dict
+                school_short_name = school_short_name_dict.get(
+                    school_long_name, school_long_name
+                )
+                group = grouped_data.setdefault(school_short_name, [])
+                group_by_long_name[school_long_name] = group
+            group.append(record)
+        return grouped_data
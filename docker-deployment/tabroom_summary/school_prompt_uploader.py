@@ -0,0 +1,120 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from .storage_codec import CONTENT_ENCODING, compress
+from .tournament_manifest import TournamentManifest
+
+DEFAULT_UPLOAD_WORKERS = 8
+# Prompts waiting to be uploaded are held in memory, so don't let rendering get too far ahead of the uploads
+DEFAULT_MAX_PENDING_UPLOADS = 32
+PROMPT_FILE_NAMES = {
+    "gpt_prompt": "gpt_prompt.txt",
+    "numbered_list_prompt": "numbered_list_prompt.txt",
+}
+
+
+class SchoolPromptUploader:
+    """
+    Uploads each school's prompts to S3 on a small thread pool, as soon as they're handed over with submit().
+
+    At most max_pending uploads are queued or in flight at once; submit() blocks until there's room, so prompt
+    rendering and uploading overlap without the whole tournament's prompts piling up in the queue.
+    A failed upload doesn't stop the others -- wait() reports every failure once all uploads have finished.
+    If a manifest is given, each successful upload is recorded in it.
+    """
+
+    def __init__(
+        self,
+        s3_client,
+        bucket_name: str,
+        tournament_id: str,
+        max_workers: int = DEFAULT_UPLOAD_WORKERS,
+        max_pending: int = DEFAULT_MAX_PENDING_UPLOADS,
+        manifest: TournamentManifest = None,
+    ):
+        self.s3_client = s3_client
+        self.bucket_name = bucket_name
+        self.tournament_id = tournament_id
+        self.manifest = manifest
+        self.executor = ThreadPoolExecutor(
+            max_workers=max(max_workers, 1), thread_name_prefix="prompt-upload"
+        )
+        self.pending_slots = threading.BoundedSemaphore(max(max_pending, 1))
+        self.lock = threading.Lock()
+        self.futures = []
+        # [(<S3 key>, <exception>), ...]
+        self.failures = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        # Let in-flight uploads finish even if prompt generation failed, so nothing is left half-written
+        self.executor.shutdown(wait=True)
+
+    def submit(self, short_school_name: str, school_prompts: dict):
+        """
+        Queue an upload for each prompt in a school's prompt dict (see generate_llm_prompts).
+        """
+        for prompt_name, file_name in PROMPT_FILE_NAMES.items():
+            if prompt_name not in school_prompts:
+                continue
+            key = f"{self.tournament_id}/{short_school_name}/{file_name}"
+            self.pending_slots.acquire()
+            try:
+                future = self.executor.submit(
+                    self._upload,
+                    short_school_name,
+                    prompt_name,
+                    key,
+                    school_prompts[prompt_name],
+                )
+            except Exception:
+                self.pending_slots.release()
+                raise
+            future.add_done_callback(lambda _: self.pending_slots.release())
+            self.futures.append(future)
+
+    def _upload(self, short_school_name: str, prompt_name: str, key: str, prompt: str):
+        try:
+            # Prompts are stored gzipped; the website Lambda decompresses them on read
+            body = compress(prompt)
+            self.s3_client.put_object(
+                Body=body,
+                Bucket=self.bucket_name,
+                Key=key,
+                ContentEncoding=CONTENT_ENCODING,
+                ContentType="text/plain; charset=utf-8",
+            )
+        except Exception as ex:
+            logging.error(f"Failed to upload {key}: {repr(ex)}")
+            with self.lock:
+                self.failures.append((key, ex))
+            return
+        if self.manifest is not None:
+            self.manifest.add_artifact(
+                short_school_name=short_school_name,
+                prompt_name=prompt_name,
+                key=key,
+                prompt=prompt,
+                stored_size=len(body),
+            )
+
+    def wait(self):
+        """
+        Block until every submitted upload has finished.
+
+        Returns the number of objects uploaded. Raises a RuntimeError listing the failed keys if any upload failed.
+        """
+        for future in self.futures:
+            future.result()
+        if self.failures:
+            failed_keys = ", ".join(key for key, _ in self.failures)
+            raise RuntimeError(
+                f"{len(self.failures)} of {len(self.futures)} prompt uploads failed: {failed_keys}"
+            )
+        logging.info(f"Uploaded {len(self.futures)} prompts to {self.bucket_name}")
+        return len(self.futures)
@@ -0,0 +1,58 @@
+import logging
+
+
+class ScrapedResultsIndex:
+    """
+    Index over the scraped results (one dict per event, as returned by tabroom_scrape), built once per tournament.
+
+    events: {<event name>: <scraped event dict>}
+    result_sets_by_type: {(<event name>, <result set type>): [<scraped result set>, ...]}
+
+    Every lookup is a dict access, and an event that wasn't scraped is logged and treated as having no results
+    instead of raising.
+    """
+
+    def __init__(self, scraped_results: list = None):
+        self.events = {}
+        self.result_sets_by_type = {}
+        for scraped_event in scraped_results or []:
+            self.add_event(scraped_event)
+
+    def add_event(self, scraped_event: dict):
+        event_name = scraped_event.get("event_name", "")
+        if event_name in self.events:
+            logging.warning(
+                f"Multiple scraped results for event {event_name} -- using the first one"
+            )
+            return
+        self.events[event_name] = scraped_event
+        for result_set in scraped_event.get("result_list", []):
+            # Result sets that failed to parse are saved as empty dicts/lists
+            if not result_set:
+                continue
+            key = (event_name, result_set.get("result_set_type", ""))
+            self.result_sets_by_type.setdefault(key, []).append(result_set)
+
+    def __contains__(self, event_name):
+        return event_name in self.events
+
+    def __len__(self):
+        return len(self.events)
+
+    def event(self, event_name: str):
+        """
+        Returns the scraped dict for an event, or None (with a warning) if the event wasn't scraped.
+        """
+        scraped_event = self.events.get(event_name)
+        if scraped_event is None:
+            logging.warning(f"No scraped results found for event {event_name}")
+        return scraped_event
+
+    def result_sets(self, event_name: str, result_set_type: str):
+        """
+        Returns a list of the event's scraped result sets of the given type (eg. "Final Places", "Speaker Awards").
+        The list is empty if the event wasn't scraped or has no result sets of that type.
+        """
+        if self.event(event_name) is None:
+            return []
+        return self.result_sets_by_type.get((event_name, result_set_type), [])
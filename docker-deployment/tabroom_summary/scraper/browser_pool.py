@@ -0,0 +1,142 @@
+import copy
+import logging
+import queue
+import threading
+from contextlib import contextmanager
+from tempfile import mkdtemp
+from selenium.common.exceptions import WebDriverException
+from .create_browser import create_browser
+from .log_in_to_tabroom import log_in_to_tabroom
+from .navigation_cache import NavigationCache, NavigationStats
+from .page_cache import PageCache
+
+DEFAULT_BROWSER_POOL_SIZE = 3  # Tabroom tolerates about 3 concurrent sessions per login
+# Arguments that must be unique per Chrome process, or the sessions will trample each other
+PER_SESSION_CHROME_ARGUMENTS = [
+    "--remote-debugging-port=",
+    "--user-data-dir=",
+    "--data-path=",
+    "--disk-cache-dir=",
+]
+
+
+def chrome_options_for_session(chrome_options, session_index: int):
+    """
+    The first session uses the options as given. Any additional sessions get a copy with their own profile directories
+    and debugging port, so several Chromes can run side by side in the same Lambda.
+    """
+    if chrome_options is None or session_index == 0:
+        return chrome_options
+    session_options = copy.deepcopy(chrome_options)
+    original_arguments = list(session_options.arguments)
+    session_options.arguments.clear()
+    for argument in original_arguments:
+        if argument.startswith("--remote-debugging-port="):
+            port = int(argument.split("=", 1)[1])
+            session_options.add_argument(
+                f"--remote-debugging-port={port + session_index}"
+            )
+        elif any(
+            argument.startswith(prefix) for prefix in PER_SESSION_CHROME_ARGUMENTS
+        ):
+            session_options.add_argument(f"{argument.split('=', 1)[0]}={mkdtemp()}")
+        else:
+            session_options.add_argument(argument)
+    return session_options
+
+
+class BrowserPool:
+    """
+    A fixed-size pool of logged-in browser sessions, each wrapped in a NavigationCache.
+
+    Sessions are started (and logged in) once, handed out one at a time with session(), and returned to the pool when
+    the caller is done. A session that no longer responds is quit and replaced before it is handed out again, so one
+    crashed Chrome does not take down the rest of the scrape.
+    """
+
+    def __init__(
+        self,
+        size: int = DEFAULT_BROWSER_POOL_SIZE,
+        scrape_backend: str = "chrome",
+        chrome_options=None,
+        chrome_service=None,
+        page_cache: PageCache = None,
+    ):
+        self.size = max(size, 1)
+        self.scrape_backend = scrape_backend
+        self.chrome_options = chrome_options
+        self.chrome_service = chrome_service
+        self.page_cache = page_cache
+        # Shared by every session so we can report the reloads avoided across the whole scrape
+        self.navigation_stats = NavigationStats()
+        self.available = queue.Queue()
+        # session index -> browser, so close() can find sessions that are checked out
+        self.browsers = {}
+        self.lock = threading.Lock()
+        for session_index in range(self.size):
+            self.available.put((session_index, self._start_session(session_index)))
+
+    def _start_session(self, session_index: int):
+        logging.info(
+            f"Starting {self.scrape_backend} browser session {session_index + 1}/{self.size}"
+        )
+        browser = create_browser(
+            scrape_backend=self.scrape_backend,
+            chrome_options=chrome_options_for_session(
+                self.chrome_options, session_index
+            ),
+            chrome_service=self.chrome_service,
+            page_cache=self.page_cache,
+        )
+        # Logging in to Tabroom to access protected results pages
+        log_in_to_tabroom(browser)
+        # Skip reloading a page the session is already on
+        browser = NavigationCache(
+            browser,
+            stats=self.navigation_stats,
+            page_cache=self.page_cache,
+        )
+        with self.lock:
+            self.browsers[session_index] = browser
+        return browser
+
+    def _replace_session(self, session_index: int, browser):
+        logging.warning(
+            f"Browser session {session_index + 1} is unhealthy; replacing it"
+        )
+        try:
+            browser.quit()
+        except Exception as ex:
+            logging.debug(f"Error quitting unhealthy browser session: {repr(ex)}")
+        return self._start_session(session_index)
+
+    @staticmethod
+    def is_healthy(browser):
+        try:
+            browser.current_url
+            return True
+        except WebDriverException:
+            return False
+
+    @contextmanager
+    def session(self):
+        """
+        Borrow a browser session for the duration of the with-block. Blocks until one is free.
+        """
+        session_index, browser = self.available.get()
+        try:
+            if not self.is_healthy(browser):
+                browser = self._replace_session(session_index, browser)
+            yield browser
+        finally:
+            self.available.put((session_index, browser))
+
+    def close(self):
+        with self.lock:
+            browsers = list(self.browsers.values())
+            self.browsers = {}
+        for browser in browsers:
+            try:
+                browser.quit()
+            except Exception as ex:
+                logging.debug(f"Error closing browser session: {repr(ex)}")
@@ -0,0 +1,104 @@
+import boto3
+import json
+import logging
+import os
+import tempfile
+from concurrent import futures
+from ..storage_codec import CONTENT_ENCODING, compress, decompress
+
+
+class CheckpointStore:
+    """
+    Per-event scrape results saved under {tournament_id}/temp_results/ so an interrupted scrape can resume where it
+    left off -- on disk when running locally, in the data bucket when running in Lambda.
+
+    load_completed() learns which events are done from a single listing and fetches them concurrently;
+    record() saves one event's result in a single atomic write.
+    """
+
+    def __init__(
+        self,
+        tournament_id,
+        data_bucket: str = None,
+        max_concurrency: int = 8,
+    ):
+        self.tournament_id = tournament_id
+        self.data_bucket = data_bucket or os.environ.get("DATA_BUCKET_NAME")
+        self.max_concurrency = max_concurrency
+        self.prefix = f"{tournament_id}/temp_results/"
+        self.use_s3 = os.environ.get("AWS_LAMBDA_FUNCTION_NAME") is not None
+        if self.use_s3:
+            self.s3_client = boto3.client("s3")
+
+    @staticmethod
+    def checkpoint_name(event_name: str):
+        return event_name.replace(":", "")  # escape colons
+
+    def key(self, event_name: str):
+        return f"{self.prefix}{self.checkpoint_name(event_name)}.json"
+
+    def list_completed_keys(self):
+        if self.use_s3:
+            keys = []
+            paginator = self.s3_client.get_paginator("list_objects_v2")
+            for page in paginator.paginate(Bucket=self.data_bucket, Prefix=self.prefix):
+                keys.extend(obj["Key"] for obj in page.get("Contents", []))
+            return keys
+        if not os.path.isdir(self.prefix):
+            return []
+        return [
+            f"{self.prefix}{file_name}"
+            for file_name in os.listdir(self.prefix)
+            if file_name.endswith(".json")
+        ]
+
+    def read(self, key: str):
+        if self.use_s3:
+            body = self.s3_client.get_object(Bucket=self.data_bucket, Key=key)[
+                "Body"
+            ].read()
+        else:
+            with open(key, "rb") as f:
+                body = f.read()
+        return json.loads(decompress(body))
+
+    def load_completed(self):
+        """
+        Returns a dict of checkpoint name (the event name with colons removed) to that event's saved results.
+        Checkpoints that can't be read are left out, so those events get scraped again.
+        """
+        completed = {}
+        keys = self.list_completed_keys()
+        if not keys:
+            return completed
+        with futures.ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            future_to_key = {executor.submit(self.read, key): key for key in keys}
+            for future in futures.as_completed(future_to_key):
+                key = future_to_key[future]
+                checkpoint_name = key[len(self.prefix) : -len(".json")]
+                try:
+                    completed[checkpoint_name] = future.result()
+                except Exception as ex:
+                    logging.warning(f"Ignoring unreadable checkpoint {key}: {repr(ex)}")
+        logging.info(f"Resuming with {len(completed)} events already scraped")
+        return completed
+
+    def record(self, event_name: str, event_result: dict):
+        key = self.key(event_name)
+        body = compress(json.dumps(event_result))
+        if self.use_s3:
+            # A single PUT is atomic -- readers see the old object or the new one, never a partial write
+            self.s3_client.put_object(
+                Body=body,
+                Bucket=self.data_bucket,
+                Key=key,
+                ContentEncoding=CONTENT_ENCODING,
+                ContentType="application/json",
+            )
+            return
+        os.makedirs(self.prefix, exist_ok=True)
+        # Write to a temp file and swap it in so a crash never leaves a half-written checkpoint
+        fd, temp_path = tempfile.mkstemp(dir=self.prefix)
+        with os.fdopen(fd, "wb") as f:
+            f.write(body)
+        os.replace(temp_path, key)
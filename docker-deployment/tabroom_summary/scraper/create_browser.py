@@ -0,0 +1,33 @@
+from selenium import webdriver
+from .http_browser import HttpBrowser
+from .page_cache import PageCache
+
+SCRAPE_BACKENDS = ["chrome", "http", "replay"]
+
+
+def create_browser(
+    scrape_backend: str = "chrome",
+    chrome_options=None,
+    chrome_service=None,
+    page_cache: PageCache = None,
+):
+    """
+    Start a browser session for the requested scrape backend.
+    "chrome" drives headless Chrome through Selenium; "http" fetches pages over a pooled HTTP session and parses them
+    in-process; "replay" serves every page from the page cache without touching the network.
+    All expose the same find_element(s)/get API to the parsers.
+    """
+    if scrape_backend in ["http", "replay"]:
+        return HttpBrowser(page_cache=page_cache)
+    if scrape_backend != "chrome":
+        raise ValueError(
+            f"Unknown scrape backend {scrape_backend}; expected one of {SCRAPE_BACKENDS}"
+        )
+    browser = webdriver.Chrome(
+        options=chrome_options,
+        service=chrome_service,
+    )
+    # Extend timeouts for Harvard
+    browser.timeouts.page_load = 60 * 30
+    browser.timeouts.script = 60 * 30
+    return browser
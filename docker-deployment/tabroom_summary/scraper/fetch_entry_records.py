@@ -0,0 +1,151 @@
+import logging
+import requests
+import threading
+import time
+from concurrent import futures
+from .http_browser import create_http_session
+from .page_cache import PageCache, PageNotCachedError
+from .scrape_entry_record import parse_entry_record
+from .static_page import parse_static_page
+
+# Defaults are deliberately gentle -- Tabroom is a volunteer-run site
+DEFAULT_REQUESTS_PER_SECOND = 3.0
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_MAX_RETRIES = 3
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket. Refills at `rate` tokens per second and holds at most `capacity` tokens,
+    so short bursts are allowed but the long-run request rate never exceeds `rate`.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1):
+        self.rate = rate
+        self.capacity = max(capacity, 1)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated_at) * self.rate
+                )
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_time = (1 - self.tokens) / self.rate
+            time.sleep(wait_time)
+
+
+def fetch_entry_record(
+    session: requests.Session,
+    entry_record_url: str,
+    token_bucket: TokenBucket,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    timeout: int = 60,
+    page_cache: PageCache = None,
+):
+    """
+    Fetch and parse one entry record page. Every attempt (including retries) waits for a token from the shared bucket.
+    Retries back off exponentially and honor Retry-After on 429/5xx responses.
+    Fresh cached pages skip the network (and the bucket) entirely; stale ones are revalidated with a conditional GET.
+    """
+    cache_entry = page_cache.get(entry_record_url) if page_cache else None
+    if cache_entry is not None and page_cache.is_fresh(cache_entry):
+        return parse_entry_record(
+            parse_static_page(cache_entry["html"], cache_entry["final_url"])
+        )
+    if page_cache is not None and page_cache.replay:
+        raise PageNotCachedError(f"{entry_record_url} is not in the page cache")
+    headers = PageCache.conditional_headers(cache_entry) if cache_entry else {}
+    for attempt in range(max_retries + 1):
+        token_bucket.acquire()
+        backoff = 2**attempt
+        try:
+            response = session.get(entry_record_url, timeout=timeout, headers=headers)
+        except requests.RequestException as ex:
+            logging.warning(
+                f"Error fetching {entry_record_url} (attempt {attempt + 1}): {repr(ex)}"
+            )
+            time.sleep(backoff)
+            continue
+        if response.status_code in RETRYABLE_STATUS_CODES:
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                backoff = max(backoff, int(retry_after))
+            logging.warning(
+                f"Got HTTP {response.status_code} for {entry_record_url}; retrying in {backoff} seconds"
+            )
+            time.sleep(backoff)
+            continue
+        if response.status_code == 304 and cache_entry is not None:
+            page_cache.touch(entry_record_url, cache_entry)
+            return parse_entry_record(
+                parse_static_page(cache_entry["html"], cache_entry["final_url"])
+            )
+        response.raise_for_status()
+        if page_cache is not None:
+            page_cache.put(
+                entry_record_url,
+                response.text,
+                final_url=response.url,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+        return parse_entry_record(parse_static_page(response.text, response.url))
+    raise RuntimeError(
+        f"Gave up on {entry_record_url} after {max_retries + 1} attempts"
+    )
+
+
+def fetch_entry_records(
+    entry_record_urls: list[str],
+    requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    session: requests.Session = None,
+    page_cache: PageCache = None,
+):
+    """
+    Fetch every entry record for an event at once, capped at max_concurrency requests in flight and
+    requests_per_second overall.
+
+    Returns a dict keyed by entry record URL, containing the parse_entry_record representation.
+    Records that still fail after retries are logged and left out.
+    """
+    entry_records = {}
+    unique_urls = list(dict.fromkeys(entry_record_urls))
+    if not unique_urls:
+        return entry_records
+    # Retries happen here (so they also respect the rate limit), not in the connection adapter
+    session = session or create_http_session(pool_size=max_concurrency, max_retries=0)
+    token_bucket = TokenBucket(rate=requests_per_second, capacity=max_concurrency)
+    start_time = time.monotonic()
+    with futures.ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        future_to_url = {
+            executor.submit(
+                fetch_entry_record,
+                session=session,
+                entry_record_url=url,
+                token_bucket=token_bucket,
+                max_retries=max_retries,
+                page_cache=page_cache,
+            ): url
+            for url in unique_urls
+        }
+        for future in futures.as_completed(future_to_url):
+            url = future_to_url[future]
+            try:
+                entry_records[url] = future.result()
+            except Exception as ex:
+                logging.error(f"Could not scrape entry record {url}: {repr(ex)}")
+    logging.info(
+        f"Fetched {len(entry_records)}/{len(unique_urls)} entry records in {time.monotonic() - start_time:.1f} seconds"
+    )
+    return entry_records
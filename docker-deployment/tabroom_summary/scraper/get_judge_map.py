@@ -4,6 +4,7 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver import Chrome
 from selenium.common.exceptions import NoSuchElementException
+from .snapshot_page import snapshot_page
 
 
 def get_judge_map(
@@ -41,7 +42,7 @@ def get_judge_map(
             "Error when attempting to load Judges page, probably because the tournament does not publish it."
         )
         return judge_map
-    judge_menu = browser.find_element(By.CLASS_NAME, "sidenote")
+    judge_menu = snapshot_page(browser).find_element(By.CLASS_NAME, "sidenote")
     judges_by_event = judge_menu.find_elements(By.CLASS_NAME, "odd")
     href_list = []
     for event in judges_by_event:
@@ -51,9 +52,11 @@ def get_judge_map(
 
     for href in href_list:
         browser.get(href)
+        # Judge lists can be long, so read them from a snapshot rather than cell-by-cell over WebDriver
+        page = snapshot_page(browser)
         # Get the indices for First/Last/School
         try:
-            header_table = browser.find_element(By.TAG_NAME, "thead")
+            header_table = page.find_element(By.TAG_NAME, "thead")
         except NoSuchElementException:
             logging.error(
                 "Error when attempting to load a specific judge page, probably because the tournament does not have any judges in this category."
@@ -72,7 +75,7 @@ def get_judge_map(
                 notable_header_indices[header_text] = int(header_index)
 
         try:
-            judge_table = browser.find_element(By.TAG_NAME, "tbody")
+            judge_table = page.find_element(By.TAG_NAME, "tbody")
         except NoSuchElementException:
             logging.error(
                 "Error when attempting to load a specific judge page, probably because the tournament does not have any judges in this category."
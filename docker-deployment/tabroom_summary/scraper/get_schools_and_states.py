@@ -2,6 +2,7 @@ import logging
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver import Chrome
+from .snapshot_page import snapshot_page
 
 
 def get_schools_and_states(tournament_id, browser: Chrome):
@@ -18,7 +19,7 @@ def get_schools_and_states(tournament_id, browser: Chrome):
             "Error when attempting to load Institutions in Attendance page, probably because the tournament does not publish it."
         )
         return school_set, state_set
-    columns = browser.find_elements(By.CLASS_NAME, "third")
+    columns = snapshot_page(browser).find_elements(By.CLASS_NAME, "third")
     for column in columns:
         schools = column.find_elements(By.CLASS_NAME, "fivesixth")
         for school in schools:
@@ -0,0 +1,138 @@
+import logging
+import requests
+from requests.adapters import HTTPAdapter
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+from urllib3.util.retry import Retry
+from .page_cache import PageCache, PageNotCachedError
+from .static_page import parse_static_page
+
+TABROOM_LOGIN_URL = "https://www.tabroom.com/user/login/login.mhtml"
+TABROOM_LOGIN_SAVE_URL = "https://www.tabroom.com/user/login/login_save.mhtml"
+
+
+def create_http_session(
+    pool_size: int = 10,
+    max_retries: int = 3,
+):
+    """
+    Returns a requests Session with a keep-alive connection pool and polite retries (backs off on 429 and 5xx responses).
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=1,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET", "HEAD"],
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=retry,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = (
+        "tabroom_auto_summarize (+https://tabroomsummary.com)"
+    )
+    return session
+
+
+class HttpBrowser:
+    """
+    A requests-backed stand-in for the subset of selenium.webdriver.Chrome that the scraper uses.
+
+    Pages are fetched over a pooled keep-alive session and parsed into a StaticPage, so every parser in this package
+    works unchanged and returns the same dict shapes as it would with Chrome.
+
+    If a PageCache is given, fresh cached pages are served without a request, stale ones are revalidated with a
+    conditional GET, and in replay mode pages only ever come from the cache.
+    """
+
+    def __init__(
+        self,
+        session: requests.Session = None,
+        timeout: int = 60,
+        page_cache: PageCache = None,
+    ):
+        self.session = session or create_http_session()
+        self.timeout = timeout
+        self.page_cache = page_cache
+        self.page = parse_static_page("", "about:blank")
+
+    @property
+    def replay(self):
+        return self.page_cache is not None and self.page_cache.replay
+
+    def get(self, url):
+        cache_entry = self.page_cache.get(url) if self.page_cache else None
+        if cache_entry is not None and self.page_cache.is_fresh(cache_entry):
+            self.page = parse_static_page(cache_entry["html"], cache_entry["final_url"])
+            return
+        if self.replay:
+            raise PageNotCachedError(f"{url} is not in the page cache")
+        headers = PageCache.conditional_headers(cache_entry) if cache_entry else {}
+        try:
+            response = self.session.get(url, timeout=self.timeout, headers=headers)
+        except requests.RequestException as ex:
+            # Surface network errors the same way Chrome does so the existing retry logic applies
+            raise WebDriverException(f"Failed to load {url}: {repr(ex)}") from ex
+        if response.status_code == 304 and cache_entry is not None:
+            self.page_cache.touch(url, cache_entry)
+            self.page = parse_static_page(cache_entry["html"], cache_entry["final_url"])
+            return
+        if response.status_code >= 400:
+            logging.warning(f"Got HTTP {response.status_code} when loading {url}")
+        elif self.page_cache:
+            self.page_cache.put(
+                url,
+                response.text,
+                final_url=response.url,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+        self.page = parse_static_page(response.text, response.url)
+
+    def login(self, username, password):
+        """
+        Log in the same way a browser would: grab the salt and SHA from the login form, then post the credentials.
+        """
+        self.get(TABROOM_LOGIN_URL)
+        login_data = {
+            "username": username,
+            "password": password,
+            "salt": self.find_element(By.NAME, "salt").get_attribute("value"),
+            "sha": self.find_element(By.NAME, "sha").get_attribute("value"),
+        }
+        response = self.session.post(
+            TABROOM_LOGIN_SAVE_URL,
+            data=login_data,
+            timeout=self.timeout,
+        )
+        self.page = parse_static_page(response.text, response.url)
+
+    @property
+    def current_url(self):
+        return self.page.current_url
+
+    @property
+    def page_source(self):
+        return self.page.page_source
+
+    def find_element(self, by=By.ID, value=None):
+        return self.page.find_element(by, value)
+
+    def find_elements(self, by=By.ID, value=None):
+        return self.page.find_elements(by, value)
+
+    def implicitly_wait(self, time_to_wait):
+        # Pages are fully loaded by the time get() returns, so there is nothing to wait for
+        pass
+
+    def quit(self):
+        self.session.close()
+
+    def close(self):
+        self.quit()
@@ -0,0 +1,73 @@
+from datetime import datetime, date
+from selenium.webdriver.common.by import By
+import boto3
+import json
+import logging
+from .http_browser import HttpBrowser, TABROOM_LOGIN_URL, TABROOM_LOGIN_SAVE_URL
+
+
+class DateTimeEncoder(json.JSONEncoder):
+    def default(self, obj):
+        if isinstance(obj, (datetime, date)):
+            return obj.isoformat()
+        return super().default(obj)
+
+
+def get_tabroom_credentials():
+    """
+    Pull Username and Password from Secrets Manager
+    """
+    secrets_client = boto3.client("secretsmanager", region_name="us-east-1")
+    tabroom_username = secrets_client.get_secret_value(SecretId="TABROOM_USERNAME").get(
+        "SecretString"
+    )
+    tabroom_password = secrets_client.get_secret_value(SecretId="TABROOM_PASSWORD").get(
+        "SecretString"
+    )
+    return tabroom_username, tabroom_password
+
+
+def log_in_to_tabroom(browser):
+    """
+    Logging in to Tabroom to access protected results pages. Works for both Chrome and HttpBrowser sessions.
+    """
+    if isinstance(browser, HttpBrowser) and browser.replay:
+        logging.info("Replaying cached pages; skipping Tabroom login")
+        return
+    tabroom_username, tabroom_password = get_tabroom_credentials()
+    if isinstance(browser, HttpBrowser):
+        browser.login(tabroom_username, tabroom_password)
+        return
+
+    # need to hit the login url to get the salt and SHA in order to pass those values in the login_save request
+    browser.get(TABROOM_LOGIN_URL)
+    salt = browser.find_element(By.NAME, "salt").get_attribute("value")
+    sha = browser.find_element(By.NAME, "sha").get_attribute("value")
+
+    login_data = {
+        "username": tabroom_username,
+        "password": tabroom_password,
+        "salt": salt,
+        "sha": sha,
+    }
+    # Send a post request to the login_save URL with the login data to authenticate the session
+    browser.execute_script(
+        """
+        function post(path, params) {
+            const form = document.createElement('form');
+            form.method = 'POST';
+            form.action = path;
+            for (const key in params) {
+                const hiddenField = document.createElement('input');
+                hiddenField.type = 'hidden';
+                hiddenField.name = key;
+                hiddenField.value = params[key];
+                form.appendChild(hiddenField);
+            }
+            document.body.appendChild(form);
+            form.submit();
+        }
+        post("%s", %s);
+        """
+        % (TABROOM_LOGIN_SAVE_URL, json.dumps(login_data, cls=DateTimeEncoder))
+    )
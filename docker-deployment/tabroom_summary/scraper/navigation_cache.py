@@ -0,0 +1,103 @@
+import logging
+import threading
+from .http_browser import HttpBrowser
+from .page_cache import PageCache
+from .static_page import StaticPage, parse_static_page
+
+
+class NavigationStats:
+    """
+    Thread-safe tally of page loads, shared by every browser session in a scrape.
+    """
+
+    def __init__(self):
+        self.page_loads = 0
+        self.reloads_avoided = 0
+        self.lock = threading.Lock()
+
+    def record(self, reload_avoided: bool):
+        with self.lock:
+            if reload_avoided:
+                self.reloads_avoided += 1
+            else:
+                self.page_loads += 1
+
+    def log_summary(self):
+        logging.info(
+            f"Loaded {self.page_loads} pages; skipped {self.reloads_avoided} reloads of a page that was already open"
+        )
+
+
+class NavigationCache:
+    """
+    Wraps a browser session so that get() on the URL it is already showing is a no-op, and the page snapshot is only
+    parsed once per navigation. Anything that could change the page (scripts, back/forward, refresh) clears the cache.
+    Every other attribute is passed straight through to the wrapped browser.
+
+    Given a PageCache, pages rendered by Chrome are written through to it so they can be replayed later.
+    (HttpBrowser reads and writes its own cache.)
+    """
+
+    def __init__(
+        self,
+        browser,
+        stats: NavigationStats = None,
+        page_cache: PageCache = None,
+    ):
+        self.browser = browser
+        self.stats = stats or NavigationStats()
+        self.page_cache = page_cache
+        self.loaded_url = None
+        self.cached_snapshot = None
+
+    def invalidate(self):
+        self.loaded_url = None
+        self.cached_snapshot = None
+
+    def get(self, url):
+        if url == self.loaded_url:
+            logging.debug(f"Already on {url}; skipping reload")
+            self.stats.record(reload_avoided=True)
+            return
+        # Clear first so a failed load is retried in full next time
+        self.invalidate()
+        self.browser.get(url)
+        self.loaded_url = url
+        self.stats.record(reload_avoided=False)
+        if self.page_cache is not None and not isinstance(self.browser, HttpBrowser):
+            self.page_cache.put(
+                url, self.page_source, final_url=self.browser.current_url
+            )
+
+    def snapshot(self) -> StaticPage:
+        if self.cached_snapshot is None:
+            if isinstance(self.browser, HttpBrowser):
+                self.cached_snapshot = self.browser.page
+            else:
+                self.cached_snapshot = parse_static_page(
+                    self.browser.page_source, self.browser.current_url
+                )
+        return self.cached_snapshot
+
+    @property
+    def page_source(self):
+        return self.snapshot().page_source
+
+    def execute_script(self, script, *args):
+        self.invalidate()
+        return self.browser.execute_script(script, *args)
+
+    def back(self):
+        self.invalidate()
+        return self.browser.back()
+
+    def forward(self):
+        self.invalidate()
+        return self.browser.forward()
+
+    def refresh(self):
+        self.invalidate()
+        return self.browser.refresh()
+
+    def __getattr__(self, name):
+        return getattr(self.browser, name)
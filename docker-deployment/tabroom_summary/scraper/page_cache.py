@@ -0,0 +1,144 @@
+import boto3
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from selenium.common.exceptions import WebDriverException
+from ..storage_codec import CONTENT_ENCODING, compress, decompress
+
+# Results rarely change once a tournament is over
+DEFAULT_PAGE_CACHE_TTL_SECONDS = 60 * 60 * 24
+
+
+class PageNotCachedError(WebDriverException):
+    """
+    Raised in replay mode when a page was never cached. Subclasses WebDriverException so the scraper's existing
+    error handling treats it like any other failed page load.
+    """
+
+
+class PageCache:
+    """
+    Raw page HTML for one tournament, keyed by URL and stored under {tournament_id}/page_cache/ -- on disk when running
+    locally, in the data bucket when running in Lambda.
+
+    Each entry looks like this:
+    {
+        "url": <requested URL>,
+        "final_url": <URL after redirects>,
+        "fetched_at": <epoch seconds of the last fetch or successful revalidation>,
+        "etag": <ETag header, if any>,
+        "last_modified": <Last-Modified header, if any>,
+        "html": <page source>
+    }
+
+    Entries younger than ttl_seconds are served as-is; older ones are revalidated with a conditional GET.
+    In replay mode every entry is served regardless of age, and nothing touches the network.
+    """
+
+    def __init__(
+        self,
+        tournament_id,
+        data_bucket: str = None,
+        ttl_seconds: int = DEFAULT_PAGE_CACHE_TTL_SECONDS,
+        replay: bool = False,
+    ):
+        self.tournament_id = tournament_id
+        self.data_bucket = data_bucket or os.environ.get("DATA_BUCKET_NAME")
+        self.ttl_seconds = ttl_seconds
+        self.replay = replay
+        self.use_s3 = os.environ.get("AWS_LAMBDA_FUNCTION_NAME") is not None
+        if self.use_s3:
+            self.s3_client = boto3.client("s3")
+
+    def key(self, url: str):
+        return f"{self.tournament_id}/page_cache/{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
+
+    def get(self, url: str):
+        """
+        Returns the cache entry for the URL, or None if it has not been cached.
+        """
+        key = self.key(url)
+        try:
+            if self.use_s3:
+                body = self.s3_client.get_object(Bucket=self.data_bucket, Key=key)[
+                    "Body"
+                ].read()
+            else:
+                with open(key, "rb") as f:
+                    body = f.read()
+            return json.loads(decompress(body))
+        except (FileNotFoundError, self._missing_key_errors()):
+            return None
+        except Exception as ex:
+            logging.warning(f"Could not read cached page for {url}: {repr(ex)}")
+            return None
+
+    def put(
+        self,
+        url: str,
+        html: str,
+        final_url: str = None,
+        etag: str = None,
+        last_modified: str = None,
+    ):
+        entry = {
+            "url": url,
+            "final_url": final_url or url,
+            "fetched_at": time.time(),
+            "etag": etag,
+            "last_modified": last_modified,
+            "html": html,
+        }
+        self._write(url, entry)
+        return entry
+
+    def touch(self, url: str, entry: dict):
+        """
+        Mark an entry as fresh again after the server confirmed it has not changed.
+        """
+        entry["fetched_at"] = time.time()
+        self._write(url, entry)
+        return entry
+
+    def is_fresh(self, entry: dict):
+        return self.replay or time.time() - entry["fetched_at"] < self.ttl_seconds
+
+    @staticmethod
+    def conditional_headers(entry: dict):
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def _missing_key_errors(self):
+        if self.use_s3:
+            return self.s3_client.exceptions.NoSuchKey
+        return FileNotFoundError
+
+    def _write(self, url: str, entry: dict):
+        key = self.key(url)
+        body = compress(json.dumps(entry))
+        try:
+            if self.use_s3:
+                self.s3_client.put_object(
+                    Body=body,
+                    Bucket=self.data_bucket,
+                    Key=key,
+                    ContentEncoding=CONTENT_ENCODING,
+                    ContentType="application/json",
+                )
+            else:
+                os.makedirs(os.path.dirname(key), exist_ok=True)
+                # Write to a temp file and swap it in so a crash never leaves a half-written entry
+                fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(key))
+                with os.fdopen(fd, "wb") as f:
+                    f.write(body)
+                os.replace(temp_path, key)
+        except Exception as ex:
+            # The cache is an optimization -- never fail a scrape because we couldn't save a page
+            logging.warning(f"Could not cache page for {url}: {repr(ex)}")
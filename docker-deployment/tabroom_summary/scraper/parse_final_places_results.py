@@ -8,7 +8,7 @@ import json
 import logging
 import re
 import selenium
-from .parse_hidden_string import parse_hidden_string
+from .parse_hidden_string import parse_hidden_strings
 
 
 def parse_final_places_results(driver, result_id):
@@ -69,6 +69,9 @@ def parse_final_places_results(driver, result_id):
                     index_dict[header_expected_name_key]["index"] = index
 
         rows = table.find_elements(By.CSS_SELECTOR, "tbody tr")
+        # Hidden strings are parsed together once the whole table has been read
+        rows_with_hidden_strings = []
+        hidden_csv_strings = []
         for row in rows:
             result = {}
             # Skip header rows (rows that use this funky yellowrow class name)
@@ -85,8 +88,9 @@ def parse_final_places_results(driver, result_id):
                     .get_attribute("innerHTML")
                     .strip()
                 )
-
-                result["round_by_round"] = parse_hidden_string(hidden_csv_string)
+                result["round_by_round"] = []
+                rows_with_hidden_strings.append(result)
+                hidden_csv_strings.append(hidden_csv_string)
 
             except selenium.common.exceptions.NoSuchElementException:
                 logging.debug(
@@ -105,6 +109,10 @@ def parse_final_places_results(driver, result_id):
             name_to_school_dict[visible_results[index_dict["name"]["index"]]] = (
                 visible_results[index_dict["school"]["index"]]
             )
+        for result, round_by_round in zip(
+            rows_with_hidden_strings, parse_hidden_strings(hidden_csv_strings)
+        ):
+            result["round_by_round"] = round_by_round
     results_dict = {
         "result_set_type": "Final Places",
         "results": results_list,
@@ -2,47 +2,98 @@ import re
 import json
 import logging
 
+LEADING_DIGITS_PATTERN = re.compile(r"\d*")
+POINTS_PATTERN = re.compile(r"\d{3,5}")
+
+
+class HiddenStringTokens:
+    """
+    The hidden CSV split into its "R"-delimited segments in a single scan, plus the lookups needed to find each round.
+
+    A segment is everything after one "R" up to the next, eg. "R1L28.0,27.0|(55.0)" -> "1L28.0,27.0|(55.0)".
+    Round numbers run straight into the ranks ("R12|" is round 1, rank 2 -- or round 12), so segments can't be
+    labeled up front; instead each round is matched as the FIRST segment that starts with its number, which is what
+    makes R1 vs R10 (and R1 rank 0) resolve the way they always have.
+    """
+
+    def __init__(self, hidden_csv_string: str):
+        self.segments = hidden_csv_string.split("R")[1:]
+        # {<leading digit prefix>: <index of the first segment starting with it>}
+        self.first_index_by_prefix = {}
+        # {<first character>: <index of the last segment starting with it>}
+        self.last_index_by_first_char = {}
+        for index, segment in enumerate(self.segments):
+            leading_digits = LEADING_DIGITS_PATTERN.match(segment)[0]
+            for prefix_length in range(1, len(leading_digits) + 1):
+                self.first_index_by_prefix.setdefault(
+                    leading_digits[:prefix_length], index
+                )
+            if segment:
+                self.last_index_by_first_char[segment[0]] = index
+
+    def round_content(self, round_number: int):
+        """
+        Returns a tuple of (content, has_next_round) for a round, or (None, False) if the round isn't present.
+
+        The next round may have been a bye, so a segment starting with any character of the next two round numbers
+        counts as "more rounds to come".
+        """
+        round_identifier = str(round_number)
+        index = self.first_index_by_prefix.get(round_identifier)
+        if index is None:
+            return None, False
+        next_round_chars = set(f"{round_number + 1},{round_number + 2}")
+        end = max(
+            self.last_index_by_first_char.get(char, -1) for char in next_round_chars
+        )
+        has_next_round = end > index
+        if not has_next_round:
+            end = len(self.segments)
+        content = self.segments[index][len(round_identifier) :]
+        # Back-to-back segments starting with the same round number (eg. R1 then R10) run together
+        for next_index in range(index + 1, end):
+            segment = self.segments[next_index]
+            if not segment.startswith(round_identifier):
+                break
+            content += segment[len(round_identifier) :]
+        return content, has_next_round
+
+
+def strip_points(rank: str):
+    # Remove speaker points from speech events if present
+    if POINTS_PATTERN.search(rank):
+        if "100" in rank:
+            return rank[0:-3]
+        return rank[0:-2]
+    return rank
+
 
 def parse_hidden_string(hidden_csv_string: str):
-    # Define a regular expression pattern to extract round information
-    # Starts with R followed by a digit
+    # The hidden string is a series of rounds, each starting with R followed by the round number
     # Then a series of pipe-delimited ranks
     # Optionally at the end there is a parentheses-enclosed value
-    # Abandon all hope ye who attempt to debug this regex.
     if not hidden_csv_string:
         return []
-    hidden_csv_string = hidden_csv_string.strip()
+    tokens = HiddenStringTokens(hidden_csv_string.strip())
     round_by_round_results = []
     current_round = 1
     done = False
     no_results_from_previous_round = False
     while not done:
         this_identifier = "R" + str(current_round)
-        next_round = str(current_round + 1)
-        next_next_round = str(int(next_round) + 1)
-        # Get results between the current and next identifier, acknowledging that there may be a BYE resulting in a skipped round
-        # Note: Why all this complicated logic? Because R1 matches R10, so need to specify the start/end carefully.
-        next_identifier = rf"R[{next_round},{next_next_round}]"
-        # Get the content between the current and next identifier
-        try:
-            content = re.search(
-                rf"{this_identifier}.*{next_identifier}", hidden_csv_string
-            )[0]
-            content = content.replace(this_identifier, "").split("R")[0]
+        content, has_next_round = tokens.round_content(current_round)
+        if content is None:
+            # If there's no results for even the CURRENT round, then the entry likely had a bye
+            content = "B|"
+            # If we see 2 bye rounds in a row, just finish it
+            if no_results_from_previous_round:
+                done = True
+            no_results_from_previous_round = True
+        else:
             no_results_from_previous_round = False
-        # No results for the next round identifier? We're done -- wrap up on this loop!
-        except (IndexError, TypeError):
-            try:
-                content = re.search(f"{this_identifier}.*", hidden_csv_string)[0]
-                content = content.replace(this_identifier, "").split("R")[0]
+            # No results for the next round identifier? We're done -- wrap up on this loop!
+            if not has_next_round:
                 done = True
-            # If there's no results for even the CURRENT round, then the entry likely had a bye
-            except (IndexError, TypeError):
-                content = "B|"
-                # If we see 2 bye rounds in a row, just finish it
-                if no_results_from_previous_round:
-                    done = True
-                no_results_from_previous_round = True
 
         # Standardize weird setups
         if content == "BYE":
@@ -50,32 +101,19 @@ def parse_hidden_string(hidden_csv_string: str):
         ranks_list = content.split("|")[0:-1]  # remove the oft-trailing pipe
         if len(ranks_list) == 1:
             # Logic for ranked events (eg. speech) that contain speaker points
-            if re.search(r"\d{3,5}", ranks_list[0]):
-                if re.search(r"100", ranks_list[0]):
-                    total_rank = ranks_list[0][0:-3]
-                else:
-                    total_rank = ranks_list[0][0:-2]
-            else:
-                total_rank = ranks_list[0]
+            total_rank = strip_points(ranks_list[0])
         else:
             try:
                 # Remove parens from total rank; if points are present after the comma, remove them
                 total_rank = content.split("(")[1].replace(")", "").split(",")[0]
-                # Remove speaker points from speech events if present
             except IndexError:
                 logging.warning("Unable to process total rank from hidden string")
                 total_rank = "-1"
-        for iterable, rank in enumerate(ranks_list):
-            if re.search(r"\d{3,5}", rank):
-                if re.search(r"100", rank):
-                    ranks_list[iterable] = rank[0:-3]
-                else:
-                    ranks_list[iterable] = rank[0:-2]
         round_by_round_results.append(
             {
                 "round_name": this_identifier,
                 "total_rank": total_rank,
-                "ranks": ranks_list,
+                "ranks": [strip_points(rank) for rank in ranks_list],
             }
         )
         current_round += 1
@@ -83,6 +121,27 @@ def parse_hidden_string(hidden_csv_string: str):
     return round_by_round_results
 
 
+def parse_hidden_strings(hidden_csv_strings: list[str]):
+    """
+    Parse every hidden string in a results table at once.
+
+    Returns a list of round-by-round results in the same order as the input. Identical strings (common for entries
+    with the same record) are only parsed once; each row still gets its own copy.
+    """
+    parsed_by_string = {}
+    round_by_round_by_row = []
+    for hidden_csv_string in hidden_csv_strings:
+        if hidden_csv_string not in parsed_by_string:
+            parsed_by_string[hidden_csv_string] = parse_hidden_string(hidden_csv_string)
+        round_by_round_by_row.append(
+            [
+                {**each_round, "ranks": list(each_round["ranks"])}
+                for each_round in parsed_by_string[hidden_csv_string]
+            ]
+        )
+    return round_by_round_by_row
+
+
 if __name__ == "__main__":
     hidden_csv_string_samples = [
         "R12|R21|R31|R41|R53|3|5|(11)R61|1|1|2|2|(7)",
@@ -90,10 +149,10 @@ if __name__ == "__main__":
         "R1281R2292R3192R421(3)R5153(9)",  # Points for Speech without points in elim rounds
         "R1197|R2198|R3198|R4298|294|195|(5,287)",  # Points for speech with points in elim rounds
     ]
-    for hidden_csv_string in hidden_csv_string_samples:
+    for round_by_round in parse_hidden_strings(hidden_csv_string_samples):
         print(
             json.dumps(
-                parse_hidden_string(hidden_csv_string),
+                round_by_round,
                 indent=2,
             )
         )
@@ -3,11 +3,16 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver import Chrome
-from .scrape_entry_record import scrape_entry_record
+from .snapshot_page import snapshot_page
+from .fetch_entry_records import (
+    fetch_entry_records,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_REQUESTS_PER_SECOND,
+)
 import json
 import logging
+import os
 import re
-import time
 
 
 def parse_prelim_records_results(
@@ -59,7 +64,9 @@ def parse_prelim_records_results(
     driver = browser
     driver.get(result_url)
     driver.implicitly_wait(1)
-    table = driver.find_element(By.ID, f"ranked_list")
+    # Walk the table from a single page snapshot instead of a WebDriver call per row and cell
+    page = snapshot_page(driver)
+    table = page.find_element(By.ID, f"ranked_list")
 
     # Find the table headers
     headers = table.find_elements(By.CSS_SELECTOR, "thead th")
@@ -127,14 +134,31 @@ def parse_prelim_records_results(
             name_to_school_dict[name_value] = entry_result["school"]
 
     if scrape_entry_record_data:
+        # Entry records are plain pages, so fetch them all at once over HTTP instead of one-by-one in the browser.
+        # The token bucket in fetch_entry_records keeps us polite to Tabroom.
+        entry_records = fetch_entry_records(
+            entry_record_urls=[
+                entry_result_dict["entry_record_url"]
+                for entry_result_dict in results_list
+                if "entry_record_url" in entry_result_dict
+            ],
+            requests_per_second=float(
+                os.getenv(
+                    "ENTRY_RECORD_REQUESTS_PER_SECOND", DEFAULT_REQUESTS_PER_SECOND
+                )
+            ),
+            max_concurrency=int(
+                os.getenv("ENTRY_RECORD_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY)
+            ),
+            # Share the session's page cache (if any) so entry records can be revalidated or replayed too
+            page_cache=getattr(browser, "page_cache", None),
+        )
         for entry_result_dict in results_list:
-            if "entry_record_url" not in entry_result_dict:
+            if entry_result_dict.get("entry_record_url") not in entry_records:
                 continue
-            time.sleep(1)  # Sleep for a bit to avoid rate limiting
-            entry_result_dict["scrape_entry_record_data"] = scrape_entry_record(
-                entry_record_url=entry_result_dict["entry_record_url"],
-                browser=browser,
-            )
+            entry_result_dict["scrape_entry_record_data"] = entry_records[
+                entry_result_dict["entry_record_url"]
+            ]
             name_to_full_name_dict[entry_result_dict["name"]] = entry_result_dict[
                 "scrape_entry_record_data"
             ]["full_entry_name"]
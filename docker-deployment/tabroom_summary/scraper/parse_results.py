@@ -19,6 +19,7 @@ from .parse_dicts_from_prelim_chambers import parse_dicts_from_prelim_chambers
 from .parse_dicts_from_all_rounds_result_set import (
     parse_dicts_from_all_rounds_result_set,
 )
+from .snapshot_page import snapshot_page
 import os
 import re
 
@@ -103,6 +104,10 @@ def parse_results(input_data):
             "result_list": [],
         }
     # Navigating through results. Make sure NOT to use the driver within the loop or you will break the loop's input!
+    # Read the links from a snapshot so each one doesn't cost a WebDriver round-trip
+    result_pages = snapshot_page(browser).find_elements(
+        By.CSS_SELECTOR, "div.sidenote a"
+    )
     result_page_details = []
     for result in result_pages:
         result_name = result.text
@@ -130,18 +135,20 @@ def parse_results(input_data):
         name_to_school_dict = {}
         name_to_full_name_dict = {}
         browser.get(result_page_detail["result_url"])
+        # Parse the loaded page in-process; parsers only read from it
+        page = snapshot_page(browser)
         if re.search(r"Prelim Chamber Results", result_page_detail["result_name"]):
             # This is a special case for NSDA Congress results
             # We don't parse these results here, but we do need to extract the names and schools
             result_table_content = {}
             name_to_school_dict = parse_dicts_from_prelim_chambers(
-                driver=browser,
+                driver=page,
                 result_url=result_page_detail["result_url"],
             )
 
         elif result_page_detail["result_name"] == "All Rounds":
             name_to_school_dict = parse_dicts_from_all_rounds_result_set(
-                driver=browser,
+                driver=page,
                 result_url=result_page_detail["result_url"],
             )
             result_table_content = []
@@ -151,7 +158,7 @@ def parse_results(input_data):
                 code_to_name_dict,
                 name_to_school_dict,
             ) = parse_final_places_results(
-                browser,
+                page,
                 result_page_detail["result_id"],
             )
         elif (
@@ -173,18 +180,18 @@ def parse_results(input_data):
                 code_to_name_dict,
                 name_to_school_dict,
             ) = parse_dicts_from_prelim_seeds(
-                driver=browser,
+                driver=page,
                 result_url=result_page_detail["result_url"],
             )
             result_table_content = {}
         elif result_page_detail["result_name"] == "Speaker Awards":
-            result_table_content = parse_speaker_awards_results(browser)
+            result_table_content = parse_speaker_awards_results(page)
 
         elif result_page_detail["result_name"] == "District Qualifiers":
             (
                 result_table_content,
                 name_to_school_dict,
-            ) = parse_district_qualifiers(browser)
+            ) = parse_district_qualifiers(page)
         else:
             continue
         result_contents.append(result_table_content)
@@ -15,7 +15,8 @@ def parse_results_wrapper(
     """
     This is a helper function used to parse results either in parallel or serially.
 
-    If thread_arguments is provided, it will parse results in parallel.
+    If thread_arguments is provided, it will parse results in parallel, using a browser session from the BrowserPool
+    passed in place of the browser.
     If thread_arguments is not provided, it will parse results serially.
     """
     # Serial Case
@@ -37,25 +38,19 @@ def parse_results_wrapper(
         (
             event_option,
             base_url,
-            chrome_options_tuple,
+            browser_pool,
             final_results_identifiers,
             final_round_results_identifiers,
             scrape_entry_records,
         ) = thread_arguments
-        parallel_browser = Chrome(
-            options=chrome_options_tuple[0],
-            service=chrome_options_tuple[1],
-            keep_alive=True,
-        )
-        # Update to use the new browser
-        thread_arguments = (
-            event_option,
-            base_url,
-            parallel_browser,
-            final_results_identifiers,
-            final_round_results_identifiers,
-            scrape_entry_records,
-        )
-        result = parse_results(thread_arguments)
-        parallel_browser.close()
-        return result
+        # Borrow a logged-in session from the pool; it goes back to the pool for the next event when we're done
+        with browser_pool.session() as pooled_browser:
+            thread_arguments = (
+                event_option,
+                base_url,
+                pooled_browser,
+                final_results_identifiers,
+                final_round_results_identifiers,
+                scrape_entry_records,
+            )
+            return parse_results(thread_arguments)
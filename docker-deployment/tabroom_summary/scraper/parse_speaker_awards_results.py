@@ -8,7 +8,7 @@ import logging
 
 def parse_speaker_awards_results(driver):
     """
-    Given a Selenium driver with the URL of a speaker awards page, parse the speaker awards table
+    Given a Selenium driver (or page snapshot) with the URL of a speaker awards page, parse the speaker awards table
 
     Returns a dict with the result set type and speaker results
     {
@@ -0,0 +1,293 @@
+# This is based off of Palmer's https://github.com/speechanddebate/tabroom/blob/master/web/funclib/short_name.mas
+import json
+import logging
+import os
+import re
+import tempfile
+from functools import lru_cache
+
+# These are special cases that don't play nice with the logic
+SPECIAL_CASES = {
+    "thomas jefferson high school of science and technology": "Thomas Jefferson",
+    "thomas jefferson high school of science & technology": "Thomas Jefferson",
+    "the bronx high school of science": "Bronx Science",
+    "whitney m. young magnet high school": "Whitney Young",
+    "lane tech college prep h.s.": "Lane Tech",
+    "new school": "New School",
+    "the new school": "New School",
+    "bc academy": "BC Academy",
+    "new york university": "NYU",
+    "boston college": "Boston College",
+    "boston university": "Boston University",
+    "academy": "Academy",  # who names a school academy
+    "academy high school": "Academy",
+    "air academy high school": "Air Academy",
+    "air academy hs": "Air Academy",
+    "college prep school": "College Prep",
+    "college prep hs": "College Prep",
+    "college prep": "College Prep",
+    "st. paul academy and summit school": "St. Paul Academy and Summit",
+    "university high school, irvine": "University HS, Irvine",
+    "alannah debates": "Alannah",
+    "bellarmine college preparatory": "Bellarmine College Prep",
+    "basis independent fremont(hs)": "Basis Independent Fremont",
+    "brooks debate institute": "Brooks Debate",
+    "the delores taylor arthur school for young men": "Delores Taylor Arthur School for Young Men",
+    "dhs independent": "DHS",
+    "damien high school and st lucy's priory": "Damien HS and St. Lucy's Priory",
+    "davidson academy online": "Davidson Academy",
+    "msms": "Mississippi School For Mathematics and Science",
+    "st. ignatius college prep": "St Ignatius College Prep",
+    "vegas debates": "Vegas Debates",
+    "young genius, bay area speech and debate": "Young Genius",
+    "university school": "University",
+    "university high school": "University",
+    "university": "University",
+    "greenwich hs": "GHS",
+    "ghs": "GHS",
+    "astor redhead academy": "FUHS",
+    "stanford ohs": "Stanford OHS",
+    # "durham academy": "Durham Academy",
+}
+
+# Disambiguate between similarly-named schools (exact, case-sensitive matches)
+DISAMBIGUATIONS = {
+    **dict.fromkeys(
+        ["Milton High School", "MiltonHigh", "Milton HS", "Milton Hi"], "Milton High"
+    ),
+    **dict.fromkeys(["Milton Academy", "MiltonAcademy", "Milton AC"], "Milton Acad"),
+    **dict.fromkeys(["Cary High School", "Cary HS", "Cary Hi"], "Cary High"),
+    **dict.fromkeys(["Cary Academy", "Cary AC"], "Cary Acad"),
+}
+
+# ALWAYS REMOVE these phrases and illegal-in-names-on-Windows characters
+ALWAYS_REMOVE = ["Junior-Senior", "Charter Public", "Public Charter", ":"]
+
+# ELIMINATE THESE PHRASES ENTIRELY IF THEY APPEAR AT THE END
+BAD_ENDINGS = [
+    "Mock Trial",
+    "Debate Association",
+    "Debate Academy",
+    "Debate Panel",
+    "Debate Society",
+    "Debating Society",
+    "Forensics/Debate",
+    "of Math and Science",
+    "Academy",
+    "Early College High School",
+    "Regional High School",
+    "Middle School",
+    "Junior High School",
+    "Upper School",
+    "Sr High School",
+    "University High School",
+    "High School",
+    "College Prepatory",
+    "College Prep",
+    "Colleges",
+    "School",
+    "school",
+    "Schools",
+    "schools",
+    " High",
+    "H.S",
+    "HS",
+    "M.S",
+    "MS",
+    "(MS)",
+    "JH",
+    "Jr",
+    "JR",
+    " Middle",
+    "(Middle)",
+    "Elementary",
+    "(Elementary)",
+    "Intermediate",
+    "Community",
+    "(Intermediate)",
+    "Junior",
+    "(Middle)",
+    "Regional",
+    "Academy",
+    "School for Young Men",
+    "School",
+    "school",
+    "Schools",
+    "schools",
+    "Sr",
+    "Sr High School",
+    "sr",
+    "Club",
+    "Team",
+    "Society",
+    "Speech and Debate",
+    "Forensics",
+    "Forensic",
+    "Speech",
+    "Debate",
+    "Parliamentary",
+    "University",
+    "CP",
+    "College",
+    "CC",
+]
+
+SHORTENINGS = {
+    "Middle School of the Arts": "Arts",
+    "School of the Arts": "Arts",
+    "Preparatory": "Prep",
+    "Technological": "Tech",
+    "Technology": "Tech",
+    "California State University": "CSU",
+    "California State University,": "CSU",
+    "Community College": "Community",
+    "State University": "State",
+    "State University,": "State",
+    "Saint": "St",
+    "St.": "St",
+}
+
+BAD_BEGINNINGS = [
+    "The ",
+    "The University of",
+    "The University Of",
+    "University of",
+    "University Of",
+    "The College of",
+    "The College Of",
+    "College of",
+    "College Of,",
+]
+
+
+def compile_first_match_pattern(patterns: list[str], suffix: str = ""):
+    """
+    Compile a list of regexes into a single case-insensitive regex whose match tells you which pattern in the list is
+    the FIRST one (in list order, not string order) found in a string.
+
+    Each pattern becomes a lookahead tried in order at the start of the string, followed by an empty named group;
+    match.lastgroup is "rule_<index>" for the winning pattern.
+    """
+    alternatives = [
+        rf"(?=.*?(?:{pattern}){suffix})(?P<rule_{index}>)"
+        for index, pattern in enumerate(patterns)
+    ]
+    return re.compile(rf"^(?:{'|'.join(alternatives)})", re.IGNORECASE | re.DOTALL)
+
+
+class SchoolShortNameResolver:
+    """
+    Resolves long school names (as published on Tabroom) to short names.
+
+    The rule tables are compiled once into one regex per rule class, and every resolution is memoized.
+    If cache_file is given, mappings learned in earlier tournaments are loaded from it (and can be edited by hand to
+    override the rules), and save() writes the current mappings back.
+
+    Two long names resolving to the same short name would be merged into one school when results are grouped by
+    short name, so every collision is logged and kept in short_name_to_long_names.
+    """
+
+    bad_endings_pattern = compile_first_match_pattern(BAD_ENDINGS, suffix="$")
+    shortenings_pattern = compile_first_match_pattern(list(SHORTENINGS))
+    bad_beginnings_pattern = compile_first_match_pattern(BAD_BEGINNINGS)
+    shortening_replacements = list(SHORTENINGS.items())
+
+    def __init__(self, cache_file: str = None, cache_size: int = 4096):
+        self.cache_file = cache_file
+        self.learned = {}
+        if cache_file and os.path.exists(cache_file):
+            with open(cache_file, "r") as f:
+                self.learned = json.load(f)
+            logging.info(
+                f"Loaded {len(self.learned)} school short names from {cache_file}"
+            )
+        self.short_name_to_long_names = {}
+        self._resolve_cached = lru_cache(maxsize=cache_size)(self._resolve)
+
+    @staticmethod
+    def first_match(pattern, string):
+        match = pattern.match(string)
+        if match is None:
+            return None
+        return int(match.lastgroup[len("rule_") :])
+
+    def _resolve(self, long_name: str):
+        if long_name in self.learned:
+            return self.learned[long_name]
+        original_long_name = long_name
+        if long_name.lower() in SPECIAL_CASES:
+            return SPECIAL_CASES[long_name.lower()]
+        if long_name in DISAMBIGUATIONS:
+            return DISAMBIGUATIONS[long_name]
+
+        for remove_phrase in ALWAYS_REMOVE:
+            long_name = long_name.replace(remove_phrase, "")
+
+        # Replace "High School Independent" with "Independent"
+        long_name = long_name.replace("High School Independent", "Independent")
+
+        # Only the first rule that matches in each class is applied
+        index = self.first_match(self.bad_endings_pattern, long_name)
+        if index is not None:
+            long_name = long_name.replace(BAD_ENDINGS[index], "")
+
+        index = self.first_match(self.shortenings_pattern, long_name)
+        if index is not None:
+            long_version, short_version = self.shortening_replacements[index]
+            long_name = long_name.replace(long_version, short_version)
+
+        index = self.first_match(self.bad_beginnings_pattern, long_name)
+        if index is not None:
+            long_name = long_name.replace(BAD_BEGINNINGS[index], "")
+
+        if len(long_name.strip()) == 0:
+            raise ValueError(f"Failed to resolve {original_long_name}")
+        return long_name.strip()
+
+    def resolve(self, long_name: str):
+        """
+        Returns the short name for a long school name.
+        """
+        short_name = self._resolve_cached(long_name)
+        long_names = self.short_name_to_long_names.setdefault(short_name, set())
+        if long_name not in long_names:
+            long_names.add(long_name)
+            if len(long_names) > 1:
+                logging.warning(
+                    f"School short name collision: {sorted(long_names)} all resolve to {short_name}"
+                )
+        return short_name
+
+    def resolve_all(self, long_names):
+        """
+        Returns a dict of long school name to short school name.
+        """
+        return {long_name: self.resolve(long_name) for long_name in long_names}
+
+    def collisions(self):
+        """
+        Returns {<short name>: [<long name>, ...]} for every short name that more than one long name resolved to.
+        """
+        return {
+            short_name: sorted(long_names)
+            for short_name, long_names in self.short_name_to_long_names.items()
+            if len(long_names) > 1
+        }
+
+    def save(self):
+        """
+        Persist every mapping learned so far (merged with the ones loaded at startup) to cache_file.
+        """
+        if not self.cache_file:
+            return
+        mappings = dict(self.learned)
+        for short_name, long_names in self.short_name_to_long_names.items():
+            for long_name in long_names:
+                mappings[long_name] = short_name
+        cache_dir = os.path.dirname(os.path.abspath(self.cache_file))
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write to a temp file and swap it in so a crash never leaves a half-written cache
+        fd, temp_path = tempfile.mkstemp(dir=cache_dir)
+        with os.fdopen(fd, "w") as f:
+            json.dump(mappings, f, indent=4, sort_keys=True)
+        os.replace(temp_path, self.cache_file)
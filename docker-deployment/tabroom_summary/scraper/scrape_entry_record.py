@@ -8,7 +8,15 @@ import timeit
 
 def scrape_entry_record(browser, entry_record_url):
     """
-    Returns a representation of an entry record.
+    Navigate to an entry record page and return its representation (see parse_entry_record).
+    """
+    browser.get(entry_record_url)
+    return parse_entry_record(browser)
+
+
+def parse_entry_record(page):
+    """
+    Returns a representation of an entry record from a loaded page (a browser or a StaticPage).
 
     {
         full_entry_name: <full_entry_name>
@@ -25,14 +33,13 @@ def scrape_entry_record(browser, entry_record_url):
         ]
     }
     """
-    browser.get(entry_record_url)
     results_list = []
     full_entry_name = (
-        browser.find_element(By.CLASS_NAME, "main")
+        page.find_element(By.CLASS_NAME, "main")
         .find_element(By.CSS_SELECTOR, "h4")
         .text
     )
-    rows = browser.find_elements(By.CLASS_NAME, "row")
+    rows = page.find_elements(By.CLASS_NAME, "row")
     logging.info(f"Grabbing entry record results for {full_entry_name}")
     for row in rows:
         visible_results = [
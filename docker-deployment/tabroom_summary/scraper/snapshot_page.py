@@ -0,0 +1,19 @@
+from .http_browser import HttpBrowser
+from .navigation_cache import NavigationCache
+from .static_page import StaticPage, parse_static_page
+
+
+def snapshot_page(browser) -> StaticPage:
+    """
+    Take a read-only snapshot of the page the browser is currently on.
+
+    The page source is fetched once and parsed in-process, so parsers can call find_element(s), .text and
+    get_attribute on every row and cell without a WebDriver round-trip per call. Navigation and login stay in the browser.
+    """
+    if isinstance(browser, NavigationCache):
+        # Reuses the snapshot until the session navigates somewhere else
+        return browser.snapshot()
+    if isinstance(browser, HttpBrowser):
+        # Already parsed when the page was loaded
+        return browser.page
+    return parse_static_page(browser.page_source, browser.current_url)
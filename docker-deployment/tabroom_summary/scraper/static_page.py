@@ -0,0 +1,462 @@
+import re
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+"""
+A tiny, dependency-free DOM that mimics the slice of the Selenium WebElement API used by the parsers in this package
+(find_element(s), .text, get_attribute). It lets the same parsing code run against raw HTML instead of a live browser.
+"""
+
+# Elements that never have a closing tag
+VOID_TAGS = {
+    "area",
+    "base",
+    "br",
+    "col",
+    "embed",
+    "hr",
+    "img",
+    "input",
+    "link",
+    "meta",
+    "param",
+    "source",
+    "track",
+    "wbr",
+}
+# Elements that start a new line when rendered
+BLOCK_TAGS = {
+    "address",
+    "article",
+    "aside",
+    "blockquote",
+    "dd",
+    "div",
+    "dl",
+    "dt",
+    "fieldset",
+    "footer",
+    "form",
+    "h1",
+    "h2",
+    "h3",
+    "h4",
+    "h5",
+    "h6",
+    "header",
+    "hr",
+    "li",
+    "main",
+    "nav",
+    "ol",
+    "p",
+    "pre",
+    "section",
+    "table",
+    "tbody",
+    "tfoot",
+    "thead",
+    "tr",
+    "ul",
+}
+# Elements that are never rendered, so Selenium reports no text for them
+NON_RENDERED_TAGS = {"head", "noscript", "script", "style", "template", "title"}
+# Tabroom hides these with CSS (sort keys and the round-by-round CSV)
+HIDDEN_CLASSES = {"hidden", "hiddencsv"}
+
+# Tags that implicitly close an open element of the same family, bounded by a container tag
+IMPLICIT_CLOSE_RULES = {
+    "td": ({"td", "th"}, {"tr", "table"}),
+    "th": ({"td", "th"}, {"tr", "table"}),
+    "tr": ({"td", "th", "tr"}, {"thead", "tbody", "tfoot", "table"}),
+    "thead": ({"td", "th", "tr", "thead", "tbody", "tfoot"}, {"table"}),
+    "tbody": ({"td", "th", "tr", "thead", "tbody", "tfoot"}, {"table"}),
+    "tfoot": ({"td", "th", "tr", "thead", "tbody", "tfoot"}, {"table"}),
+    "option": ({"option"}, {"select", "datalist"}),
+    "li": ({"li"}, {"ul", "ol"}),
+}
+
+WHITESPACE_RUN = re.compile(r"[ \t\n\r\f]+")
+SPACE_RUN = re.compile(r" +")
+
+
+class StaticElement:
+    """
+    A parsed HTML element that answers the same questions a Selenium WebElement would.
+    """
+
+    def __init__(self, tag, attrs, parent=None, document=None):
+        self.tag = tag
+        self.attrs = attrs
+        self.parent = parent
+        self.document = document
+        self.children = []
+        self.content_start = 0
+        self.content_end = 0
+
+    @property
+    def tag_name(self):
+        return self.tag
+
+    @property
+    def is_hidden(self):
+        if self.tag in NON_RENDERED_TAGS or "hidden" in self.attrs:
+            return True
+        if HIDDEN_CLASSES.intersection(self.class_list):
+            return True
+        style = self.attrs.get("style") or ""
+        return bool(re.search(r"display\s*:\s*none", style))
+
+    @property
+    def class_list(self):
+        return (self.attrs.get("class") or "").split()
+
+    @property
+    def text(self):
+        """
+        Approximates WebDriver's visible text: hidden elements are dropped, whitespace is collapsed,
+        block elements and <br> start new lines, and each line is trimmed.
+        """
+        pieces = []
+        self._render_text(pieces)
+        rendered = "".join(pieces).replace("\xa0", " ")
+        lines = [SPACE_RUN.sub(" ", line).strip() for line in rendered.split("\n")]
+        return "\n".join(line for line in lines if line)
+
+    def _render_text(self, pieces):
+        if self.is_hidden:
+            return
+        if self.tag == "br":
+            pieces.append("\n")
+            return
+        is_block = self.tag in BLOCK_TAGS
+        if is_block:
+            pieces.append("\n")
+        for child in self.children:
+            if isinstance(child, str):
+                pieces.append(WHITESPACE_RUN.sub(" ", child))
+            else:
+                child._render_text(pieces)
+        if self.tag in ("td", "th"):
+            pieces.append(" ")
+        if is_block:
+            pieces.append("\n")
+
+    def get_attribute(self, name):
+        if name in ("innerHTML", "textContent"):
+            inner_html = self.document.source[self.content_start : self.content_end]
+            if name == "innerHTML":
+                return inner_html
+            return "".join(self._iter_text_nodes())
+        if name in ("href", "src") and self.attrs.get(name) is not None:
+            # Selenium returns the resolved property, not the raw attribute
+            return urljoin(self.document.url, self.attrs[name])
+        if name == "value" and self.tag == "option" and "value" not in self.attrs:
+            return self.text
+        return self.attrs.get(name)
+
+    def _iter_text_nodes(self):
+        for child in self.children:
+            if isinstance(child, str):
+                yield child
+            else:
+                yield from child._iter_text_nodes()
+
+    def child_elements(self):
+        return [child for child in self.children if isinstance(child, StaticElement)]
+
+    def iter_descendants(self):
+        for child in self.children:
+            if isinstance(child, StaticElement):
+                yield child
+                yield from child.iter_descendants()
+
+    def find_elements(self, by=By.ID, value=None):
+        if by == By.ID:
+            return [e for e in self.iter_descendants() if e.attrs.get("id") == value]
+        if by == By.NAME:
+            return [e for e in self.iter_descendants() if e.attrs.get("name") == value]
+        if by == By.CLASS_NAME:
+            return [e for e in self.iter_descendants() if value in e.class_list]
+        if by == By.TAG_NAME:
+            return [e for e in self.iter_descendants() if e.tag == value.lower()]
+        if by == By.CSS_SELECTOR:
+            return select_css(self, value)
+        if by == By.XPATH:
+            return select_xpath(self, value)
+        raise ValueError(f"Locator strategy {by} is not supported for static pages")
+
+    def find_element(self, by=By.ID, value=None):
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(f"Unable to locate element: {by}={value}")
+        return elements[0]
+
+
+class StaticPage:
+    """
+    A parsed page with the read-only parts of the Selenium WebDriver API (find_element(s), page_source, current_url).
+    """
+
+    def __init__(self, source: str, url: str):
+        self.source = source
+        self.url = url
+        self.root = StaticElement("#document", {}, document=self)
+        self.root.content_end = len(source)
+
+    @property
+    def page_source(self):
+        return self.source
+
+    @property
+    def current_url(self):
+        return self.url
+
+    def find_elements(self, by=By.ID, value=None):
+        return self.root.find_elements(by, value)
+
+    def find_element(self, by=By.ID, value=None):
+        return self.root.find_element(by, value)
+
+
+class StaticPageBuilder(HTMLParser):
+    def __init__(self, page: StaticPage):
+        super().__init__(convert_charrefs=True)
+        self.page = page
+        self.stack = [page.root]
+        self.line_offsets = [0]
+        for match in re.finditer("\n", page.source):
+            self.line_offsets.append(match.end())
+
+    def _offset(self):
+        line, column = self.getpos()
+        return self.line_offsets[line - 1] + column
+
+    def _close_until(self, index, content_end):
+        while len(self.stack) > index:
+            self.stack.pop().content_end = content_end
+
+    def _create(self, tag, attrs):
+        start = self._offset()
+        parent = self.stack[-1]
+        element = StaticElement(
+            tag,
+            {key: (value if value is not None else "") for key, value in attrs},
+            parent=parent,
+            document=self.page,
+        )
+        element.content_start = start + len(self.get_starttag_text() or "")
+        element.content_end = element.content_start
+        parent.children.append(element)
+        return element, start
+
+    def handle_starttag(self, tag, attrs):
+        if tag in IMPLICIT_CLOSE_RULES:
+            closes, boundaries = IMPLICIT_CLOSE_RULES[tag]
+            for index in range(len(self.stack) - 1, 0, -1):
+                open_tag = self.stack[index].tag
+                if open_tag in boundaries:
+                    break
+                if open_tag in closes:
+                    self._close_until(index, self._offset())
+                    break
+        element, _ = self._create(tag, attrs)
+        if tag not in VOID_TAGS:
+            self.stack.append(element)
+
+    def handle_startendtag(self, tag, attrs):
+        self._create(tag, attrs)
+
+    def handle_endtag(self, tag):
+        for index in range(len(self.stack) - 1, 0, -1):
+            if self.stack[index].tag == tag:
+                self._close_until(index, self._offset())
+                return
+        # Stray closing tags are ignored, same as a browser would
+
+    def handle_data(self, data):
+        self.stack[-1].children.append(data)
+
+    def close(self):
+        super().close()
+        self._close_until(1, len(self.page.source))
+
+
+def parse_static_page(source: str, url: str = "about:blank") -> StaticPage:
+    """
+    Parse raw HTML into a StaticPage that can be handed to any of the scraper parsers in place of a browser.
+    """
+    page = StaticPage(source or "", url)
+    builder = StaticPageBuilder(page)
+    builder.feed(page.source)
+    builder.close()
+    return page
+
+
+# CSS selectors -- only descendant combinators of simple tag/#id/.class/[attr=value] compounds are needed
+CSS_COMPOUND = re.compile(
+    r"(?P<tag>[\w\-\*]+)|#(?P<id>[\w\-]+)|\.(?P<cls>[\w\-]+)|\[(?P<attr>[\w\-]+)(?:=['\"]?(?P<val>[^'\"\]]*)['\"]?)?\]"
+)
+
+
+def _parse_css_compound(compound):
+    tag = None
+    requirements = []
+    position = 0
+    while position < len(compound):
+        match = CSS_COMPOUND.match(compound, position)
+        if not match or match.end() == position:
+            raise ValueError(f"Unsupported CSS selector: {compound}")
+        if match.group("tag"):
+            tag = match.group("tag").lower()
+        elif match.group("id"):
+            requirements.append(("id", match.group("id")))
+        elif match.group("cls"):
+            requirements.append(("class", match.group("cls")))
+        elif match.group("attr"):
+            requirements.append(("attr", (match.group("attr"), match.group("val"))))
+        position = match.end()
+    return tag, requirements
+
+
+def _matches_compound(element, compound):
+    tag, requirements = compound
+    if tag not in (None, "*") and element.tag != tag:
+        return False
+    for kind, requirement in requirements:
+        if kind == "id" and element.attrs.get("id") != requirement:
+            return False
+        if kind == "class" and requirement not in element.class_list:
+            return False
+        if kind == "attr":
+            attr_name, attr_value = requirement
+            if attr_name not in element.attrs:
+                return False
+            if attr_value is not None and element.attrs[attr_name] != attr_value:
+                return False
+    return True
+
+
+def select_css(context: StaticElement, selector: str):
+    compounds = [_parse_css_compound(part) for part in selector.split()]
+    matches = []
+    for element in context.iter_descendants():
+        if not _matches_compound(element, compounds[-1]):
+            continue
+        # Walk up the ancestors to satisfy the rest of the selector, right to left
+        remaining = len(compounds) - 2
+        ancestor = element.parent
+        while remaining >= 0 and ancestor is not None:
+            if _matches_compound(ancestor, compounds[remaining]):
+                remaining -= 1
+            ancestor = ancestor.parent
+        if remaining < 0:
+            matches.append(element)
+    return matches
+
+
+# XPath -- a small subset: absolute/relative child and descendant steps with
+# [@attr], [@attr='x'], [text()='x'] and nested [child[...]] predicates.
+def _parse_xpath_literal(expression, position):
+    quote = expression[position]
+    end = expression.index(quote, position + 1)
+    return expression[position + 1 : end], end + 1
+
+
+def _parse_xpath_predicate(expression, position):
+    if expression.startswith("@", position):
+        match = re.compile(r"@([\w\-]+)\s*").match(expression, position)
+        position = match.end()
+        value = None
+        if expression[position] == "=":
+            position = position + 1
+            while expression[position] == " ":
+                position += 1
+            value, position = _parse_xpath_literal(expression, position)
+        return ("attr", match.group(1), value), position
+    if expression.startswith("text()", position):
+        position = position + len("text()")
+        while expression[position] in " =":
+            position += 1
+        value, position = _parse_xpath_literal(expression, position)
+        return ("text", value), position
+    steps, position = _parse_xpath_steps(expression, position)
+    return ("path", steps), position
+
+
+def _parse_xpath_steps(expression, position):
+    steps = []
+    axis = "child"
+    while position < len(expression) and expression[position] != "]":
+        if expression.startswith("//", position):
+            axis = "descendant"
+            position += 2
+            continue
+        if expression.startswith("/", position):
+            axis = "child"
+            position += 1
+            continue
+        match = re.compile(r"[\w\-\*]+").match(expression, position)
+        if not match:
+            raise ValueError(f"Unsupported XPath expression: {expression}")
+        name = match.group(0).lower()
+        position = match.end()
+        predicates = []
+        while position < len(expression) and expression[position] == "[":
+            predicate, position = _parse_xpath_predicate(expression, position + 1)
+            predicates.append(predicate)
+            position = expression.index("]", position) + 1
+        steps.append((axis, name, predicates))
+        axis = "child"
+    return steps, position
+
+
+def _xpath_predicate_matches(element, predicate):
+    kind = predicate[0]
+    if kind == "attr":
+        _, attr_name, attr_value = predicate
+        if attr_value is None:
+            return attr_name in element.attrs
+        return element.attrs.get(attr_name) == attr_value
+    if kind == "text":
+        return any(
+            isinstance(child, str) and child == predicate[1]
+            for child in element.children
+        )
+    return bool(_evaluate_xpath_steps([element], predicate[1]))
+
+
+def _evaluate_xpath_steps(context_elements, steps):
+    elements = context_elements
+    for axis, name, predicates in steps:
+        selected = []
+        seen = set()
+        for element in elements:
+            candidates = (
+                element.iter_descendants()
+                if axis == "descendant"
+                else element.child_elements()
+            )
+            for candidate in candidates:
+                if name != "*" and candidate.tag != name:
+                    continue
+                if id(candidate) in seen:
+                    continue
+                if all(_xpath_predicate_matches(candidate, p) for p in predicates):
+                    seen.add(id(candidate))
+                    selected.append(candidate)
+        elements = selected
+    return elements
+
+
+def select_xpath(context: StaticElement, expression: str):
+    expression = expression.strip()
+    if expression.startswith("/"):
+        # Absolute paths always search from the top of the document, even from an element
+        context = context.document.root
+    elif expression.startswith("."):
+        expression = expression[1:]
+    steps, _ = _parse_xpath_steps(expression, 0)
+    return _evaluate_xpath_steps([context], steps)
@@ -1,20 +1,19 @@
 import argparse
-from datetime import datetime, date
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
 import json
 import logging
+import os
 from concurrent import futures
 from .get_schools_and_states import get_schools_and_states
 from .parse_results_wrapper import parse_results_wrapper
 from .get_judge_map import get_judge_map
-from .resolve_longname_to_shortname import resolve_longname_to_shortname
+from .school_short_name_resolver import SchoolShortNameResolver
 from .get_sweeps_results import get_sweeps_results
+from .browser_pool import BrowserPool, DEFAULT_BROWSER_POOL_SIZE
+from .checkpoint_store import CheckpointStore
+from .create_browser import SCRAPE_BACKENDS
+from .page_cache import PageCache
 from collections import Counter
-import botocore
-import boto3
-import os
 
 logging.basicConfig(
     format="%(asctime)s,%(msecs)03d %(levelname)-8s [%(filename)s:%(lineno)d] %(message)s",
@@ -23,13 +22,6 @@ logging.basicConfig(
 )
 
 
-class DateTimeEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, (datetime, date)):
-            return obj.isoformat()
-        return super().default(obj)
-
-
 """
 Returns a dictionary with the following keys:
 {
@@ -65,77 +57,42 @@ def main(
     ],
     final_round_results_identifiers=["Finals Round results"],
     force_single_process=True,
+    scrape_backend="chrome",
+    browser_pool_size=DEFAULT_BROWSER_POOL_SIZE,
+    use_page_cache=True,
+    status_reporter=None,
 ):
     code_to_name_dict_overall = {}
     name_to_school_dict_overall = {}
     name_to_full_name_dict_overall = {}
-    # This browser will be the ONLY browser if running in single-process mode
-    browser = webdriver.Chrome(
-        options=chrome_options,
-        service=chrome_service,
-    )
-    # Extend timeouts for Harvard
-    browser.timeouts.page_load = 60 * 30
-    browser.timeouts.script = 60 * 30
-    logging.debug("Starting browser session")
-
-    # Logging in to Tabroom to access protected results pages
-    login_url = "https://www.tabroom.com/user/login/login.mhtml"
-    # need to hit the login url to get the salt and SHA in order to pass those values in the login_save request
-    browser.get(login_url)
-    salt = browser.find_element(By.NAME, "salt").get_attribute("value")
-    sha = browser.find_element(By.NAME, "sha").get_attribute("value")
-
-    # Pull Username and Password from Secrets Manager
-    secrets_client = boto3.client("secretsmanager", region_name="us-east-1")
-    tabroom_username = secrets_client.get_secret_value(SecretId="TABROOM_USERNAME").get(
-        "SecretString"
-    )
-    tabroom_password = secrets_client.get_secret_value(SecretId="TABROOM_PASSWORD").get(
-        "SecretString"
-    )
-
-    login_data = {
-        "username": tabroom_username,
-        "password": tabroom_password,
-        "salt": salt,
-        "sha": sha,
-    }
-    login_save_url = "https://www.tabroom.com/user/login/login_save.mhtml"
-    # Send a post request to the login_save URL with the login data to authenticate the session
-    browser.execute_script(
-        """
-        function post(path, params) {
-            const form = document.createElement('form');
-            form.method = 'POST';
-            form.action = path;
-            for (const key in params) {
-                const hiddenField = document.createElement('input');
-                hiddenField.type = 'hidden';
-                hiddenField.name = key;
-                hiddenField.value = params[key];
-                form.appendChild(hiddenField);
-            }
-            document.body.appendChild(form);
-            form.submit();
-        }
-        post("%s", %s);
-        """
-        % (login_save_url, json.dumps(login_data, cls=DateTimeEncoder))
+    # NOTE - Set force_single_process to scrape every event one after another through a single browser session
+    run_serially = force_single_process or browser_pool_size <= 1
+    # Sessions are started and logged in once, then shared by every event
+    # Keep the raw HTML of every page we load so re-runs can revalidate (or fully replay) instead of re-scraping
+    page_cache = None
+    if use_page_cache or scrape_backend == "replay":
+        page_cache = PageCache(
+            tournament_id=tournament_id,
+            data_bucket=data_bucket,
+            replay=scrape_backend == "replay",
+        )
+    browser_pool = BrowserPool(
+        size=1 if run_serially else browser_pool_size,
+        scrape_backend=scrape_backend,
+        chrome_options=chrome_options,
+        chrome_service=chrome_service,
+        page_cache=page_cache,
     )
 
     # Navigate to the page with the dropdown menu
     base_url = f"https://www.tabroom.com/index/tourn/results/index.mhtml?tourn_id={tournament_id}"
-    browser.get(base_url)
-
-    # Find the dropdown menu element and get its options
-    dropdown = browser.find_element(By.NAME, "event_id")
-    # select = Select(WebDriverWait(browser, 2).until(EC.visibility_of_any_elements_located((By.NAME, "event_id"))))
-    event_options = dropdown.find_elements(By.TAG_NAME, "option")
+    with browser_pool.session() as browser:
+        browser.get(base_url)
 
-    results = []
-    # NOTE - Lambda runs in single-process mode
-    if "--single-process" in chrome_options.arguments or force_single_process:
+        # Find the dropdown menu element and get its options
+        dropdown = browser.find_element(By.NAME, "event_id")
+        # select = Select(WebDriverWait(browser, 2).until(EC.visibility_of_any_elements_located((By.NAME, "event_id"))))
+        event_options = dropdown.find_elements(By.TAG_NAME, "option")
         # Grab the options data so that we don't have to loop over the dropdown again, which would require multiple browser windows
         event_options_tuples = []
         for event_option in event_options:
@@ -145,19 +102,37 @@ def main(
                     event_option.get_attribute("value"),
                 )
             )
+
+    # Learn which events an earlier (interrupted) run already finished, so we only scrape the rest
+    checkpoint_store = CheckpointStore(
+        tournament_id=tournament_id,
+        data_bucket=data_bucket,
+    )
+    if scrape_backend == "replay":
+        # Replaying is for re-parsing, so don't reuse previously parsed events
+        completed_events = {}
+    else:
+        completed_events = checkpoint_store.load_completed()
+    if status_reporter is not None:
+        status_reporter.stage(
+            "scraping",
+            total=len(event_options_tuples),
+            done=sum(
+                CheckpointStore.checkpoint_name(event_option[0]) in completed_events
+                for event_option in event_options_tuples
+            ),
+        )
+
+    results_by_event = {}
+    if run_serially:
         for event_option in event_options_tuples:
-            # If there is data in the temp_results folder in S3, load it into results
-            s3_client = boto3.client("s3")
-            event_name = event_option[0].replace(":", "")  # escape colons
-            try:
-                response = s3_client.get_object(
-                    Bucket=data_bucket,
-                    Key=f"{tournament_id}/temp_results/{event_name}.json",
-                )
-                results.append(json.loads(response["Body"].read()))
-            except (s3_client.exceptions.NoSuchKey, botocore.exceptions.ClientError):
-                # If we're running in single-process mode, we don't want to open multiple browser windows
-                # So we'll just run the parse_results function in the main thread
+            checkpoint_name = CheckpointStore.checkpoint_name(event_option[0])
+            if checkpoint_name in completed_events:
+                results_by_event[checkpoint_name] = completed_events[checkpoint_name]
+                continue
+            # If we're running in single-process mode, we don't want to open multiple browser windows
+            # So we'll just run the parse_results function in the main thread
+            with browser_pool.session() as browser:
                 single_event_result_data = parse_results_wrapper(
                     event_option=event_option,
                     base_url=base_url,
@@ -166,54 +141,56 @@ def main(
                     final_round_results_identifiers=final_round_results_identifiers,
                     scrape_entry_records=scrape_entry_records,
                 )
-                results.append(single_event_result_data)
-                # At the end, save the event option into the temp_results folder
-                try:
-                    s3_client.put_object(
-                        Body=json.dumps(single_event_result_data),
-                        Bucket=data_bucket,
-                        Key=f"{tournament_id}/temp_results/{event_name}.json",
-                        ContentType="application/json",
-                    )
-                except:
-                    # Create temp_results directory locally if needed
-                    if os.path.exists(f"{tournament_id}/temp_results") == False:
-                        os.makedirs(f"{tournament_id}/temp_results")
-                    with open(
-                        f"{tournament_id}/temp_results/{event_name}.json", "w"
-                    ) as f:
-                        f.write(json.dumps(single_event_result_data))
+            results_by_event[checkpoint_name] = single_event_result_data
+            # At the end, save the event's results as a checkpoint
+            checkpoint_store.record(event_option[0], single_event_result_data)
+            if status_reporter is not None:
+                status_reporter.advance()
     else:
-        thread_arguments = []
-        # Pass options so that parallel processes can create their own browser sessions
-        chrome_options_tuple = (
-            chrome_options,
-            chrome_service,
-        )
-        for event_option in event_options:
-            # Add the value and text to the thread arguments
-            thread_arguments.append(
-                (
+        with futures.ThreadPoolExecutor(max_workers=browser_pool.size) as executor:
+            future_to_event_option = {}
+            for event_option in event_options_tuples:
+                checkpoint_name = CheckpointStore.checkpoint_name(event_option[0])
+                if checkpoint_name in completed_events:
+                    results_by_event[checkpoint_name] = completed_events[
+                        checkpoint_name
+                    ]
+                    continue
+                # Each thread borrows a browser session from the pool, so at most browser_pool_size pages load at once
+                thread_arguments = (
                     event_option,
                     base_url,
-                    chrome_options_tuple,
+                    browser_pool,
                     final_results_identifiers,
                     final_round_results_identifiers,
                     scrape_entry_records,
                 )
-            )
-        with futures.ThreadPoolExecutor(max_workers=len(thread_arguments)) as executor:
-            results = list(
-                executor.map(
-                    parse_results_wrapper, thread_arguments, timeout=1500
-                )  # 25 minutes - Harvard is slow
-            )
+                future = executor.submit(parse_results_wrapper, thread_arguments)
+                future_to_event_option[future] = event_option
+            # Checkpoint each event as soon as it finishes, so a timeout only loses events still in flight
+            for future in futures.as_completed(
+                future_to_event_option, timeout=1500
+            ):  # 25 minutes - Harvard is slow
+                event_option = future_to_event_option[future]
+                event_result = future.result()
+                results_by_event[CheckpointStore.checkpoint_name(event_option[0])] = (
+                    event_result
+                )
+                checkpoint_store.record(event_option[0], event_result)
+                if status_reporter is not None:
+                    status_reporter.advance()
+    # Keep results in the same order as the event dropdown
+    results = [
+        results_by_event[CheckpointStore.checkpoint_name(event_option[0])]
+        for event_option in event_options_tuples
+    ]
 
     # Get attendee data
-    school_set, state_set = get_schools_and_states(
-        tournament_id=tournament_id,
-        browser=browser,
-    )
+    with browser_pool.session() as browser:
+        school_set, state_set = get_schools_and_states(
+            tournament_id=tournament_id,
+            browser=browser,
+        )
 
     # Get a counter with how many entries were from each school, for funsies
     entry_schools = []
@@ -230,24 +207,29 @@ def main(
         logging.warning("No schools found -- aggregating data from results")
         school_set = set(entry_schools)
 
-    school_short_name_dict = {
-        school: resolve_longname_to_shortname(school) for school in school_set
-    }
-    # Get a map of judges to schools
-    judge_map = get_judge_map(
-        tournament_id=tournament_id,
-        browser=browser,
-        school_short_name_dict=school_short_name_dict,
+    # Optionally reuse short names learned (or hand-corrected) in earlier tournaments
+    school_short_name_resolver = SchoolShortNameResolver(
+        cache_file=os.environ.get("SCHOOL_SHORT_NAME_CACHE_FILE"),
     )
+    school_short_name_dict = school_short_name_resolver.resolve_all(sorted(school_set))
+    school_short_name_resolver.save()
+    with browser_pool.session() as browser:
+        # Get a map of judges to schools
+        judge_map = get_judge_map(
+            tournament_id=tournament_id,
+            browser=browser,
+            school_short_name_dict=school_short_name_dict,
+        )
 
-    # Get any sweeps results
-    browser.get(base_url)
-    sweep_list = get_sweeps_results(
-        browser=browser,
-    )
+        # Get any sweeps results
+        browser.get(base_url)
+        sweep_list = get_sweeps_results(
+            browser=browser,
+        )
 
-    # Close the browser session
-    browser.quit()
+    # Close the browser sessions
+    browser_pool.navigation_stats.log_summary()
+    browser_pool.close()
     return {
         "results": results,
         "name_to_school_dict": name_to_school_dict_overall,
@@ -279,11 +261,31 @@ if __name__ == "__main__":
         action="store_true",
         default=True,
     )
+    parser.add_argument(
+        "-b",
+        "--scrape-backend",
+        help="How to read Tabroom.com pages: 'chrome' (headless Chrome via Selenium), 'http' (pooled HTTP session, no browser), or 'replay' (only pages already in the page cache, no network).",
+        choices=SCRAPE_BACKENDS,
+        default="http",
+    )
+    parser.add_argument(
+        "-p",
+        "--browser-pool-size",
+        help="How many logged-in browser sessions to scrape events with at once. 1 scrapes events one at a time.",
+        type=int,
+        default=DEFAULT_BROWSER_POOL_SIZE,
+    )
     args = parser.parse_args()
     tournament_id = args.tournament_id
     scrape_entry_records_bool = args.scrape_entry_records
     results = main(
         tournament_id=tournament_id,
         scrape_entry_records=scrape_entry_records_bool,
+        chrome_options=None,
+        chrome_service=None,
+        data_bucket=None,
+        scrape_backend=args.scrape_backend,
+        force_single_process=args.browser_pool_size <= 1,
+        browser_pool_size=args.browser_pool_size,
     )
     print(json.dumps(results), indent=2)
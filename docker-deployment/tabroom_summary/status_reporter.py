@@ -0,0 +1,134 @@
+import datetime
+import json
+import logging
+import os
+import threading
+import time
+
+STATUS_FILE_NAME = "status.json"
+# Progress within a stage is published at most this often; stage changes are always published straight away
+DEFAULT_MIN_PUBLISH_INTERVAL_SECONDS = 15
+
+
+class StatusReporter:
+    """
+    Publishes a small progress document for a generation run to <tournament_id>/status.json, so the website can
+    show a progress bar by reading one object instead of inspecting the run's output.
+
+    The document looks like:
+    {
+        "tournament_id": "12345",
+        "stage": "scraping",
+        "unit": "events",  # what done/total count -- events, or schools while writing prompts
+        "done": 12,
+        "total": 40,  # null when the stage's total isn't known up front
+        "elapsed_seconds": 95,
+        "eta_seconds": 210,  # estimated time left in the current stage; null until there's a rate to go on
+        "updated_at": "<UTC ISO timestamp>",
+    }
+    Stages, in order: downloading, scraping, parsing, writing_prompts, then complete or failed.
+
+    advance() may be called from several scraping threads at once. Publishing is throttled to one write per
+    min_publish_interval_seconds, and a failed write is logged rather than raised -- progress is never worth failing
+    a run over.
+    """
+
+    def __init__(
+        self,
+        tournament_id: str,
+        s3_client=None,
+        bucket_name: str = None,
+        min_publish_interval_seconds: float = DEFAULT_MIN_PUBLISH_INTERVAL_SECONDS,
+    ):
+        self.tournament_id = tournament_id
+        self.s3_client = s3_client
+        self.bucket_name = bucket_name
+        self.min_publish_interval_seconds = min_publish_interval_seconds
+        self.lock = threading.Lock()
+        self.started_at = time.monotonic()
+        self.stage_name = None
+        self.stage_started_at = self.started_at
+        self.unit = "events"
+        self.done = 0
+        self.total = None
+        # Items already done when the stage started (eg. events checkpointed by an earlier run) don't count towards
+        # the rate
+        self.done_at_stage_start = 0
+        self.last_published_at = None
+
+    @property
+    def key(self):
+        return f"{self.tournament_id}/{STATUS_FILE_NAME}"
+
+    def stage(
+        self, stage_name: str, total: int = None, done: int = 0, unit: str = "events"
+    ):
+        """
+        Start a new stage and publish it.
+        """
+        with self.lock:
+            self.stage_name = stage_name
+            self.stage_started_at = time.monotonic()
+            self.unit = unit
+            self.total = total
+            self.done = done
+            self.done_at_stage_start = done
+        self.publish(force=True)
+
+    def advance(self, count: int = 1):
+        """
+        Mark items as done in the current stage; publishes if it has been a while since the last update.
+        """
+        with self.lock:
+            self.done += count
+        self.publish()
+
+    def to_dict(self):
+        with self.lock:
+            now = time.monotonic()
+            eta_seconds = None
+            done_this_stage = self.done - self.done_at_stage_start
+            if self.total is not None and done_this_stage > 0:
+                seconds_per_item = (now - self.stage_started_at) / done_this_stage
+                eta_seconds = round(seconds_per_item * max(self.total - self.done, 0))
+            return {
+                "tournament_id": self.tournament_id,
+                "stage": self.stage_name,
+                "unit": self.unit,
+                "done": self.done,
+                "total": self.total,
+                "elapsed_seconds": round(now - self.started_at),
+                "eta_seconds": eta_seconds,
+                "updated_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            }
+
+    def publish(self, force: bool = False):
+        with self.lock:
+            now = time.monotonic()
+            if (
+                not force
+                and self.last_published_at is not None
+                and now - self.last_published_at < self.min_publish_interval_seconds
+            ):
+                return
+            self.last_published_at = now
+        status = self.to_dict()
+        body = json.dumps(status, indent=2)
+        try:
+            if self.s3_client is not None:
+                self.s3_client.put_object(
+                    Body=body,
+                    Bucket=self.bucket_name,
+                    Key=self.key,
+                    ContentType="application/json",
+                    # Polled while the run progresses, so readers should always fetch the latest copy
+                    CacheControl="no-cache",
+                )
+            else:
+                os.makedirs(self.tournament_id, exist_ok=True)
+                with open(self.key, "w") as f:
+                    f.write(body)
+        except Exception as ex:
+            logging.warning(
+                f"Error publishing status for {self.tournament_id}: {repr(ex)}"
+            )
@@ -0,0 +1,43 @@
+import gzip
+
+GZIP_MAGIC = b"\x1f\x8b"
+CONTENT_ENCODING = (
+    "gzip"  # Pass as ContentEncoding when uploading compressed objects to S3
+)
+
+
+def compress(data):
+    """
+    Gzip a str (encoded as UTF-8) or bytes for storage.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return gzip.compress(data, compresslevel=6)
+
+
+def decompress(data: bytes):
+    """
+    Returns the original bytes of a stored object. Objects written before compression was added are passed through
+    unchanged, so old and new artifacts read the same way.
+    """
+    if data[:2] == GZIP_MAGIC:
+        return gzip.decompress(data)
+    return data
+
+
+def open_for_reading(file_location):
+    """
+    Open a stored file as a binary stream, transparently decompressing it if it was gzipped.
+    """
+    with open(file_location, "rb") as f:
+        is_compressed = f.read(2) == GZIP_MAGIC
+    if is_compressed:
+        return gzip.open(file_location, "rb")
+    return open(file_location, "rb")
+
+
+def open_for_writing(file_location):
+    """
+    Open a file for writing gzipped bytes in a streaming fashion.
+    """
+    return gzip.open(file_location, "wb", compresslevel=6)
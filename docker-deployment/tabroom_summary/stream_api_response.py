@@ -0,0 +1,36 @@
+import gzip
+import ijson
+import logging
+from .find_or_download_api_response import download_api_response
+from .load_api_metadata import load_api_metadata
+from .storage_codec import open_for_reading
+
+
+def stream_api_response(tournament_id, file_size_limit_mb: int = 5):
+    """
+    Streaming alternative to find_or_download_api_response for big tournaments.
+
+    Returns 2 items in a tuple:
+    1. A dict of the tournament's top-level metadata (name, start, end, city, state, ...) -- everything but "categories"
+    2. An iterator that yields one event dict at a time, in the same order as walking categories -> events
+
+    Only one event is held in memory at a time, so peak memory is bounded by the largest event rather than the
+    whole tournament.
+    """
+    file_location = download_api_response(tournament_id, file_size_limit_mb)
+    try:
+        metadata = load_api_metadata(file_location)
+    except (ijson.JSONError, EOFError, gzip.BadGzipFile):
+        logging.warning(
+            f"Failed to load {file_location}. Will attempt to download from tabroom.com"
+        )
+        file_location = download_api_response(
+            tournament_id, file_size_limit_mb, force_download=True
+        )
+        metadata = load_api_metadata(file_location)
+    return metadata, iter_api_events(file_location)
+
+
+def iter_api_events(file_location):
+    with open_for_reading(file_location) as f:
+        yield from ijson.items(f, "categories.item.events.item", use_float=True)
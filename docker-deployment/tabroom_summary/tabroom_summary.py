@@ -1,4 +1,5 @@
 import boto3
+import gzip
 import json
 import logging
 import urllib.request
@@ -9,13 +10,21 @@ import datetime
 from selenium import webdriver
 from tempfile import mkdtemp
 from .scraper import tabroom_scrape as tabroom_scrape
-from .update_global_entry_dictionary import update_global_entry_dictionary
+from .scraper.browser_pool import DEFAULT_BROWSER_POOL_SIZE
+from .entry_index import EntryIndex
+from .scraped_results_index import ScrapedResultsIndex
 from .parse_arguments import parse_arguments
 from .group_data_by_school import group_data_by_school
+from .remove_duplicate_prelim_seeds import remove_duplicate_prelim_seeds
+from .result_table import ResultTable
 from .generate_llm_prompts import generate_llm_prompts
+from .pack_results import DEFAULT_PROMPT_TOKEN_BUDGET
+from .school_prompt_uploader import SchoolPromptUploader
+from .status_reporter import StatusReporter
 from .parse_result_sets import parse_result_sets
 from .save_scraped_results import save_scraped_results
-from .find_or_download_api_response import find_or_download_api_response
+from .stream_api_response import stream_api_response
+from .storage_codec import decompress
 
 
 def main(
@@ -24,12 +33,23 @@ def main(
     # custom_url: str = "",
     percentile_minimum: int = 40,
     max_results_to_pass_to_gpt: int = 15,
+    prompt_token_budget: int = DEFAULT_PROMPT_TOKEN_BUDGET,
+    prompt_encoding: str = "rows",
     context: str = "",
     scrape_entry_records_bool: bool = True,
     default_qualifier_count: int = 1,
+    scrape_backend: str = "chrome",
+    force_single_process: bool = True,
+    browser_pool_size: int = DEFAULT_BROWSER_POOL_SIZE,
+    remove_duplicate_prelim_final_places_rows: bool = True,
+    school_prompt_uploader: SchoolPromptUploader = None,
+    status_reporter: StatusReporter = None,
 ):
     os.environ["IS_NSDA_NATIONALS"] = "False"
-    response_data = find_or_download_api_response(tournament_id)
+    if status_reporter is not None:
+        status_reporter.stage("downloading")
+    # Only the tournament metadata is loaded up front; events are streamed one at a time further down
+    response_data, api_events = stream_api_response(tournament_id)
     response_data["id"] = tournament_id
     if re.match(r"National Speech and Debate Tournament", response_data["name"]):
         os.environ["IS_NSDA_NATIONALS"] = "True"
@@ -80,10 +100,10 @@ def main(
         file_location = f"{tournament_id}/scraped_results.json"
         if os.path.exists(file_location):
             try:
-                with open(file_location, "r") as f:
-                    scrape_output = json.load(f)
+                with open(file_location, "rb") as f:
+                    scrape_output = json.loads(decompress(f.read()))
                 must_scrape = False
-            except json.JSONDecodeError:
+            except (json.JSONDecodeError, EOFError, gzip.BadGzipFile):
                 logging.info("Scraped results file is corrupted. Scraping tabroom.com")
                 must_scrape = True
         else:
@@ -96,15 +116,23 @@ def main(
         s3_client = boto3.client("s3")
         try:
             scrape_output = json.loads(
-                s3_client.get_object(
-                    Bucket=data_bucket,
-                    Key=f"{tournament_id}/scraped_results.json",
-                )["Body"].read()
+                decompress(
+                    s3_client.get_object(
+                        Bucket=data_bucket,
+                        Key=f"{tournament_id}/scraped_results.json",
+                    )["Body"].read()
+                )
             )
             must_scrape = False
         except s3_client.exceptions.NoSuchKey:
             logging.info("No scraped results found in S3. Scraping tabroom.com")
             must_scrape = True
+    # Replay re-parses every page from the page cache, so ignore any previously saved output
+    if scrape_backend == "replay":
+        logging.info(
+            "Replay mode: re-parsing cached pages instead of loading scraped results"
+        )
+        must_scrape = True
     if must_scrape:
         scrape_output = tabroom_scrape.main(
             tournament_id=tournament_id,
@@ -112,6 +140,10 @@ def main(
             chrome_options=options,
             chrome_service=service,
             data_bucket=data_bucket,
+            scrape_backend=scrape_backend,
+            force_single_process=force_single_process,
+            browser_pool_size=browser_pool_size,
+            status_reporter=status_reporter,
         )
         save_scraped_results(scrape_output, tournament_id)
     scraped_results = scrape_output["results"]
@@ -146,41 +178,38 @@ def main(
         "place",
         "results_by_round",
     ]
-    tournament_results = []
-    entry_id_to_entry_code_dictionary = {}
-    entry_id_to_entry_entry_name_dictionary = {}
+    # Results are stored as compact fixed-schema records rather than one dict per row
+    tournament_results = ResultTable()
+    # Maps entry IDs to names/codes/events for every event seen so far
+    entry_index = EntryIndex(name_to_school_dict=name_to_school_dict)
+    # Maps event names to their scraped result sets so each event's lookup is a dict access
+    scraped_results_index = ScrapedResultsIndex(scraped_results)
     has_speech = False
     has_debate = False
-    for category in response_data.get("categories", []):
-        for event in category.get("events", []):
-            # Create dictionaries to map the entry ID to an Entry Code and Entry Name
-            # This only looks at the first non-elim round of the event -- theoretically that could be a problem for late adds
-            all_rounds = event.get("rounds", [])
-            for round in all_rounds:
-                if round["type"] == "elim" or round["type"] == "final":
-                    continue
-                round_to_pull_entry_data_from = round
-                update_global_entry_dictionary(
-                    sections=round_to_pull_entry_data_from.get("sections", []),
-                    code_dictionary=entry_id_to_entry_code_dictionary,
-                    entry_dictionary=entry_id_to_entry_entry_name_dictionary,
-                )
-            # Parse the result set and get its important info
-            (
-                event_is_speech,
-                event_is_debate,
-                results_data_from_event,
-            ) = parse_result_sets(
-                event=event,
-                entry_id_to_entry_code_dictionary=entry_id_to_entry_code_dictionary,
-                entry_id_to_entry_entry_name_dictionary=entry_id_to_entry_entry_name_dictionary,
-                name_to_school_dict=name_to_school_dict,
-                scraped_results=scraped_results,
-            )
-            # Update long-lived variables with the data
-            has_speech = has_speech or event_is_speech
-            has_debate = has_debate or event_is_debate
-            tournament_results += results_data_from_event
+    # The API events are streamed, so their count isn't known until they've all been parsed
+    if status_reporter is not None:
+        status_reporter.stage("parsing")
+    # Events are streamed from the API response, so only one is in memory at a time
+    for event in api_events:
+        # Index the event's entry IDs (from every round, so late adds are included) before parsing its results
+        entry_index.add_event(event)
+        # Parse the result set and get its important info
+        (
+            event_is_speech,
+            event_is_debate,
+            results_data_from_event,
+        ) = parse_result_sets(
+            event=event,
+            entry_index=entry_index,
+            name_to_school_dict=name_to_school_dict,
+            scraped_results_index=scraped_results_index,
+        )
+        # Update long-lived variables with the data
+        has_speech = has_speech or event_is_speech
+        has_debate = has_debate or event_is_debate
+        tournament_results.extend(results_data_from_event)
+        if status_reporter is not None:
+            status_reporter.advance()
 
     # Check if a result name has a 'full name' in the full name dictionary (scraped from Tabroom.com)
     # If it exists, replace the short name with the full name
@@ -192,6 +221,12 @@ def main(
             if result["entry_name"] in name_to_full_name_dict:
                 result["entry_name"] = name_to_full_name_dict[result["entry_name"]]
 
+    # Remove Prelim Seeds if there is a Final Places entry with the same data
+    if remove_duplicate_prelim_final_places_rows:
+        tournament_results = ResultTable(
+            remove_duplicate_prelim_seeds(tournament_results)
+        )
+
     schools_to_write_up = school_set
     grouped_data = group_data_by_school(
         school_short_name_dict=school_short_name_dict,
@@ -200,7 +235,12 @@ def main(
 
     # Generate a school-keyed dict of all the LLM prompts and responses for each school
     # Use the school SHORTNAME as the key
-    all_schools_dict = generate_llm_prompts(
+    all_schools_dict = {}
+    if status_reporter is not None:
+        status_reporter.stage(
+            "writing_prompts", total=len(schools_to_write_up), unit="schools"
+        )
+    school_prompts_generator = generate_llm_prompts(
         tournament_data=response_data,
         # custom_url=custom_url,
         school_count=len(school_set),
@@ -213,12 +253,21 @@ def main(
         grouped_data=grouped_data,
         percentile_minimum=percentile_minimum,
         max_results_to_pass_to_gpt=max_results_to_pass_to_gpt,
+        prompt_token_budget=prompt_token_budget,
+        prompt_encoding=prompt_encoding,
         data_labels=data_labels,
         school_short_name_dict=school_short_name_dict,
         judge_map=scrape_output["judge_map"],
         default_qualifier_count=default_qualifier_count,
         # is_nsda_qualifier=is_nsda_qualifier,
     )
+    for short_school_name, school_prompts in school_prompts_generator:
+        all_schools_dict[short_school_name] = school_prompts
+        # Start uploading this school's prompts while the next school's are rendered
+        if school_prompt_uploader is not None:
+            school_prompt_uploader.submit(short_school_name, school_prompts)
+        if status_reporter is not None:
+            status_reporter.advance()
     # return a dictionary of schools with the summary text and all LLM prompts, as well as some basic tournament metadata
     return (all_schools_dict, response_data)
 
@@ -232,6 +281,8 @@ if __name__ == "__main__":
     custom_url = args.custom_url
     percentile_minimum = int(args.percentile_minimum)
     max_results_to_pass_to_gpt = int(args.max_results)
+    prompt_token_budget = int(args.prompt_token_budget)
+    prompt_encoding = args.prompt_encoding
     context = args.context
     scrape_entry_records_bool = bool(args.scrape_entry_records_bool)
     main(
@@ -240,6 +291,8 @@ if __name__ == "__main__":
         custom_url=custom_url,
         percentile_minimum=percentile_minimum,
         max_results_to_pass_to_gpt=max_results_to_pass_to_gpt,
+        prompt_token_budget=prompt_token_budget,
+        prompt_encoding=prompt_encoding,
         context=context,
         scrape_entry_records_bool=scrape_entry_records_bool,
     )
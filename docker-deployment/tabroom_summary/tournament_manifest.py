@@ -0,0 +1,115 @@
+import datetime
+import hashlib
+import json
+import logging
+import os
+import threading
+from .estimate_tokens import estimate_tokens
+
+MANIFEST_FILE_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+GENERATING = "generating"
+COMPLETE = "complete"
+FAILED = "failed"
+
+
+class TournamentManifest:
+    """
+    A single small index of what a generation run produced for a tournament, saved to <tournament_id>/manifest.json.
+
+    The website answers "which schools have results?" and "is generation still running?" by reading this one object,
+    instead of listing the tournament's prefix (which caps at 1000 keys) and splitting every key.
+
+    Saved manifests look like:
+    {
+        "version": 1,
+        "tournament_id": "12345",
+        "status": "generating" | "complete" | "failed",
+        "updated_at": "<UTC ISO timestamp>",
+        "error": "<repr of the failure, only when status is failed>",
+        "schools": ["<short school name>", ...],
+        "artifacts": {
+            "<short school name>": {
+                "gpt_prompt": {
+                    "key": "<S3 key>",
+                    "size": <stored bytes>,
+                    "sha256": "<hash of the prompt text>",
+                    "estimated_tokens": <rough input token count, see estimate_tokens>,
+                },
+                "numbered_list_prompt": {...},
+            },
+        },
+    }
+    Hashes are of the UTF-8 prompt text rather than the stored (gzipped) bytes, so they only change when a prompt does.
+    Artifacts can be added from several upload threads at once.
+    """
+
+    def __init__(self, tournament_id: str):
+        self.tournament_id = tournament_id
+        self.artifacts = {}
+        self.lock = threading.Lock()
+
+    @property
+    def key(self):
+        return f"{self.tournament_id}/{MANIFEST_FILE_NAME}"
+
+    def add_artifact(
+        self,
+        short_school_name: str,
+        prompt_name: str,
+        key: str,
+        prompt: str,
+        stored_size: int = None,
+    ):
+        prompt_bytes = prompt.encode("utf-8")
+        artifact = {
+            "key": key,
+            "size": len(prompt_bytes) if stored_size is None else stored_size,
+            "sha256": hashlib.sha256(prompt_bytes).hexdigest(),
+            "estimated_tokens": estimate_tokens(prompt),
+        }
+        with self.lock:
+            self.artifacts.setdefault(short_school_name, {})[prompt_name] = artifact
+
+    def to_dict(self, status: str, error: str = None):
+        with self.lock:
+            artifacts = {
+                school: dict(school_artifacts)
+                for school, school_artifacts in sorted(self.artifacts.items())
+            }
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "tournament_id": self.tournament_id,
+            "status": status,
+            "updated_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "schools": list(artifacts),
+            "artifacts": artifacts,
+        }
+        if error is not None:
+            manifest["error"] = error
+        return manifest
+
+    def save(self, status: str, s3_client=None, bucket_name: str = None, error=None):
+        """
+        Write the manifest with the given status to S3 (if an S3 client is given) or to the local tournament folder.
+        Returns the manifest as saved.
+        """
+        manifest = self.to_dict(status=status, error=error)
+        body = json.dumps(manifest, indent=2)
+        if s3_client is not None:
+            s3_client.put_object(
+                Body=body,
+                Bucket=bucket_name,
+                Key=self.key,
+                ContentType="application/json",
+                # The manifest is rewritten as the run progresses, so readers should always fetch the latest copy
+                CacheControl="no-cache",
+            )
+        else:
+            os.makedirs(self.tournament_id, exist_ok=True)
+            with open(self.key, "w") as f:
+                f.write(body)
+        logging.info(
+            f"Saved {status} manifest for tournament {self.tournament_id} with {len(manifest['schools'])} schools"
+        )
+        return manifest
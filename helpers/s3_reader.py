@@ -1,4 +1,5 @@
 import boto3
+import gzip
 import json
 import logging
 import re
@@ -28,14 +29,14 @@ for tournament in tournaments:
         # Skip tournaments that don't have an API response field
         if re.search(r"api_response.json", file["Key"]):
             has_api_response = True
-            tournament_data = json.loads(
-                s3_client.get_object(
-                    Bucket=BUCKET_NAME,
-                    Key=tournament + "api_response.json",
-                )["Body"]
-                .read()
-                .decode("utf-8")
-            )
+            api_response_body = s3_client.get_object(
+                Bucket=BUCKET_NAME,
+                Key=tournament + "api_response.json",
+            )["Body"].read()
+            # Newer API responses are stored gzipped
+            if api_response_body[:2] == b"\x1f\x8b":
+                api_response_body = gzip.decompress(api_response_body)
+            tournament_data = json.loads(api_response_body.decode("utf-8"))
             data_object = {
                 "tournament_id": tournament.replace("/", ""),
                 "tournament_name": tournament_data["name"],
@@ -29,6 +29,7 @@ data "aws_iam_policy_document" "lambda_s3_writes" {
       "s3:GetObject*",
       "s3:PutObject",
       "s3:ListBucket",
+      "s3:DeleteObject", # Releasing per-school results leases and generation leases
     ]
 
     resources = [
@@ -64,6 +65,7 @@ data "aws_iam_policy_document" "summmarizer_role" {
       "s3:GetObject*",
       "s3:PutObject",
       "s3:ListBucket",
+      "s3:DeleteObject", # Releasing the tournament's generation lease
     ]
 
     resources = [
@@ -37,6 +37,7 @@ resource "aws_lambda_function" "batch_process_lambda_function" {
     variables = {
       TARGET_TABROOM_SUMMARY_LAMBDA = "docker-selenium-lambda-tabroom-prod-main"
       DDB_NAME = var.ddb_table_name
+      DATA_BUCKET_NAME = "tabroom-summaries-data-bucket"
     }
   }
   source_code_hash = data.archive_file.batch_process_lambda_source.output_base64sha256
@@ -3,7 +3,10 @@ import datetime
 import json
 import logging
 import os
+import time
+import uuid
 from boto3.dynamodb.conditions import Key, Attr
+from botocore.exceptions import ClientError
 
 if len(logging.getLogger().handlers) > 0:
     # The Lambda environment pre-configures a handler logging to stderr. If a handler is already configured,
@@ -12,10 +15,59 @@ if len(logging.getLogger().handlers) > 0:
 else:
     logging.basicConfig(level=logging.INFO)
 
+# Held by the run generating a tournament's prompts (see tabroom_summary/generation_lease.py in docker-deployment)
+GENERATION_LEASE_FILE_NAME = "generation.lease"
+GENERATION_LEASE_TTL_SECONDS = 10 * 60
+# S3 error codes meaning a conditional write lost to someone else's write
+LOST_RACE_ERROR_CODES = [
+    "PreconditionFailed",
+    "ConditionalRequestConflict",
+    "NoSuchKey",
+]
+
+
+def acquire_generation_lease(s3_client, bucket_name, tournament_id):
+    """
+    Take the tournament's generation lease, so a user-requested run and a batch run never scrape the same tournament
+    at once. Returns the owner ID to pass to the tabroom_summary Lambda (which adopts the lease), or None if another
+    run holds an unexpired lease.
+    """
+    key = f"{tournament_id}/{GENERATION_LEASE_FILE_NAME}"
+    owner = str(uuid.uuid4())
+    lease_body = json.dumps(
+        {"owner": owner, "expires_at": time.time() + GENERATION_LEASE_TTL_SECONDS}
+    )
+    try:
+        s3_client.put_object(
+            Body=lease_body, Bucket=bucket_name, Key=key, IfNoneMatch="*"
+        )
+        return owner
+    except ClientError as ex:
+        if ex.response["Error"]["Code"] not in LOST_RACE_ERROR_CODES:
+            raise
+    # Someone holds (or held) the lease -- take it over only if it has expired
+    try:
+        existing_lease = s3_client.get_object(Bucket=bucket_name, Key=key)
+    except ClientError:
+        return None
+    if json.loads(existing_lease["Body"].read())["expires_at"] > time.time():
+        return None
+    try:
+        s3_client.put_object(
+            Body=lease_body, Bucket=bucket_name, Key=key, IfMatch=existing_lease["ETag"]
+        )
+        return owner
+    except ClientError as ex:
+        if ex.response["Error"]["Code"] not in LOST_RACE_ERROR_CODES:
+            raise
+        return None
+
 
 def lambda_handler(event, context):
     ddb_name = os.getenv("DDB_NAME")
     target_lambda = os.getenv("TARGET_TABROOM_SUMMARY_LAMBDA")
+    bucket_name = os.getenv("DATA_BUCKET_NAME", "tabroom-summaries-data-bucket")
+    s3_client = boto3.client("s3")
     today = datetime.datetime.now()
     # Walk through all the DDB entries that are not processed
     ddb_resource = boto3.resource(
@@ -45,6 +97,16 @@ def lambda_handler(event, context):
             )
             continue
         else:
+            lease_owner = acquire_generation_lease(
+                s3_client=s3_client,
+                bucket_name=bucket_name,
+                tournament_id=tournament_id,
+            )
+            if lease_owner is None:
+                logging.info(
+                    f"Skipping tournament {tournament_name} ({tournament_id}) because it is already being generated."
+                )
+                continue
             # Asynchronously invoke the Lambda function to process the tournament data
             logging.info(
                 f"Invoking {target_lambda} for tournament {tournament_name} ({tournament_id})"
@@ -57,6 +119,7 @@ def lambda_handler(event, context):
                     {
                         "tournament": tournament_id,
                         "school": "None/Batch-Requested",
+                        "generation_lease_owner": lease_owner,
                     }
                 ),
             )
@@ -59,6 +59,17 @@ data "aws_iam_policy_document" "batch_process_lambda_permissions" {
     ]
   }
 
+  statement {
+    # Taking a tournament's generation lease before invoking the summary Lambda
+    actions = [
+      "s3:GetObject",
+      "s3:PutObject",
+    ]
+    resources = [
+      "arn:aws:s3:::tabroom-summaries-data-bucket/*/generation.lease",
+    ]
+  }
+
   statement {
     actions = [
       # "dynamodb:PutItem",
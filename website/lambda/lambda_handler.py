@@ -1,15 +1,70 @@
+import gzip
 import json
 import boto3
 import os
 import logging
-import re
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from botocore.exceptions import ClientError
 
 """
 This is the main Lambda handler for the website.
 """
 
+GZIP_MAGIC = b"\x1f\x8b"
+# Written by the tabroom_summary Lambda -- see tabroom_summary/tournament_manifest.py
+MANIFEST_FILE_NAME = "manifest.json"
+COMPLETE = "complete"
+FAILED = "failed"
+# Don't retry a failed run for this long -- it will most likely fail the same way
+FAILED_GENERATION_RETRY_DELAY = timedelta(hours=1)
+# Held by the run generating a tournament's prompts (see tabroom_summary/generation_lease.py). Taken here before
+# invoking the generator, which adopts it and keeps it alive with a heartbeat until it finishes.
+GENERATION_LEASE_FILE_NAME = "generation.lease"
+GENERATION_LEASE_TTL_SECONDS = 10 * 60
+# Folders under a tournament's prefix that don't belong to a school
+NON_SCHOOL_FOLDERS = ["temp_results", "page_cache"]
+# Progress published by the generation run (see tabroom_summary/status_reporter.py); the front end polls it
+STATUS_FILE_NAME = "status.json"
+STILL_GENERATING_MESSAGE = "Still generating results! Check back soon!\nConsider opening a GitHub issue at https://github.com/benjmor/tabroom_auto_summarize/issues if this message persists."
+# One request per school generates results.txt; concurrent requests wait for it instead of calling the LLM again
+RESULTS_LEASE_FILE_NAME = "results.lease"
+# Outlives the Lambda timeout (57s), so a crashed lease holder is replaced on the next request after it
+RESULTS_LEASE_TTL_SECONDS = 60
+# Leave room to respond before API Gateway gives up at 60s
+RESULTS_WAIT_SECONDS = 45
+RESULTS_POLL_INTERVAL_SECONDS = 2
+
+
+def decode_s3_body(body: bytes):
+    """
+    Prompts and other generated objects may be stored gzipped (with ContentEncoding: gzip). boto3 does not
+    decompress those, so sniff the gzip magic bytes and decompress here; older plain objects pass through unchanged.
+    """
+    if body[:2] == GZIP_MAGIC:
+        return gzip.decompress(body)
+    return body
+
+
+# Created once per Lambda container and reused across warm invocations (boto3 clients are thread-safe)
+@lru_cache(maxsize=None)
+def get_bedrock_runtime_client():
+    return boto3.client(service_name="bedrock-runtime", region_name="us-east-1")
+
+
+@lru_cache(maxsize=None)
+def get_model_id():
+    """
+    The inference profile ARN for the summary model. Looking up the account ID is an STS round trip, so it's only done
+    once per Lambda container.
+    """
+    account_id = boto3.client("sts").get_caller_identity().get("Account")
+    return f"arn:aws:bedrock:us-east-1:{account_id}:inference-profile/global.anthropic.claude-haiku-4-5-20251001-v1:0"
+
 
 class Claude3Wrapper:
     """Encapsulates Claude 3 model invocations using the Amazon Bedrock Runtime client."""
@@ -32,14 +87,11 @@ class Claude3Wrapper:
         :return: Inference response from the model.
         """
 
-        # Initialize the Amazon Bedrock runtime client
-        client = self.client or boto3.client(
-            service_name="bedrock-runtime", region_name="us-east-1"
-        )
+        # Use the Amazon Bedrock runtime client cached for this Lambda container
+        client = self.client or get_bedrock_runtime_client()
 
         # Invoke Claude 3 with the text prompt
-        account_id = boto3.client("sts").get_caller_identity().get("Account")
-        model_id = f"arn:aws:bedrock:us-east-1:{account_id}:inference-profile/global.anthropic.claude-haiku-4-5-20251001-v1:0"
+        model_id = get_model_id()
 
         try:
             response = client.invoke_model(
@@ -87,45 +139,67 @@ class Claude3Wrapper:
     # snippet-end:[python.example_code.bedrock-runtime.InvokeAnthropicClaude3Text]
 
 
+def generate_numbered_list(
+    claude_client,
+    s3_client,
+    bucket_name,
+    numbered_list_prompt_path,
+    numbered_list_prompt=None,
+):
+    """
+    Returns the LLM's event-by-event results list for a school, fetching the numbered list prompt from S3 if it wasn't
+    passed in. Returns None if the prompt is missing or the LLM call fails -- the list is optional.
+    """
+    try:
+        if numbered_list_prompt is None:
+            numbered_list_prompt = decode_s3_body(
+                s3_client.get_object(
+                    Bucket=bucket_name,
+                    Key=numbered_list_prompt_path,
+                )["Body"].read()
+            ).decode("utf-8")
+        return claude_client.invoke_claude_3_with_text(numbered_list_prompt)
+    except Exception as ex:
+        print(f"Error getting numbered list prompt: {ex}")
+        return None
+
+
 def send_prompt_to_llm_and_save_to_s3(
     prompt,
     s3_client,
     bucket_name,
     key,
     numbered_list_prompt_path,
+    numbered_list_prompt=None,
 ):
     """
-    This function will take a prompt, pass it to Claude3, save it to S3, then
+    This function will take a prompt and the school's numbered list prompt, pass both to Claude3 at the same time, then
+    save the combined response to S3. The user only waits for the slower of the two calls.
     """
-    claude_client = Claude3Wrapper(
-        boto3.client(
-            service_name="bedrock-runtime",
-            region_name="us-east-1",
-        )
-    )
-    full_response = claude_client.invoke_claude_3_with_text(
-        prompt + "\n" + "Do not prepend paragraphs with labels like 'Paragraph 1'."
-    )
+    claude_client = Claude3Wrapper(get_bedrock_runtime_client())
+    executor = ThreadPoolExecutor(max_workers=1)
     try:
-        numbered_prompt = (
-            s3_client.get_object(
-                Bucket=bucket_name,
-                Key=numbered_list_prompt_path,
-            )["Body"]
-            .read()
-            .decode("utf-8")
+        numbered_list_future = executor.submit(
+            generate_numbered_list,
+            claude_client=claude_client,
+            s3_client=s3_client,
+            bucket_name=bucket_name,
+            numbered_list_prompt_path=numbered_list_prompt_path,
+            numbered_list_prompt=numbered_list_prompt,
         )
-        bedrock_numbered_list_response = claude_client.invoke_claude_3_with_text(
-            numbered_prompt
+        full_response = claude_client.invoke_claude_3_with_text(
+            prompt + "\n" + "Do not prepend paragraphs with labels like 'Paragraph 1'."
         )
+        bedrock_numbered_list_response = numbered_list_future.result()
+    finally:
+        # If the summary call failed, don't make the user wait on the numbered list too
+        executor.shutdown(wait=False)
+    if bedrock_numbered_list_response is not None:
         full_response = (
             full_response
             + "\n### Event-by-Event Results"
             + bedrock_numbered_list_response
         )
-    except Exception as ex:
-        print(f"Error getting numbered list prompt: {ex}")
-        pass
     s3_client.put_object(
         Body=full_response,
         Bucket=bucket_name,
@@ -134,6 +208,296 @@ def send_prompt_to_llm_and_save_to_s3(
     return full_response
 
 
+class InMemoryLeaseStore:
+    """
+    Leases held in this process only. Used for tests and local runs (set RESULTS_LEASE_STORE=memory).
+
+    acquire() returns a token for the new lease, or None if someone else holds an unexpired lease on the key;
+    release() only releases the lease if the token still matches.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # {<key>: (<token>, <expiry as time.time()>)}
+        self.leases = {}
+
+    def acquire(self, key, ttl_seconds=RESULTS_LEASE_TTL_SECONDS):
+        with self.lock:
+            lease = self.leases.get(key)
+            if lease is not None and lease[1] > time.time():
+                return None
+            token = str(uuid.uuid4())
+            self.leases[key] = (token, time.time() + ttl_seconds)
+            return token
+
+    def release(self, key, token):
+        with self.lock:
+            lease = self.leases.get(key)
+            if lease is not None and lease[0] == token:
+                del self.leases[key]
+
+
+class S3LeaseStore:
+    """
+    Leases shared by every Lambda, stored as small JSON objects in the data bucket (same interface as
+    InMemoryLeaseStore). A lease looks like {"owner": <token>, "expires_at": <epoch seconds>}, the same format the
+    tabroom_summary Lambda uses for its generation lease.
+
+    A lease is taken with a conditional put (If-None-Match: *), so only one caller can create it. An expired lease
+    is taken over with If-Match on its ETag, so only one caller can replace it.
+    """
+
+    def __init__(self, s3_client, bucket_name):
+        self.s3_client = s3_client
+        self.bucket_name = bucket_name
+
+    def acquire(self, key, ttl_seconds=RESULTS_LEASE_TTL_SECONDS):
+        token = str(uuid.uuid4())
+        lease_body = json.dumps(
+            {"owner": token, "expires_at": time.time() + ttl_seconds}
+        )
+        try:
+            self.s3_client.put_object(
+                Body=lease_body,
+                Bucket=self.bucket_name,
+                Key=key,
+                IfNoneMatch="*",
+            )
+            return token
+        except ClientError as ex:
+            if ex.response["Error"]["Code"] not in [
+                "PreconditionFailed",
+                "ConditionalRequestConflict",
+            ]:
+                raise
+        # Someone holds (or held) the lease -- take it over only if it has expired
+        try:
+            existing_lease = self.s3_client.get_object(
+                Bucket=self.bucket_name,
+                Key=key,
+            )
+        except ClientError:
+            # Released between our put and get; let the next request try again rather than racing for it
+            return None
+        if json.loads(existing_lease["Body"].read())["expires_at"] > time.time():
+            return None
+        try:
+            self.s3_client.put_object(
+                Body=lease_body,
+                Bucket=self.bucket_name,
+                Key=key,
+                IfMatch=existing_lease["ETag"],
+            )
+            return token
+        except ClientError as ex:
+            if ex.response["Error"]["Code"] not in [
+                "PreconditionFailed",
+                "ConditionalRequestConflict",
+                "NoSuchKey",
+            ]:
+                raise
+            return None
+
+    def release(self, key, token):
+        try:
+            existing_lease = self.s3_client.get_object(
+                Bucket=self.bucket_name,
+                Key=key,
+            )
+            if json.loads(existing_lease["Body"].read())["owner"] == token:
+                self.s3_client.delete_object(Bucket=self.bucket_name, Key=key)
+        except Exception as ex:
+            # An unreleased lease just expires on its own
+            logging.warning(f"Error while releasing lease {key}: {repr(ex)}")
+
+
+IN_MEMORY_LEASE_STORE = InMemoryLeaseStore()
+
+
+def get_lease_store(s3_client, bucket_name):
+    if os.getenv("RESULTS_LEASE_STORE") == "memory":
+        return IN_MEMORY_LEASE_STORE
+    return S3LeaseStore(s3_client=s3_client, bucket_name=bucket_name)
+
+
+def read_results_file(s3_client, bucket_name, key):
+    return (
+        decode_s3_body(
+            s3_client.get_object(
+                Bucket=bucket_name,
+                Key=key,
+            )["Body"].read()
+        ).decode(encoding="utf-8", errors="replace")
+    ).replace("\ufffd", "--")
+
+
+def wait_for_results_file(
+    s3_client,
+    bucket_name,
+    key,
+    timeout_seconds=RESULTS_WAIT_SECONDS,
+    poll_interval_seconds=RESULTS_POLL_INTERVAL_SECONDS,
+):
+    """
+    Poll for a results.txt that another request is generating. Returns its content, or None if it didn't show up in
+    time.
+    """
+    deadline = time.monotonic() + timeout_seconds
+    while time.monotonic() < deadline:
+        time.sleep(poll_interval_seconds)
+        try:
+            return read_results_file(s3_client, bucket_name, key)
+        except ClientError:
+            continue
+    return None
+
+
+def generate_results_once(
+    prompt,
+    s3_client,
+    bucket_name,
+    key,
+    numbered_list_prompt_path,
+    numbered_list_prompt,
+    lease_key,
+):
+    """
+    Generate a school's results.txt, making sure only one request at a time calls the LLM for it.
+
+    The first request takes the school's lease and generates the results; any request that arrives while it's running
+    waits for that results.txt instead.
+    """
+    lease_store = get_lease_store(s3_client=s3_client, bucket_name=bucket_name)
+    try:
+        lease_token = lease_store.acquire(lease_key)
+    except Exception as ex:
+        # Better to risk a duplicate LLM call than to fail the request
+        logging.warning(f"Error while acquiring lease {lease_key}: {repr(ex)}")
+        lease_token = ""
+    if lease_token is None:
+        logging.info(f"Results for {lease_key} are already being generated; waiting")
+        file_content = wait_for_results_file(
+            s3_client=s3_client,
+            bucket_name=bucket_name,
+            key=key,
+        )
+        if file_content is None:
+            file_content = "Results are still being generated by another request. Check back in a minute."
+        return file_content
+    try:
+        return send_prompt_to_llm_and_save_to_s3(
+            prompt=prompt,
+            s3_client=s3_client,
+            bucket_name=bucket_name,
+            key=key,
+            numbered_list_prompt_path=numbered_list_prompt_path,
+            numbered_list_prompt=numbered_list_prompt,
+        )
+    finally:
+        if lease_token:
+            lease_store.release(lease_key, lease_token)
+
+
+def get_tournament_manifest(s3_client, bucket_name, tournament_id):
+    """
+    Returns the tournament's manifest (written by the generator when a run starts, and again when it completes or
+    fails) as a dict with "status", "updated_at" and "schools", among others. Returns None if there is no manifest --
+    the tournament was never generated, or was generated before manifests existed.
+    """
+    try:
+        manifest_body = s3_client.get_object(
+            Bucket=bucket_name,
+            Key=f"{tournament_id}/{MANIFEST_FILE_NAME}",
+        )["Body"].read()
+    except ClientError as ex:
+        if ex.response["Error"]["Code"] not in ["NoSuchKey", "404"]:
+            logging.warning(f"Error while reading manifest: {repr(ex)}")
+        return None
+    return json.loads(decode_s3_body(manifest_body))
+
+
+def get_legacy_tournament_status(s3_client, bucket_name, tournament_id):
+    """
+    For tournaments generated before manifests existed, build the same status dict as get_tournament_manifest by
+    listing the tournament's folders. Returns None if the tournament has no files at all.
+    """
+    # List the tournament's top-level files and folders rather than every object -- the page cache alone can hold
+    # thousands of keys, which would crowd the school folders out of a single listing
+    all_objects = s3_client.list_objects_v2(
+        Bucket=bucket_name,
+        Prefix=f"{tournament_id}/",
+        Delimiter="/",
+    )
+    if all_objects["KeyCount"] == 0:
+        return None
+    # Get a list of all the schools in the tournament so that the user knows what they can choose from
+    # This logic just says "find all the subkeys within this tournament's key"
+    # But make sure to exclude the `temp_results` and `page_cache` folders
+    school_set = set()
+    for folder in all_objects.get("CommonPrefixes", []):
+        folder_name = folder["Prefix"].split("/")[1]
+        if folder_name not in NON_SCHOOL_FOLDERS:
+            school_set.add(folder_name)
+    return {
+        "status": COMPLETE,
+        "updated_at": datetime.now(tz=timezone.utc).isoformat(),
+        "schools": sorted(school_set),
+    }
+
+
+def start_generation(s3_client, bucket_name, tournament_id, parsed_body):
+    """
+    Take the tournament's generation lease and asynchronously invoke the tabroom_summary Lambda to generate the LLM
+    prompts; the run adopts the lease. Returns False without invoking anything if another run holds the lease.
+    """
+    lease_store = get_lease_store(s3_client=s3_client, bucket_name=bucket_name)
+    lease_owner = lease_store.acquire(
+        f"{tournament_id}/{GENERATION_LEASE_FILE_NAME}",
+        ttl_seconds=GENERATION_LEASE_TTL_SECONDS,
+    )
+    if lease_owner is None:
+        logging.info(f"Tournament {tournament_id} is already being generated")
+        return False
+    # Replace any status left over from an earlier run until the new run publishes its own
+    s3_client.put_object(
+        Body=json.dumps(
+            {
+                "tournament_id": tournament_id,
+                "stage": "queued",
+                "updated_at": datetime.now(tz=timezone.utc).isoformat(),
+            }
+        ),
+        Bucket=bucket_name,
+        Key=f"{tournament_id}/{STATUS_FILE_NAME}",
+        ContentType="application/json",
+        CacheControl="no-cache",
+    )
+    lambda_client = boto3.client("lambda")
+    lambda_client.invoke(
+        FunctionName=os.environ["TABROOM_SUMMARY_LAMBDA_NAME"],
+        InvocationType="Event",
+        Payload=json.dumps({**parsed_body, "generation_lease_owner": lease_owner}),
+    )
+    return True
+
+
+def get_generation_status(s3_client, bucket_name, tournament_id):
+    """
+    Returns the progress document published by the tournament's generation run (stage, done/total, elapsed_seconds,
+    eta_seconds), or None if no run has published one.
+    """
+    try:
+        status_body = s3_client.get_object(
+            Bucket=bucket_name,
+            Key=f"{tournament_id}/{STATUS_FILE_NAME}",
+        )["Body"].read()
+    except ClientError as ex:
+        if ex.response["Error"]["Code"] not in ["NoSuchKey", "404"]:
+            logging.warning(f"Error while reading status: {repr(ex)}")
+        return None
+    return json.loads(decode_s3_body(status_body))
+
+
 def tournament_is_invalid(response_content):
     return False  # Assume function is NOT invalid
     # TODO - Add validation function
@@ -155,6 +519,23 @@ def lambda_handler(event, context):
     parsed_body = json.loads(event["body"])
     parsed_body["read_only"] = os.getenv("READ_ONLY", True)
     tournament_id = parsed_body["tournament"]
+    bucket_name = os.getenv("DATA_BUCKET_NAME", "tabroom-summaries-data-bucket")
+    # The front end polls this while a tournament is generating -- answer it with a single read
+    if parsed_body.get("status_only"):
+        return {
+            "isBase64Encoded": False,
+            "statusCode": 200,
+            "headers": cors_headers,
+            "body": json.dumps(
+                {
+                    "status": get_generation_status(
+                        s3_client=s3_client,
+                        bucket_name=bucket_name,
+                        tournament_id=tournament_id,
+                    ),
+                }
+            ),
+        }
     school_name = str(parsed_body["school"]).strip()
     file_path_to_find_or_create = f"{tournament_id}/{school_name}/results.txt"
     raw_gpt_submission = f"{tournament_id}/{school_name}/gpt_prompt.txt"
@@ -162,51 +543,46 @@ def lambda_handler(event, context):
     numbered_list_prompt_path = (
         f"{tournament_id}/{school_name}/numbered_list_prompt.txt"
     )
-    bucket_name = os.getenv("DATA_BUCKET_NAME", "tabroom-summaries-data-bucket")
     numbered_list_prompt_content = None
 
     # Check if the requested results already exist -- return them if they do
     if len(school_name) > 0:  # explicitly skip empty names -- they are trouble.
         try:
-            gpt_content = (
+            gpt_content = decode_s3_body(
                 s3_client.get_object(
                     Bucket=bucket_name,
                     Key=raw_gpt_submission,
-                )["Body"]
-                .read()
-                .decode("utf-8")
-            )
+                )["Body"].read()
+            ).decode("utf-8")
         except Exception:
             gpt_content = None
         try:
-            numbered_list_prompt_content = (
+            numbered_list_prompt_content = decode_s3_body(
                 s3_client.get_object(
                     Bucket=bucket_name,
                     Key=numbered_list_prompt_path,
-                )["Body"]
-                .read()
-                .decode("utf-8")
-            )
+                )["Body"].read()
+            ).decode("utf-8")
         except Exception:
             numbered_list_prompt_content = None
         if gpt_content is not None:
             try:
-                file_content = (
-                    s3_client.get_object(
-                        Bucket=bucket_name,
-                        Key=file_path_to_find_or_create,
-                    )["Body"]
-                    .read()
-                    .decode(encoding="utf-8", errors="replace")
-                ).replace("\ufffd", "--")
+                file_content = read_results_file(
+                    s3_client=s3_client,
+                    bucket_name=bucket_name,
+                    key=file_path_to_find_or_create,
+                )
             except Exception as ex:
                 try:
-                    file_content = send_prompt_to_llm_and_save_to_s3(
+                    file_content = generate_results_once(
                         prompt=gpt_content,
                         s3_client=s3_client,
                         bucket_name=bucket_name,
                         key=file_path_to_find_or_create,
                         numbered_list_prompt_path=numbered_list_prompt_path,
+                        # Already fetched above -- don't read it from S3 a second time
+                        numbered_list_prompt=numbered_list_prompt_content,
+                        lease_key=f"{tournament_id}/{school_name}/{RESULTS_LEASE_FILE_NAME}",
                     )
                 except Exception as ex:
                     logging.error(repr(ex))
@@ -251,35 +627,23 @@ def lambda_handler(event, context):
     # except Exception as ex:
     #     print(f"Exception when reading api_response.json: {repr(ex)}")
     #     pass
-    # Check if there are any files in the path bucket_name/tournament_id
-    all_objects = s3_client.list_objects_v2(
-        Bucket=bucket_name,
-        Prefix=tournament_id,
+    # Find out which schools have results, and whether the last run failed, from the tournament's manifest -- or by
+    # listing the tournament's folders if it was generated before manifests existed. Whether a run is in progress is
+    # up to the generation lease (see start_generation).
+    tournament_status = get_tournament_manifest(
+        s3_client=s3_client,
+        bucket_name=bucket_name,
+        tournament_id=tournament_id,
     )
+    if tournament_status is None:
+        tournament_status = get_legacy_tournament_status(
+            s3_client=s3_client,
+            bucket_name=bucket_name,
+            tournament_id=tournament_id,
+        )
     # If there are no files at all, then skip this section and kick off a results generation
-    if all_objects["KeyCount"] > 0:
-        # See if a placeholder file exists -- used to prevent duplicate runs
-        # placeholder.txt is a good proxy of whether a Lambda is [currently running or failed ungracefully] OR [never ran or completed successfully]
-        try:
-            placeholder_attributes = s3_client.get_object_attributes(
-                Bucket=bucket_name,
-                Key=f"{tournament_id}/placeholder.txt",
-                ObjectAttributes=["ObjectSize"],
-            )
-        except Exception as ex:
-            logging.warning(f"Error while looking up placeholder: {repr(ex)}")
-            placeholder_attributes = None
-
-        # Get a list of all the schools in the tournament so that the user knows what they can choose from
-        # This logic just says "find all the subkeys within this tournament's key"
-        # But make sure to exclude the `temp_results` folder
-        school_set = set()
-        for obj in all_objects["Contents"]:
-            # Don't include files in the root of the tournament
-            if len(obj["Key"].split("/")) > 2 and not re.search(
-                r"temp_results", obj["Key"]
-            ):
-                school_set.add(obj["Key"].split("/")[1])
+    if tournament_status is not None:
+        school_set = set(tournament_status.get("schools", []))
 
         # Get data to display the school list if there are schools present
         logging.warning(f"school_set is {school_set}")
@@ -287,27 +651,25 @@ def lambda_handler(event, context):
             school_data = "\n\n".join(sorted(list(school_set)))
         # Otherwise, display a message indicating the status
         else:
-            # Placeholder is present but no school results ready -- have the user wait for results
-            print(f"This is the placeholder_attributes: {placeholder_attributes}")
-            if placeholder_attributes is not None and (
-                (placeholder_attributes["LastModified"] + timedelta(hours=1))
-                > datetime.now(tz=timezone.utc)
+            print(f"This is the tournament status: {tournament_status}")
+            failed_recently = tournament_status["status"] == FAILED and (
+                datetime.fromisoformat(tournament_status["updated_at"])
+                + FAILED_GENERATION_RETRY_DELAY
+            ) > datetime.now(tz=timezone.utc)
+            # Don't retry a failed run straight away -- it will most likely fail the same way
+            if failed_recently:
+                school_data = "The last attempt to generate results for this tournament failed; it will be retried if you check back in about an hour.\nConsider opening a GitHub issue at https://github.com/benjmor/tabroom_auto_summarize/issues if this message persists."
+            # no school results are present AND no run holds the generation lease -- data should be regenerated.
+            elif start_generation(
+                s3_client=s3_client,
+                bucket_name=bucket_name,
+                tournament_id=tournament_id,
+                parsed_body=parsed_body,
             ):
-                school_data = "Still generating results! Check back soon!\nConsider opening a GitHub issue at https://github.com/benjmor/tabroom_auto_summarize/issues if this message persists."
-            # no school results are present AND (the placeholder file is missing or outdated) -- data should be regenerated.
-            else:
                 school_data = "No schools found; will attempt to regenerate. Check back in about an hour."
-                s3_client.put_object(
-                    Body="Placeholder during generation.",
-                    Bucket=bucket_name,
-                    Key=f"{tournament_id}/placeholder.txt",
-                )
-                lambda_client = boto3.client("lambda")
-                lambda_client.invoke(
-                    FunctionName=os.environ["TABROOM_SUMMARY_LAMBDA_NAME"],
-                    InvocationType="Event",
-                    Payload=json.dumps(parsed_body),
-                )
+            # A run holds the lease but no school results are ready -- have the user wait for results
+            else:
+                school_data = STILL_GENERATING_MESSAGE
             return {
                 "isBase64Encoded": False,
                 "statusCode": 200,
@@ -317,6 +679,8 @@ def lambda_handler(event, context):
                         "file_content": school_data,
                         "gpt_content": "N/A",
                         "numbered_list_prompt_content": "N/A",
+                        # Tells the front end to poll for progress
+                        "generation_in_progress": not failed_recently,
                     }
                 ),
             }
@@ -355,28 +719,29 @@ def lambda_handler(event, context):
     #             }
     #         ),
     #     }
-    # Put a placeholder file in the S3 bucket and then trigger the Lambda to generate the LLM prompts and results
-    s3_client.put_object(
-        Body="Placeholder during generation.",
-        Bucket=bucket_name,
-        Key=f"{tournament_id}/placeholder.txt",
-    )
-    lambda_client = boto3.client("lambda")
-    lambda_client.invoke(
-        FunctionName=os.environ["TABROOM_SUMMARY_LAMBDA_NAME"],
-        InvocationType="Event",
-        Payload=json.dumps(parsed_body),
-    )
+    # Trigger the Lambda to generate the LLM prompts and results, unless a concurrent request just did
+    if start_generation(
+        s3_client=s3_client,
+        bucket_name=bucket_name,
+        tournament_id=tournament_id,
+        parsed_body=parsed_body,
+    ):
+        generation_message = (
+            "Results not yet generated, will attempt to generate them. Check back in about 15 minutes."
+            + "\n\nNote: Huge tournaments (eg. Harvard) are not supported through this web interface. Create an Issue [here](https://github.com/benjmor/tabroom_auto_summarize/issues) if you want results from a specific large tournament."
+        )
+    else:
+        generation_message = STILL_GENERATING_MESSAGE
     return {
         "isBase64Encoded": False,
         "statusCode": 200,
         "headers": cors_headers,
         "body": json.dumps(
             {
-                "file_content": "Results not yet generated, will attempt to generate them. Check back in about 15 minutes."
-                + "\n\nNote: Huge tournaments (eg. Harvard) are not supported through this web interface. Create an Issue [here](https://github.com/benjmor/tabroom_auto_summarize/issues) if you want results from a specific large tournament.",
+                "file_content": generation_message,
                 "gpt_content": "N/A",
                 "numbered_list_prompt_content": numbered_list_prompt_content,
+                "generation_in_progress": True,
             }
         ),
     }
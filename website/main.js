@@ -1,4 +1,96 @@
+const API_URL = 'https://4wvm0o3xmb.execute-api.us-east-1.amazonaws.com/prod/submit_tournament';
+// While a tournament is generating, poll its status document -- often at first, then backing off
+const FIRST_POLL_DELAY_MS = 5000;
+const MAX_POLL_DELAY_MS = 60000;
+const POLL_BACKOFF = 1.5;
+const MAX_POLL_DURATION_MS = 30 * 60 * 1000;
+const STAGE_LABELS = {
+    queued: "Waiting for generation to start",
+    downloading: "Downloading results from Tabroom",
+    scraping: "Reading results pages",
+    parsing: "Parsing results",
+    writing_prompts: "Writing up each school's results",
+};
+let pollTimer = null;
+
+function formatSeconds(seconds) {
+    if (seconds < 60) {
+        return "less than a minute";
+    }
+    const minutes = Math.round(seconds / 60);
+    return minutes + (minutes == 1 ? " minute" : " minutes");
+}
+
+function renderProgress(status) {
+    const container = document.getElementById('progressContainer');
+    if (!status || !status['stage']) {
+        container.innerHTML = "<p>Waiting for generation to start...</p>";
+        return;
+    }
+    const label = STAGE_LABELS[status['stage']] || status['stage'];
+    let html = "<p>" + label + "...</p>";
+    if (status['total']) {
+        html += '<progress max="' + status['total'] + '" value="' + status['done'] + '"></progress> ' +
+                status['done'] + " of " + status['total'] + " " + status['unit'];
+    } else {
+        // No total yet, so show an indeterminate bar
+        html += "<progress></progress>";
+    }
+    let timing = "Running for " + formatSeconds(status['elapsed_seconds'] || 0);
+    if (status['eta_seconds'] != null) {
+        timing += ", about " + formatSeconds(status['eta_seconds']) + " left in this step";
+    }
+    container.innerHTML = html + "<p>" + timing + ".</p>";
+}
+
+function pollStatus(tournamentNumber, delayMs, startedAt, sawProgress) {
+    pollTimer = setTimeout(() => {
+        fetch(API_URL, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({tournament: tournamentNumber, status_only: true}),
+        })
+        .then(response => response.json())
+        .then(data => {
+            const status = data['status'];
+            const stage = status ? status['stage'] : null;
+            // A complete/failed status seen before any progress is left over from an earlier run
+            if (sawProgress && stage == 'complete') {
+                document.getElementById('progressContainer').innerHTML = "";
+                submitForm();
+                return;
+            }
+            if (sawProgress && stage == 'failed') {
+                document.getElementById('progressContainer').innerText = 'Generating results failed. Please try again later.';
+                return;
+            }
+            if (stage != 'complete' && stage != 'failed') {
+                renderProgress(status);
+                sawProgress = sawProgress || stage != null;
+            }
+            scheduleNextPoll(tournamentNumber, delayMs, startedAt, sawProgress);
+        })
+        .catch(error => {
+            console.error('Error:', error);
+            scheduleNextPoll(tournamentNumber, delayMs, startedAt, sawProgress);
+        });
+    }, delayMs);
+}
+
+function scheduleNextPoll(tournamentNumber, delayMs, startedAt, sawProgress) {
+    if (Date.now() - startedAt > MAX_POLL_DURATION_MS) {
+        document.getElementById('progressContainer').innerText = 'Results are still generating. Please check back later.';
+        return;
+    }
+    pollStatus(tournamentNumber, Math.min(delayMs * POLL_BACKOFF, MAX_POLL_DELAY_MS), startedAt, sawProgress);
+}
+
 function submitForm() {
+    // Stop polling for any earlier request
+    clearTimeout(pollTimer);
+    document.getElementById('progressContainer').innerHTML = "";
     // Update to Loading...
     document.getElementById('responseContainer').innerText = "\nLoading...this may take up to 25 seconds for new summary requests...to keep you engaged, here is a joke:\nHow do you catch de fish? With de-bate!"
     // Get form data
@@ -32,7 +124,7 @@ function submitForm() {
     };
     
     // Perform a POST request to the API Gateway endpoint to send the request
-    fetch('https://4wvm0o3xmb.execute-api.us-east-1.amazonaws.com/prod/submit_tournament', {
+    fetch(API_URL, {
         method: 'POST',
         headers: {
             'Content-Type': 'application/json',
@@ -49,6 +141,10 @@ function submitForm() {
                      "\n## Prompt passed to Claude:\n" + gpt_content + "\n" + 
                      "\n## Line-by-Line prompt passed to Claude:\n" + numbered_list_prompt_content + "</md-block>";
         document.getElementById('responseContainer').innerHTML = display_md;
+        if (data['generation_in_progress']) {
+            renderProgress(null);
+            pollStatus(tournamentNumber, FIRST_POLL_DELAY_MS, Date.now(), false);
+        }
     })
     .catch(error => {
         console.error('Error:', error);